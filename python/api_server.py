@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Small read-only HTTP API over the exported player data.
+Serves lookups from in-memory indexes so clients don't need the whole
+dataset. The data comes from an export file (default src/data/data.json)
+or straight from the database (Postgres or a SQLite file, see storage.py),
+and is reloaded in the background when a new export appears.
+
+Endpoints (all GET, JSON):
+  /status
+  /players/<id>                     id is 'entry_N' or N
+  /players/search?q=<text>&limit=10
+  /events/<event_code or id>
+  /leaderboards/<stat>?limit=10&player=<id>&<filters>
+      filters: minEvents, minDay2s, maxEvents, minTop8s, hasTop8,
+               SosPlayersOnly, formats (comma separated), startDate, endDate
+
+Usage:
+  python api_server.py [--file PATH | --db DSN] [--port 8000] [--reload-interval SECONDS]
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlparse, parse_qs, unquote
+
+from search_index import build_search_index, search
+from event_index import build_event_index, event_details
+from storage import open_storage
+from rankings import (
+    players_from_export, apply_filters, sort_players, competition_ranks,
+    is_rankable_stat, parse_filters, filters_key, stat_value,
+)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_EXPORT = os.path.join(SCRIPT_DIR, '..', 'src', 'data', 'data.json')
+
+# Distinct filter/stat combinations kept per data generation
+LEADERBOARD_CACHE_SIZE = 1024
+
+MAX_LIMIT = 100
+
+
+class DataStore:
+    """
+    One loaded generation of the export with its lookup indexes.
+    Immutable once built; a reload builds a new store and swaps it in.
+    """
+
+    def __init__(self, export: Dict, generation: str):
+        self.generation = generation
+        self.loaded_at = time.time()
+        self.players = players_from_export(export)
+        self.players_by_id = {p['id']: p for p in self.players}
+        self.events = export.get('events') or {}
+
+        self.search_index = build_search_index(export)
+
+        # Results per event code (lowercase); event ids resolve to their code
+        self.event_index = build_event_index(export)
+        self.event_codes = {
+            str(event['id']): str(event.get('name', '')).lower()
+            for event in self.events.values()
+            if str(event.get('name', '')).lower() in self.event_index['events']
+        }
+
+        self._filtered = lru_cache(maxsize=LEADERBOARD_CACHE_SIZE)(self._filtered_pool)
+        self._ranking = lru_cache(maxsize=LEADERBOARD_CACHE_SIZE)(self._ranked_pool)
+        self.event_json = lru_cache(maxsize=LEADERBOARD_CACHE_SIZE)(self._event_json)
+
+    def _filtered_pool(self, key: tuple) -> List[Dict]:
+        filters = {name: list(value) if isinstance(value, tuple) else value for name, value in key}
+        return apply_filters(self.players, filters)
+
+    def _ranked_pool(self, key: tuple, stat_key: str):
+        """Sorted pool, its ranks, and a player id -> rank map for one filter/stat combination."""
+        ranked = sort_players(self._filtered(key), stat_key)
+        ranks = competition_ranks([stat_value(p, stat_key) for p in ranked])
+        rank_by_id = {p['id']: rank for p, rank in zip(ranked, ranks)}
+        return ranked, ranks, rank_by_id
+
+    def get_player(self, player_id: str) -> Optional[Dict]:
+        if not player_id.startswith('entry_'):
+            player_id = f'entry_{player_id}'
+        return self.players_by_id.get(player_id)
+
+    def search(self, query: str, limit: int) -> List[Dict]:
+        """Autocomplete with the same matching and ranking as search_index.search."""
+        return search(self.search_index, query, limit)
+
+    def event(self, event_code: str) -> Optional[Dict]:
+        """Same shape and rules as getEventResults: only rows with a finish."""
+        event_code = event_code.lower()
+        return event_details(self.event_index, self.event_codes.get(event_code, event_code))
+
+    def _event_json(self, event_code: str) -> Optional[bytes]:
+        """Serialized event response; events never change within a generation."""
+        event = self.event(event_code)
+        return json.dumps(event).encode('utf-8') if event else None
+
+    def leaderboard(self, stat_key: str, filters: Dict, limit: int, player_id: Optional[str] = None) -> Dict:
+        """
+        Top `limit` players for a stat within the filtered pool, like Top10Panel.
+        The selected player's rank matches calculatePlayerRank.
+        """
+        ranked, ranks, rank_by_id = self._ranking(filters_key(filters), stat_key)
+        body = {
+            'stat': stat_key,
+            'filters': filters,
+            'totalPlayers': len(ranked),
+            'entries': [
+                {'rank': rank, 'player_id': p['id'], 'player_full_name': p['fullName'],
+                 'stat_value': stat_value(p, stat_key)}
+                for rank, p in zip(ranks[:limit], ranked[:limit])
+            ],
+        }
+        if player_id:
+            player = self.get_player(player_id)
+            if player and player['id'] in rank_by_id:
+                body['player'] = {'rank': rank_by_id[player['id']], 'totalPlayers': len(ranked)}
+        return body
+
+
+def load_export_file(path: str) -> Dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_export_db(db_conn: str) -> Dict:
+    storage = open_storage(db_conn)
+    try:
+        storage.begin_snapshot()
+        return storage.fetch_export(storage.cursor())
+    finally:
+        storage.close()
+
+
+def file_generation(path: str) -> str:
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+class Reloader(threading.Thread):
+    """Swaps in a new DataStore when the export file changes (or on an interval for --db)."""
+
+    def __init__(self, server, source: Dict, interval: float):
+        super().__init__(daemon=True)
+        self.server = server
+        self.source = source
+        self.interval = interval
+
+    def run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                if 'file' in self.source:
+                    generation = file_generation(self.source['file'])
+                    if generation == self.server.store.generation:
+                        continue
+                    store = DataStore(load_export_file(self.source['file']), generation)
+                else:
+                    store = DataStore(load_export_db(self.source['db']), time.strftime('%Y%m%d%H%M%S'))
+                self.server.store = store
+                print(f"Reloaded data (generation {store.generation}, {len(store.players)} players)", file=sys.stderr)
+            except Exception as e:
+                # Keep serving the previous generation
+                print(f"Reload failed: {e}", file=sys.stderr)
+
+
+class ApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections under concurrent load
+    request_queue_size = 128
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = 'PlayerStatsAPI/1.0'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_json(self, status: int, body) -> None:
+        self.send_payload(status, json.dumps(body).encode('utf-8'))
+
+    def send_payload(self, status: int, payload: bytes) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        store = self.server.store
+        url = urlparse(self.path)
+        parts = [unquote(p) for p in url.path.strip('/').split('/') if p]
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        try:
+            limit = min(int(params.get('limit', 10)), MAX_LIMIT)
+        except ValueError:
+            return self.send_json(400, {'error': 'limit must be a number'})
+
+        if parts == ['status']:
+            return self.send_json(200, {
+                'generation': store.generation,
+                'loaded_at': store.loaded_at,
+                'players': len(store.players),
+                'events': len(store.events),
+            })
+
+        if parts == ['players', 'search']:
+            return self.send_json(200, {'results': store.search(params.get('q', ''), limit)})
+
+        if len(parts) == 2 and parts[0] == 'players':
+            player = store.get_player(parts[1])
+            if not player:
+                return self.send_json(404, {'error': f"Player '{parts[1]}' not found"})
+            return self.send_json(200, {'id': player['id'], **player['data']})
+
+        if len(parts) == 2 and parts[0] == 'events':
+            payload = store.event_json(parts[1].lower())
+            if not payload:
+                return self.send_json(404, {'error': f"Event '{parts[1]}' not found"})
+            return self.send_payload(200, payload)
+
+        if len(parts) == 2 and parts[0] == 'leaderboards':
+            if not is_rankable_stat(parts[1]):
+                return self.send_json(404, {'error': f"'{parts[1]}' is not a rankable stat"})
+            try:
+                filters = parse_filters(params)
+            except ValueError as e:
+                return self.send_json(400, {'error': f"Bad filter: {e}"})
+            return self.send_json(200, store.leaderboard(parts[1], filters, limit, params.get('player')))
+
+        return self.send_json(404, {'error': 'Not found'})
+
+
+def main():
+    source = {'file': os.path.abspath(DEFAULT_EXPORT)}
+    port = 8000
+    reload_interval = None
+
+    if '--file' in sys.argv:
+        file_idx = sys.argv.index('--file')
+        if file_idx + 1 < len(sys.argv):
+            source = {'file': sys.argv[file_idx + 1]}
+    if '--db' in sys.argv:
+        db_idx = sys.argv.index('--db')
+        if db_idx + 1 < len(sys.argv):
+            source = {'db': sys.argv[db_idx + 1]}
+    if '--port' in sys.argv:
+        port_idx = sys.argv.index('--port')
+        if port_idx + 1 < len(sys.argv):
+            port = int(sys.argv[port_idx + 1])
+    if '--reload-interval' in sys.argv:
+        interval_idx = sys.argv.index('--reload-interval')
+        if interval_idx + 1 < len(sys.argv):
+            reload_interval = float(sys.argv[interval_idx + 1])
+    if reload_interval is None:
+        # Checking a file's mtime is cheap; re-running the export query is not
+        reload_interval = 2.0 if 'file' in source else 300.0
+
+    try:
+        if 'file' in source:
+            print(f"Loading {source['file']}", file=sys.stderr)
+            store = DataStore(load_export_file(source['file']), file_generation(source['file']))
+        else:
+            print("Loading from database", file=sys.stderr)
+            store = DataStore(load_export_db(source['db']), time.strftime('%Y%m%d%H%M%S'))
+    except Exception as e:
+        print(f"Error loading data: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    server = ApiServer(('127.0.0.1', port), ApiHandler)
+    server.store = store
+    server.verbose = '--verbose' in sys.argv
+    Reloader(server, source, reload_interval).start()
+
+    print(f"Loaded {len(store.players)} players, {len(store.events)} events", file=sys.stderr)
+    print(f"Listening on http://127.0.0.1:{port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Point-in-time ("as of event X") stats from cumulative prefix sums.
+
+Every player's events are laid out back to back in export order (the
+export numbers them by date), and each summed column gets one global
+cumulative sum. A player's totals after their first k events are then
+prefix[start + k] - prefix[start], so any snapshot or career series is
+O(1) per player, and a snapshot of every player at a cutoff date is a
+few array operations.
+
+Derived stats follow export_builder.player_stats (the SQL aggregation):
+per-round totals only count when all three days are set, percentages are
+rounded half away from zero. --verify rebuilds the stats at every event
+date from the filtered result rows and compares.
+
+Usage:
+  python career_stats.py [export.json] --player ID [--as-of EVENT_OR_DATE] [--through]
+  python career_stats.py [export.json] --leaderboard STAT --as-of EVENT_OR_DATE [--through] [--limit 10]
+  python career_stats.py [export.json] --verify
+
+  STAT is any numeric stat in the export except rating, which has no
+  as-of value.
+
+  --as-of takes an event code, an event id or a YYYY-MM-DD date; stats
+  are as of just before it, or including it with --through.
+"""
+
+import json
+import os
+import sys
+import time
+import numpy as np
+from typing import Dict, List, Optional
+
+from export_builder import RESULT_FIELDS, SUMMED, player_stats
+from rankings import rank_column
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_EXPORT = os.path.join(SCRIPT_DIR, '..', 'src', 'data', 'data.json')
+
+# Export event field -> results column (the export renames overall_record to record)
+EXPORT_TO_COLUMN = {name: column for column, name in RESULT_FIELDS}
+
+# Per-event columns with a prefix sum: every summed column, the three flags,
+# and the per-event overall totals
+PREFIX_COLUMNS = sorted({column for _, column in SUMMED}) + [
+    'day2', 'top8', 'in_contention', 'overall_wins', 'overall_losses', 'overall_draws',
+]
+
+# Sorts after any date, so events without one never fall before a cutoff
+NO_DATE = '~'
+
+
+def _pct(part: np.ndarray, total: np.ndarray) -> np.ndarray:
+    """ROUND(part / total * 100, 1) in exact integer arithmetic (half away from zero), 0 when total is 0."""
+    safe = np.where(total == 0, 1, total)
+    tenths = (2000 * part + safe) // (2 * safe)
+    return np.where(total == 0, 0, tenths) / 10
+
+
+def _stat(columns: Dict[str, np.ndarray], stat_key: str) -> np.ndarray:
+    """One stat column; ValueError for stats that have no as-of value."""
+    if stat_key == 'rating':
+        # Ratings come from ratings.py, not from the result rows summed here
+        raise ValueError("'rating' has no as-of value (current ratings: python ratings.py top)")
+    if stat_key not in columns:
+        raise ValueError(f"Unknown stat '{stat_key}' (one of: {', '.join(sorted(columns))})")
+    return columns[stat_key]
+
+
+class CareerStats:
+    """Prefix sums over every player's events for one export."""
+
+    def __init__(self, export: Dict):
+        event_dates = {
+            event['id']: event.get('date')
+            for event in (export.get('events') or {}).values()
+        }
+
+        self.player_ids = []
+        self.event_rows = []
+        starts = [0]
+        columns = {column: [] for column in PREFIX_COLUMNS}
+        dates = []
+
+        for key, data in (export.get('players') or {}).items():
+            self.player_ids.append(key)
+            # entry_N is the event's position in the player's career
+            events = sorted(data['events'].items(), key=lambda item: int(item[0].split('_', 1)[1]))
+            for _, event in events:
+                row = {EXPORT_TO_COLUMN.get(name, name): value for name, value in event.items()}
+                self.event_rows.append(row)
+                dates.append(event.get('date') or event_dates.get(event.get('event_id')) or NO_DATE)
+                for _, column in SUMMED:
+                    columns[column].append(row.get(column) or 0)
+                for flag in ('day2', 'top8', 'in_contention'):
+                    columns[flag].append(row.get(flag) is True)
+                for outcome in ('wins', 'losses', 'draws'):
+                    parts = [row.get(f'day{day}_{outcome}') for day in (1, 2, 3)]
+                    columns[f'overall_{outcome}'].append(0 if None in parts else sum(parts))
+            starts.append(len(dates))
+
+        self.index = {key: i for i, key in enumerate(self.player_ids)}
+        self.starts = np.array(starts, dtype=np.int64)
+        self.dates = np.array(dates, dtype=str) if dates else np.array([], dtype='<U10')
+        self.owner = np.repeat(np.arange(len(self.player_ids)), np.diff(self.starts))
+        self.prefix = {
+            column: np.concatenate([[0], np.cumsum(np.array(values, dtype=np.int64))])
+            for column, values in columns.items()
+        }
+
+    def counts_as_of(self, cutoff: str, through: bool = False) -> np.ndarray:
+        """Events per player dated before the cutoff date (or on it, with through)."""
+        included = self.dates <= cutoff if through else self.dates < cutoff
+        return np.bincount(self.owner[included], minlength=len(self.player_ids))
+
+    def totals(self, counts: np.ndarray, players: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Prefix column totals after each player's first counts[i] events."""
+        starts = self.starts[:-1] if players is None else self.starts[players]
+        return {column: prefix[starts + counts] - prefix[starts] for column, prefix in self.prefix.items()}
+
+    def stat_columns(self, counts: np.ndarray, players: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """The export's numeric stats for every player (or the given player indexes) after counts events."""
+        t = self.totals(counts, players)
+        overall = t['overall_wins'] + t['overall_losses'] + t['overall_draws']
+        limited = t['limited_wins'] + t['limited_losses'] + t['limited_draws']
+        constructed = t['constructed_wins'] + t['constructed_losses'] + t['constructed_draws']
+        columns = {
+            'events': np.asarray(counts),
+            'day2s': t['day2'],
+            'in_contentions': t['in_contention'],
+            'top8s': t['top8'],
+            'overall_wins': t['overall_wins'],
+            'overall_losses': t['overall_losses'],
+            'overall_draws': t['overall_draws'],
+            'overall_win_pct': _pct(t['overall_wins'], overall),
+            'limited_win_pct': _pct(t['limited_wins'], limited),
+            'constructed_win_pct': _pct(t['constructed_wins'], constructed),
+            'drafts': t['num_drafts'],
+            'winning_drafts': t['positive_drafts'],
+            'losing_drafts': t['negative_drafts'],
+            'winning_drafts_pct': _pct(t['positive_drafts'], t['positive_drafts'] + t['negative_drafts']),
+            'trophy_drafts': t['trophy_drafts'],
+            '5streaks': t['streak5'],
+        }
+        for name in ('limited', 'constructed'):
+            for outcome in ('wins', 'losses', 'draws'):
+                columns[f'{name}_{outcome}'] = t[f'{name}_{outcome}']
+        for day in (1, 2, 3):
+            for outcome in ('wins', 'losses', 'draws'):
+                columns[f'day{day}_{outcome}'] = t[f'day{day}_{outcome}']
+            columns[f'day{day}_win_pct'] = _pct(
+                t[f'day{day}_wins'], t[f'day{day}_wins'] + t[f'day{day}_losses'] + t[f'day{day}_draws'])
+        return columns
+
+    def player_stats(self, player_id: str, events: int) -> Dict:
+        """One player's stats object (export shape) after their first `events` events."""
+        i = self.index[player_id]
+        columns = self.stat_columns(np.array([events]), np.array([i]))
+        stats = {key: {'value': values[0].item()} for key, values in columns.items()}
+        for name, prefix in (('overall', 'overall'), ('limited', 'limited'), ('constructed', 'constructed'),
+                             ('top8', 'day3')):
+            stats[f'{name}_record'] = {'value': '-'.join(
+                str(stats[f'{prefix}_{outcome}']['value']) for outcome in ('wins', 'losses', 'draws'))}
+        return stats
+
+    def trajectory(self, player_id: str, stat_key: str) -> List:
+        """The stat after each of the player's events, in career order."""
+        i = self.index[player_id]
+        count = int(self.starts[i + 1] - self.starts[i])
+        players = np.full(count, i)
+        return _stat(self.stat_columns(np.arange(1, count + 1), players), stat_key).tolist()
+
+    def leaderboard(self, stat_key: str, cutoff: str, through: bool = False, limit: int = 10) -> Dict:
+        """Ranking of every player with at least one event before the cutoff, like rankingUtils."""
+        counts = self.counts_as_of(cutoff, through)
+        values = _stat(self.stat_columns(counts), stat_key).astype(np.float64)
+        order, ranks = rank_column(values, counts > 0)
+        return {
+            'totalPlayers': int(len(order)),
+            'entries': [
+                {'rank': int(rank), 'player_id': self.player_ids[i], 'stat_value': values[i].item()}
+                for i, rank in zip(order[:limit], ranks[:limit])
+            ],
+        }
+
+
+def resolve_cutoff(export: Dict, value: str) -> str:
+    """An event code, event id or YYYY-MM-DD date as a cutoff date."""
+    for event in (export.get('events') or {}).values():
+        if str(event['id']) == value or str(event.get('name', '')).lower() == value.lower():
+            if not event.get('date'):
+                raise ValueError(f"Event '{value}' has no date")
+            return event['date']
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        return value
+    raise ValueError(f"'{value}' is not an event code, event id or YYYY-MM-DD date")
+
+
+def verify(export: Dict, career: CareerStats) -> List[str]:
+    """
+    Compare the prefix-sum stats at every event date (before and through)
+    with player_stats over the result rows the date cutoff keeps.
+    """
+    problems = []
+    cutoffs = sorted({d for d in career.dates.tolist() if d != NO_DATE})
+    for cutoff in cutoffs:
+        for through in (False, True):
+            counts = career.counts_as_of(cutoff, through)
+            for i, player_id in enumerate(career.player_ids):
+                start, end = career.starts[i], career.starts[i + 1]
+                rows = [
+                    row for row, date in zip(career.event_rows[start:end], career.dates[start:end])
+                    if date != NO_DATE and (date <= cutoff if through else date < cutoff)
+                ]
+                expected = player_stats(rows)
+                got = career.player_stats(player_id, int(counts[i]))
+                if got != expected:
+                    diff = sorted(k for k in expected if expected[k] != got.get(k))
+                    problems.append(f"{player_id} {'through' if through else 'before'} {cutoff}: {diff}")
+                    if len(problems) >= 20:
+                        return problems
+    return problems
+
+
+def main():
+    export_path = DEFAULT_EXPORT
+    options = {}
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    for flag in ('--player', '--as-of', '--leaderboard', '--limit'):
+        if flag in sys.argv:
+            flag_idx = sys.argv.index(flag)
+            if flag_idx + 1 < len(sys.argv):
+                options[flag] = sys.argv[flag_idx + 1]
+                if options[flag] in args:
+                    args.remove(options[flag])
+    if args:
+        export_path = args[0]
+    through = '--through' in sys.argv
+
+    with open(export_path, 'r', encoding='utf-8') as f:
+        export = json.load(f)
+
+    start = time.perf_counter()
+    career = CareerStats(export)
+    print(f"Built prefix sums for {len(career.player_ids)} players, {len(career.dates)} results "
+          f"in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+    try:
+        cutoff = resolve_cutoff(export, options['--as-of']) if '--as-of' in options else None
+    except ValueError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if '--verify' in sys.argv:
+        start = time.perf_counter()
+        problems = verify(export, career)
+        elapsed = time.perf_counter() - start
+        if problems:
+            for problem in problems:
+                print(f"✗ {problem}", file=sys.stderr)
+            print(f"\n✗ As-of stats differ from the aggregation ({elapsed:.2f}s)", file=sys.stderr)
+            sys.exit(1)
+        print(f"✓ As-of stats match the aggregation at every event date ({elapsed:.2f}s)", file=sys.stderr)
+
+    elif '--player' in options:
+        player_id = options['--player']
+        if not player_id.startswith('entry_'):
+            player_id = f'entry_{player_id}'
+        if player_id not in career.index:
+            print(f"✗ Player '{player_id}' not found", file=sys.stderr)
+            sys.exit(1)
+        i = career.index[player_id]
+        if cutoff:
+            events = int(career.counts_as_of(cutoff, through)[i])
+        else:
+            events = int(career.starts[i + 1] - career.starts[i])
+        print(json.dumps({'player_id': player_id, 'as_of': cutoff, 'through': through,
+                          'stats': career.player_stats(player_id, events)}, indent=2))
+
+    elif '--leaderboard' in options:
+        if not cutoff:
+            print("✗ --leaderboard needs --as-of", file=sys.stderr)
+            sys.exit(1)
+        limit = int(options.get('--limit', 10))
+        try:
+            board = career.leaderboard(options['--leaderboard'], cutoff, through, limit)
+        except ValueError as e:
+            print(f"✗ {e}", file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps({'stat': options['--leaderboard'], 'as_of': cutoff, 'through': through, **board}, indent=2))
+
+    else:
+        print(__doc__.split('Usage:')[1].strip('\n'))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
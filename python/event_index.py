@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Per-event index of results, the inverse of the export's player -> events
+nesting.
+
+Each event maps to its result rows ordered by finish, with the columns of
+EventResult in eventUtils.ts stored once in COLUMNS instead of repeated on
+every row. Rows follow getEventResults: only results with a finish, deck
+defaulting to 'Unknown Deck', ties kept in export order. Keys are lowercase
+event codes, as the event page looks them up case-insensitively.
+
+The index can be written as one file (event_results.json) or sharded into
+one file per event under events/ plus a small manifest, so an event page
+only loads its own field.
+
+Usage:
+  python event_index.py [export.json] [--out event_results.json]
+  python event_index.py [export.json] --shard DIR
+  python event_index.py [export.json] --verify
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_EXPORT = os.path.join(SCRIPT_DIR, '..', 'src', 'data', 'data.json')
+
+EVENT_INDEX_VERSION = 1
+
+# EventResult fields, in row order (format and date are per event)
+COLUMNS = [
+    'playerId', 'playerName', 'finish', 'deck', 'record', 'notes',
+    'event_id', 'summary', 'day2', 'top8', 'in_contention',
+    'limited_wins', 'limited_losses', 'limited_draws',
+    'constructed_wins', 'constructed_losses', 'constructed_draws',
+    'overall_wins', 'overall_losses', 'overall_draws',
+    'day1_wins', 'day1_losses', 'day1_draws',
+    'day2_wins', 'day2_losses', 'day2_draws',
+    'day3_wins', 'day3_losses', 'day3_draws',
+    'num_drafts', 'positive_drafts', 'negative_drafts', 'trophy_drafts', 'no_win_drafts',
+    'win_streak', 'loss_streak', 'streak5',
+]
+EVENT_FIELDS = COLUMNS[4:]
+
+
+def _finish(event: Dict) -> Optional[float]:
+    """Numeric finish, or None where getEventResults would skip the row."""
+    finish = event.get('finish')
+    if not finish:
+        return None
+    try:
+        value = float(finish)
+    except (TypeError, ValueError):
+        return None
+    return value if value == value else None
+
+
+def build_event_index(export: Dict) -> Dict:
+    """{'version', 'columns', 'events': {code_lower: {eventCode, format, date, totalPlayers, rows}}}"""
+    dates_by_name = {
+        str(event.get('name', '')).lower(): event.get('date')
+        for event in (export.get('events') or {}).values()
+    }
+
+    events = {}
+    for player_id, data in (export.get('players') or {}).items():
+        full_name = data['player_info']['full_name']
+        for event in data['events'].values():
+            code = str(event.get('event_code', '')).lower()
+            entry = events.get(code)
+            if entry is None:
+                # Metadata from the first result seen, as getEventResults does
+                entry = events[code] = {
+                    'eventCode': event.get('event_code'),
+                    'format': event.get('format'),
+                    'date': event.get('date') or dates_by_name.get(code),
+                    'rows': [],
+                }
+            finish = _finish(event)
+            if finish is None:
+                continue
+            finish = int(finish) if finish.is_integer() else finish
+            entry['rows'].append(
+                [player_id, full_name, finish, event.get('deck') or 'Unknown Deck']
+                + [event.get(field) for field in EVENT_FIELDS]
+            )
+
+    index = {}
+    for code, entry in events.items():
+        if not entry['rows']:
+            continue
+        entry['rows'].sort(key=lambda row: row[2])
+        entry['totalPlayers'] = len(entry['rows'])
+        index[code] = entry
+
+    return {'version': EVENT_INDEX_VERSION, 'columns': COLUMNS, 'events': index}
+
+
+def event_details(index: Dict, event_code: str) -> Optional[Dict]:
+    """One event in the EventDetails shape getEventResults returns."""
+    entry = index['events'].get(event_code.lower())
+    if entry is None:
+        return None
+    columns = index['columns']
+    results = []
+    for row in entry['rows']:
+        result = dict(zip(columns, row))
+        result['format'] = entry['format']
+        result['date'] = entry['date']
+        results.append(result)
+    return {
+        'eventCode': entry['eventCode'],
+        'format': entry['format'],
+        'date': entry['date'],
+        'results': results,
+        'totalPlayers': entry['totalPlayers'],
+    }
+
+
+def shard_file_name(event_code: str) -> str:
+    return re.sub(r'[^a-z0-9_-]', '_', event_code.lower()) + '.json'
+
+
+def shard_event_index(index: Dict) -> Dict[str, Dict]:
+    """
+    Split the index into one file per event plus manifest.json
+    ({code: {file, eventCode, format, date, totalPlayers}}).
+    Returns {file name: content}.
+    """
+    files = {}
+    manifest = {}
+    for code, entry in index['events'].items():
+        file_name = shard_file_name(code)
+        # Codes differing only in punctuation would share a file name
+        if file_name in files:
+            file_name = f"{file_name[:-5]}_{len(files)}.json"
+        files[file_name] = {'version': index['version'], 'columns': index['columns'], 'events': {code: entry}}
+        manifest[code] = {
+            'file': file_name,
+            'eventCode': entry['eventCode'],
+            'format': entry['format'],
+            'date': entry['date'],
+            'totalPlayers': entry['totalPlayers'],
+        }
+    files['manifest.json'] = manifest
+    return files
+
+
+def scan_event_results(export: Dict, event_code: str) -> Optional[Dict]:
+    """Direct port of getEventResults (full scan), used by --verify."""
+    results = []
+    found = None
+    search = event_code.lower()
+    for player_id, data in (export.get('players') or {}).items():
+        for event in data['events'].values():
+            if str(event.get('event_code', '')).lower() != search:
+                continue
+            found = found or event
+            finish = _finish(event)
+            if finish is None:
+                continue
+            results.append((finish, player_id, data['player_info']['full_name'], event))
+    if not results:
+        return None
+    results.sort(key=lambda r: r[0])
+    return {
+        'eventCode': found.get('event_code'),
+        'format': found.get('format'),
+        'results': [[player_id, name, finish, event.get('deck') or 'Unknown Deck']
+                    + [event.get(field) for field in EVENT_FIELDS]
+                    for finish, player_id, name, event in results],
+    }
+
+
+def verify(export: Dict, index: Dict) -> List[str]:
+    problems = []
+    codes = {str(e.get('event_code', '')).lower()
+             for data in (export.get('players') or {}).values() for e in data['events'].values()}
+    for code in sorted(codes):
+        expected = scan_event_results(export, code)
+        details = event_details(index, code)
+        if expected is None or details is None:
+            if (expected is None) != (details is None):
+                problems.append(f"{code}: found in {'scan' if details is None else 'index'} only")
+            continue
+        got = [[r[column] for column in COLUMNS] for r in details['results']]
+        if got != expected['results'] or details['eventCode'] != expected['eventCode']:
+            problems.append(f"{code}: results differ from getEventResults")
+    return problems
+
+
+def main():
+    export_path = DEFAULT_EXPORT
+    out_path = None
+    shard_dir = None
+
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    if '--out' in sys.argv:
+        out_idx = sys.argv.index('--out')
+        if out_idx + 1 < len(sys.argv):
+            out_path = sys.argv[out_idx + 1]
+            args.remove(out_path)
+    if '--shard' in sys.argv:
+        shard_idx = sys.argv.index('--shard')
+        if shard_idx + 1 < len(sys.argv):
+            shard_dir = sys.argv[shard_idx + 1]
+            args.remove(shard_dir)
+    if args:
+        export_path = args[0]
+
+    with open(export_path, 'r', encoding='utf-8') as f:
+        export = json.load(f)
+
+    start = time.perf_counter()
+    index = build_event_index(export)
+    print(f"Indexed {len(index['events'])} events in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+    if out_path or shard_dir:
+        from export_data import write_json, write_shards
+        if out_path:
+            size = write_json(out_path, index)
+            print(f"Wrote {out_path} ({size / 1024:.0f} KB)", file=sys.stderr)
+        if shard_dir:
+            size = write_shards(shard_dir, shard_event_index(index))
+            print(f"Wrote {len(index['events'])} shards to {shard_dir} ({size / 1024:.0f} KB)", file=sys.stderr)
+
+    if '--verify' in sys.argv:
+        problems = verify(export, index)
+        if problems:
+            for problem in problems:
+                print(f"✗ {problem}", file=sys.stderr)
+            print(f"\n✗ {len(problems)} events differ from getEventResults", file=sys.stderr)
+            sys.exit(1)
+        print(f"✓ All {len(index['events'])} events match getEventResults", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
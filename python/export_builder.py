@@ -0,0 +1,302 @@
+"""
+Python version of sql/generate_app_json.sql.
+
+Builds the app export (data.json structure) from plain SELECTs that run on
+any storage backend, so the export doesn't depend on Postgres JSON
+functions. Must produce exactly what the SQL does; `python storage.py
+parity` compares the two. The SQL rules it reproduces:
+  - events are numbered per player by event date (then result id),
+    NULL dates last, and include results whose event row is missing in
+    the numbering but not in the output
+  - a per-round total (day1 + day2 + day3) only counts when all three are
+    set, like SUM over a NULL-propagating sum
+  - percentages are ROUND(numeric, 1): exact decimal, half away from zero
+  - a player with no results has 0 events and an empty events object
+  - with cached_stats, stats come from the partition stats cache
+    (partitions.py), which must give the same totals as the rows
+  - filter_keys summarize a player's exported events for the app's
+    format and date filters: first/last_date are the earliest and latest
+    event dates and format_counts the events per format (keys from the
+    top-level formats list of event formats, sorted by code point)
+  - the rating (from player_ratings, see ratings.py) is rounded like the
+    percentages and ranked by RANK() on the rounded value; unrated
+    players get a null value and rank
+"""
+
+from collections import defaultdict
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, List, Optional
+
+# Event id of the Pro Tour whose invite list sets sos_qualification
+SOS_EVENT_ID = 14
+
+# results columns in the order the export lists them, with their export names
+RESULT_FIELDS = [
+    ('finish', 'finish'), ('summary', 'summary'), ('deck', 'deck'), ('notes', 'notes'), ('team', 'team'),
+    ('day2', 'day2'), ('top8', 'top8'), ('in_contention', 'in_contention'), ('overall_record', 'record'),
+    ('limited_wins', 'limited_wins'), ('limited_losses', 'limited_losses'), ('limited_draws', 'limited_draws'),
+    ('num_drafts', 'num_drafts'), ('positive_drafts', 'positive_drafts'), ('negative_drafts', 'negative_drafts'),
+    ('trophy_drafts', 'trophy_drafts'), ('no_win_drafts', 'no_win_drafts'),
+    ('constructed_wins', 'constructed_wins'), ('constructed_losses', 'constructed_losses'),
+    ('constructed_draws', 'constructed_draws'),
+    ('day1_wins', 'day1_wins'), ('day1_losses', 'day1_losses'), ('day1_draws', 'day1_draws'),
+    ('day2_wins', 'day2_wins'), ('day2_losses', 'day2_losses'), ('day2_draws', 'day2_draws'),
+    ('day3_wins', 'day3_wins'), ('day3_losses', 'day3_losses'), ('day3_draws', 'day3_draws'),
+    ('win_streak', 'win_streak'), ('loss_streak', 'loss_streak'), ('streak5', 'streak5'),
+]
+BOOL_COLUMNS = {'day2', 'top8', 'in_contention'}
+
+# Summed columns: stat name -> results column
+SUMMED = [
+    ('limited_wins', 'limited_wins'), ('limited_losses', 'limited_losses'), ('limited_draws', 'limited_draws'),
+    ('constructed_wins', 'constructed_wins'), ('constructed_losses', 'constructed_losses'),
+    ('constructed_draws', 'constructed_draws'),
+    ('day1_wins', 'day1_wins'), ('day1_losses', 'day1_losses'), ('day1_draws', 'day1_draws'),
+    ('day2_wins', 'day2_wins'), ('day2_losses', 'day2_losses'), ('day2_draws', 'day2_draws'),
+    ('day3_wins', 'day3_wins'), ('day3_losses', 'day3_losses'), ('day3_draws', 'day3_draws'),
+    ('drafts', 'num_drafts'), ('winning_drafts', 'positive_drafts'), ('losing_drafts', 'negative_drafts'),
+    ('trophy_drafts', 'trophy_drafts'), ('streaks_5', 'streak5'),
+]
+
+# Additive per-player totals every stat is derived from (partitions.py caches these)
+TOTAL_COLUMNS = [
+    'events', 'day2s', 'in_contentions', 'top8s', 'overall_wins', 'overall_losses', 'overall_draws',
+] + [stat for stat, _ in SUMMED]
+
+_TENTH = Decimal('0.1')
+
+
+def _date_text(value) -> Optional[str]:
+    """Dates as the export writes them (YYYY-MM-DD), whatever the driver returns."""
+    if value is None:
+        return None
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+def _bool(value) -> Optional[bool]:
+    return None if value is None else bool(value)
+
+
+def _sum(values) -> int:
+    """COALESCE(SUM(values), 0): NULLs are skipped."""
+    return sum(v for v in values if v is not None)
+
+
+def _round_sum(rows: List[Dict], suffix: str) -> int:
+    """COALESCE(SUM(day1_x + day2_x + day3_x), 0): a row with any NULL adds nothing."""
+    total = 0
+    for row in rows:
+        parts = (row[f'day1_{suffix}'], row[f'day2_{suffix}'], row[f'day3_{suffix}'])
+        if None not in parts:
+            total += sum(parts)
+    return total
+
+
+def _pct(part: int, *others: int) -> float:
+    """ROUND(part::numeric / (part + others) * 100, 1), 0 when the total is 0."""
+    total = part + sum(others)
+    if total == 0:
+        return 0.0
+    return float((Decimal(part) / Decimal(total) * 100).quantize(_TENTH, rounding=ROUND_HALF_UP))
+
+
+def _record(*values: int) -> str:
+    return '-'.join(str(v) for v in values)
+
+
+def fetch_results(cur, where: str = '', params=()) -> List[Dict]:
+    """results joined to events, optionally filtered by a WHERE clause on r."""
+    result_columns = [column for column, _ in RESULT_FIELDS]
+    cur.execute(f"""
+        SELECT r.id, r.player_id, e.id, e.name, e.date, e.format, r.event_id,
+               {', '.join('r.' + column for column in result_columns)}
+        FROM results r
+        LEFT JOIN events e ON r.event_id = e.id
+        {f'WHERE {where}' if where else ''}
+    """, params)
+    results = []
+    for row in cur.fetchall():
+        result = dict(zip(result_columns, row[7:]))
+        # event_id is the joined event (None when its row is missing); results_event_id is the column
+        result.update(result_id=row[0], player_id=row[1], event_id=row[2], event_name=row[3],
+                      date=_date_text(row[4]), format=row[5], results_event_id=row[6])
+        for column in BOOL_COLUMNS:
+            result[column] = _bool(result[column])
+        results.append(result)
+    return results
+
+
+def fetch_rows(cur):
+    """players, results joined to events, SOS qualifiers and events, with plain SQL."""
+    cur.execute("SELECT id, first_name, last_name FROM players")
+    players = cur.fetchall()
+    results = fetch_results(cur)
+
+    cur.execute("SELECT DISTINCT player_id FROM notable_qualifications WHERE event_id = %s", (SOS_EVENT_ID,))
+    sos_players = {row[0] for row in cur.fetchall()}
+
+    cur.execute("SELECT id, name, date, format FROM events")
+    events = cur.fetchall()
+    return players, results, sos_players, events
+
+
+def fetch_ratings(cur) -> Dict[int, Dict]:
+    """player id -> {'value', 'rank'} for every rated player (none before the ratings table exists)."""
+    # Imported here: storage imports this module
+    from storage import table_exists
+    if not table_exists(cur, 'player_ratings'):
+        return {}
+    cur.execute("SELECT player_id, rating FROM player_ratings")
+    # ROUND(rating::numeric, 1): the float's 15 significant digits, then half away from zero
+    rounded = [
+        (player_id, float(Decimal(f'{rating:.15g}').quantize(_TENTH, rounding=ROUND_HALF_UP)))
+        for player_id, rating in cur.fetchall()
+    ]
+    rounded.sort(key=lambda item: -item[1])
+    ratings = {}
+    for i, (player_id, value) in enumerate(rounded):
+        rank = i + 1 if i == 0 or value != rounded[i - 1][1] else ratings[rounded[i - 1][0]]['rank']
+        ratings[player_id] = {'value': value, 'rank': rank}
+    return ratings
+
+
+def row_totals(rows: List[Dict]) -> Dict[str, int]:
+    """TOTAL_COLUMNS for one player's result rows."""
+    totals = {
+        'events': sum(1 for row in rows if row['event_id'] is not None),
+        'day2s': sum(1 for row in rows if row['day2'] is True),
+        'in_contentions': sum(1 for row in rows if row['in_contention'] is True),
+        'top8s': sum(1 for row in rows if row['top8'] is True),
+        'overall_wins': _round_sum(rows, 'wins'),
+        'overall_losses': _round_sum(rows, 'losses'),
+        'overall_draws': _round_sum(rows, 'draws'),
+    }
+    totals.update({stat: _sum(row[column] for row in rows) for stat, column in SUMMED})
+    return totals
+
+
+def player_stats(rows: List[Dict]) -> Dict:
+    """The export's stats object for one player's result rows."""
+    return stats_from_totals(row_totals(rows))
+
+
+def stats_from_totals(s: Dict[str, int]) -> Dict:
+    """The export's stats object from a player's TOTAL_COLUMNS."""
+    overall_wins, overall_losses, overall_draws = s['overall_wins'], s['overall_losses'], s['overall_draws']
+
+    return {
+        'events': {'value': s['events']},
+        'day2s': {'value': s['day2s']},
+        'in_contentions': {'value': s['in_contentions']},
+        'top8s': {'value': s['top8s']},
+        'overall_wins': {'value': overall_wins},
+        'overall_losses': {'value': overall_losses},
+        'overall_draws': {'value': overall_draws},
+        'overall_record': {'value': _record(overall_wins, overall_losses, overall_draws)},
+        'overall_win_pct': {'value': _pct(overall_wins, overall_losses, overall_draws)},
+        'limited_wins': {'value': s['limited_wins']},
+        'limited_losses': {'value': s['limited_losses']},
+        'limited_draws': {'value': s['limited_draws']},
+        'limited_record': {'value': _record(s['limited_wins'], s['limited_losses'], s['limited_draws'])},
+        'limited_win_pct': {'value': _pct(s['limited_wins'], s['limited_losses'], s['limited_draws'])},
+        'constructed_wins': {'value': s['constructed_wins']},
+        'constructed_losses': {'value': s['constructed_losses']},
+        'constructed_draws': {'value': s['constructed_draws']},
+        'constructed_record': {'value': _record(s['constructed_wins'], s['constructed_losses'], s['constructed_draws'])},
+        'constructed_win_pct': {'value': _pct(s['constructed_wins'], s['constructed_losses'], s['constructed_draws'])},
+        'day1_wins': {'value': s['day1_wins']},
+        'day1_losses': {'value': s['day1_losses']},
+        'day1_draws': {'value': s['day1_draws']},
+        'day1_win_pct': {'value': _pct(s['day1_wins'], s['day1_losses'], s['day1_draws'])},
+        'day2_wins': {'value': s['day2_wins']},
+        'day2_losses': {'value': s['day2_losses']},
+        'day2_draws': {'value': s['day2_draws']},
+        'day2_win_pct': {'value': _pct(s['day2_wins'], s['day2_losses'], s['day2_draws'])},
+        'day3_wins': {'value': s['day3_wins']},
+        'day3_losses': {'value': s['day3_losses']},
+        'day3_draws': {'value': s['day3_draws']},
+        'day3_win_pct': {'value': _pct(s['day3_wins'], s['day3_losses'], s['day3_draws'])},
+        'top8_record': {'value': _record(s['day3_wins'], s['day3_losses'], s['day3_draws'])},
+        'drafts': {'value': s['drafts']},
+        'winning_drafts': {'value': s['winning_drafts']},
+        'losing_drafts': {'value': s['losing_drafts']},
+        'winning_drafts_pct': {'value': _pct(s['winning_drafts'], s['losing_drafts'])},
+        'trophy_drafts': {'value': s['trophy_drafts']},
+        '5streaks': {'value': s['streaks_5']},
+    }
+
+
+def format_dictionary(events) -> List[str]:
+    """Distinct event formats for the formats list (ORDER BY format COLLATE "C")."""
+    return sorted({event_format for _, _, _, event_format in events if event_format is not None})
+
+
+def filter_keys(rows: List[Dict]) -> Dict:
+    """A player's filter_keys from their result rows (only rows with an event row count, as in events)."""
+    exported = [row for row in rows if row['event_id'] is not None]
+    dates = [row['date'] for row in exported if row['date'] is not None]
+    counts = defaultdict(int)
+    for row in exported:
+        if row['format'] is not None:
+            counts[row['format']] += 1
+    return {
+        'first_date': min(dates) if dates else None,
+        'last_date': max(dates) if dates else None,
+        'format_counts': dict(sorted(counts.items())),
+    }
+
+
+def build_export(cur, cached_stats: bool = False) -> Dict:
+    """
+    The export for the database behind `cur` (any backend). cached_stats
+    takes the stats from the partition stats cache, if it is installed.
+    """
+    players, results, sos_players, events = fetch_rows(cur)
+    ratings = fetch_ratings(cur)
+    totals = None
+    if cached_stats:
+        # Imported here: partitions imports this module
+        from partitions import cached_totals
+        totals = cached_totals(cur, results)
+
+    formats = format_dictionary(events)
+
+    results_by_player = defaultdict(list)
+    for result in results:
+        results_by_player[result['player_id']].append(result)
+
+    players_json = {}
+    for player_id, first_name, last_name in sorted(players):
+        rows = results_by_player.get(player_id, [])
+        # ROW_NUMBER() OVER (PARTITION BY player ORDER BY e.date, r.id), NULL dates last
+        rows.sort(key=lambda row: (row['date'] is None, row['date'] or '', row['result_id']))
+
+        player_events = {}
+        for number, row in enumerate(rows, start=1):
+            if row['event_id'] is None:
+                continue
+            event = {'event_code': row['event_name'], 'format': row['format'], 'event_id': row['event_id']}
+            for column, name in RESULT_FIELDS:
+                event[name] = row[column]
+            player_events[f'entry_{number}'] = event
+
+        players_json[f'entry_{player_id}'] = {
+            'player_info': {
+                'first_name': first_name,
+                'last_name': last_name,
+                'full_name': f'{first_name} {last_name}' if first_name is not None and last_name is not None else None,
+                'sos_qualification': player_id in sos_players,
+            },
+            'events': player_events,
+            'stats': {**(player_stats(rows) if totals is None else stats_from_totals(totals[player_id])),
+                      'rating': ratings.get(player_id, {'value': None, 'rank': None})},
+            'filter_keys': filter_keys(rows),
+        }
+
+    events_json = {
+        f'entry_{event_id}': {'id': event_id, 'name': name, 'date': _date_text(date), 'format': event_format}
+        for event_id, name, date, event_format in sorted(events)
+    }
+
+    # json_object_agg and json_agg over no rows are NULL
+    return {'players': players_json or None, 'events': events_json or None, 'formats': formats or None}
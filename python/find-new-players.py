@@ -2,130 +2,101 @@
 """
 Check which players from a CSV are not yet in the database.
 CSV should have two columns: First, Last (no headers)
-Includes fuzzy matching to detect potential matches with similar names.
+Includes fuzzy matching to detect potential matches with similar names
+(case, accents and punctuation ignored, see name_utils.py); the players
+are read once, so it runs on Postgres or a local SQLite file alike.
+Names with a known alias (see aliases.py) skip the fuzzy matching entirely;
+with --confirm, potential matches can be confirmed and saved as aliases.
 """
 
 import csv
 import sys
-import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 import os
+from collections import defaultdict
+from typing import List, Tuple
 
+from aliases import load_aliases, resolve_alias, record_alias
+from ingest_locks import record_generation
+from name_utils import name_key, normalize_name
+from storage import open_storage, table_exists
 
-def check_player_exists(cur, first_name: str, last_name: str) -> bool:
+
+class PlayerIndex:
+    """
+    Every player, loaded with one query and indexed by exact name and by
+    normalized last name (name_utils.normalize_name), so checking a list
+    costs no queries per name.
+    """
+
+    def __init__(self, cur):
+        cur.execute("SELECT id, first_name, last_name FROM players ORDER BY id")
+        self.exact = {}
+        self.by_last = defaultdict(list)
+        for player_id, first_name, last_name in cur.fetchall():
+            self.exact.setdefault((first_name, last_name), player_id)
+            self.by_last[normalize_name(last_name)].append((player_id, first_name, last_name))
+
+
+def check_player_exists(index: PlayerIndex, first_name: str, last_name: str) -> bool:
     """
     Check if a player exists in the database (exact match).
     Returns True if exists, False otherwise.
     """
-    cur.execute("""
-        SELECT id FROM players 
-        WHERE first_name = %s AND last_name = %s
-    """, (first_name, last_name))
-    
-    return cur.fetchone() is not None
+    return (first_name, last_name) in index.exact
+
 
+def _same_key(first_a: str, last_a: str, first_b: str, last_b: str) -> bool:
+    try:
+        return name_key(first_a, last_a) == name_key(first_b, last_b)
+    except ValueError:
+        return False
 
-def find_similar_players(cur, first_name: str, last_name: str):
+
+def find_similar_players(index: PlayerIndex, first_name: str, last_name: str) -> List[Tuple[int, str, str, str]]:
     """
-    Find players with similar names using multiple strategies:
-    1. ILIKE case-insensitive matching
-    2. unaccent for accent-insensitive matching
-    3. Same last name with similar first name (one contains the other)
-    
+    Find players with similar names among those with the same normalized
+    last name:
+    1. case-insensitive matching
+    2. accent-insensitive matching (name_utils.name_key)
+    3. similar first name (one contains the other)
+
     Returns list of tuples: (id, first_name, last_name, match_type)
     """
     similar_players = []
-    
-    # Try case-insensitive match on first name
-    cur.execute("""
-        SELECT id, first_name, last_name 
-        FROM players 
-        WHERE first_name ILIKE %s AND last_name = %s
-    """, (first_name, last_name))
-    
-    results = cur.fetchall()
-    for row in results:
-        similar_players.append((*row, 'case-insensitive first name'))
-    
-    # Try case-insensitive match on last name
-    cur.execute("""
-        SELECT id, first_name, last_name 
-        FROM players 
-        WHERE first_name = %s AND last_name ILIKE %s
-    """, (first_name, last_name))
-    
-    results = cur.fetchall()
-    for row in results:
-        if row not in [p[:3] for p in similar_players]:
-            similar_players.append((*row, 'case-insensitive last name'))
-    
-    # Try case-insensitive match on both
-    cur.execute("""
-        SELECT id, first_name, last_name 
-        FROM players 
-        WHERE first_name ILIKE %s AND last_name ILIKE %s
-    """, (first_name, last_name))
-    
-    results = cur.fetchall()
-    for row in results:
-        if row not in [p[:3] for p in similar_players]:
-            similar_players.append((*row, 'case-insensitive both names'))
-    
-    # Try with unaccent if available
-    try:
-        cur.execute("""
-            SELECT id, first_name, last_name 
-            FROM players 
-            WHERE unaccent(first_name) ILIKE unaccent(%s) 
-              AND unaccent(last_name) ILIKE unaccent(%s)
-        """, (first_name, last_name))
-        
-        results = cur.fetchall()
-        for row in results:
-            if row not in [p[:3] for p in similar_players]:
-                similar_players.append((*row, 'accent-insensitive'))
-    except psycopg2.errors.UndefinedFunction:
-        # unaccent extension not available, skip
-        pass
-    
-    # NEW: Find all players with same last name and check if first names contain each other
-    cur.execute("""
-        SELECT id, first_name, last_name 
-        FROM players 
-        WHERE last_name = %s
-    """, (last_name,))
-    
-    same_last_name_players = cur.fetchall()
-    for player_id, db_first, db_last in same_last_name_players:
-        # Skip if already in similar_players
-        if (player_id, db_first, db_last) in [p[:3] for p in similar_players]:
-            continue
-        
-        # Check if one first name contains the other (case-insensitive)
-        first_lower = first_name.lower()
-        db_first_lower = db_first.lower()
-        
-        if first_lower in db_first_lower or db_first_lower in first_lower:
-            # Determine which contains which for the message
-            if first_lower in db_first_lower and first_lower != db_first_lower:
-                match_msg = f"same last name, '{db_first}' contains '{first_name}'"
-            elif db_first_lower in first_lower and first_lower != db_first_lower:
-                match_msg = f"same last name, '{first_name}' contains '{db_first}'"
+    first_lower = first_name.casefold()
+    for player_id, db_first, db_last in index.by_last.get(normalize_name(last_name), []):
+        db_first_lower = db_first.casefold()
+        same_first = db_first_lower == first_lower
+        same_last = db_last.casefold() == last_name.casefold()
+        if same_first and same_last:
+            if db_first == first_name:
+                match_type = 'case-insensitive last name'
+            elif db_last == last_name:
+                match_type = 'case-insensitive first name'
             else:
-                # They're equal (case-insensitive) but different case
-                match_msg = "same last name, case difference in first name"
-            
-            similar_players.append((player_id, db_first, db_last, match_msg))
-    
+                match_type = 'case-insensitive both names'
+        elif _same_key(first_name, last_name, db_first, db_last):
+            match_type = 'accent-insensitive'
+        elif first_lower in db_first_lower:
+            match_type = f"same last name, '{db_first}' contains '{first_name}'"
+        elif db_first_lower and db_first_lower in first_lower:
+            match_type = f"same last name, '{first_name}' contains '{db_first}'"
+        else:
+            continue
+        similar_players.append((player_id, db_first, db_last, match_type))
+
     return similar_players
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python check_new_players.py <db_connection_string>")
+        print("Usage: python check_new_players.py <db_connection_string> [--confirm]")
         print("\nThe script will read from 'richmond-qs.csv' in the same directory.")
         print("\nExample:")
         print("  python check_new_players.py 'dbname=mtg user=postgres'")
+        print()
+        print("  # Confirm potential matches interactively and save them as aliases")
+        print("  python check_new_players.py 'dbname=mtg user=postgres' --confirm")
         sys.exit(1)
     
     # Hardcoded CSV file path - must be in same directory as script
@@ -133,6 +104,7 @@ def main():
     csv_file = os.path.join(script_dir, 'richmond-qs.csv')
     
     db_conn_string = sys.argv[1]
+    confirm = '--confirm' in sys.argv
     
     # Check if CSV exists
     if not os.path.exists(csv_file):
@@ -144,22 +116,14 @@ def main():
     
     # Connect to database
     try:
-        conn = psycopg2.connect(db_conn_string)
+        conn = open_storage(db_conn_string)
         cur = conn.cursor()
         print("Connected to database successfully", file=sys.stderr)
-        
-        # Check if unaccent extension is available
-        cur.execute("""
-            SELECT EXISTS(
-                SELECT 1 FROM pg_extension WHERE extname = 'unaccent'
-            )
-        """)
-        has_unaccent = cur.fetchone()[0]
-        if has_unaccent:
-            print("✓ unaccent extension is available", file=sys.stderr)
-        else:
-            print("⚠ unaccent extension not available (accent matching disabled)", file=sys.stderr)
-            print("  To enable: CREATE EXTENSION unaccent;", file=sys.stderr)
+
+        aliases = load_aliases(cur)
+        print(f"Loaded {len(aliases)} name alias(es)", file=sys.stderr)
+        index = PlayerIndex(cur)
+        print(f"Loaded {len(index.exact)} player name(s)", file=sys.stderr)
         
         print("", file=sys.stderr)
     except Exception as e:
@@ -169,6 +133,7 @@ def main():
     try:
         new_players = []
         existing_players = []
+        aliased_players = []
         new_with_similar = []
         
         # Read and check CSV
@@ -185,14 +150,18 @@ def main():
                 if not first_name or not last_name:
                     continue
                 
-                if check_player_exists(cur, first_name, last_name):
+                # Known variants resolve without any fuzzy queries
+                alias_id = resolve_alias(aliases, first_name, last_name)
+                if alias_id is not None:
+                    aliased_players.append((first_name, last_name, alias_id))
+                elif check_player_exists(index, first_name, last_name):
                     existing_players.append((first_name, last_name))
                 else:
                     # Player doesn't exist with exact match
                     new_players.append((first_name, last_name))
                     
                     # Check for similar matches
-                    similar = find_similar_players(cur, first_name, last_name)
+                    similar = find_similar_players(index, first_name, last_name)
                     if similar:
                         new_with_similar.append((first_name, last_name, similar))
         
@@ -234,7 +203,15 @@ def main():
                 print(f"  {first} {last}")
             print()
         
-        print(f"Total players in CSV: {len(new_players) + len(existing_players)}")
+        # Show names resolved through aliases
+        if aliased_players:
+            print(f"KNOWN ALIASES (resolved without matching): {len(aliased_players)}")
+            print("-" * 70)
+            for first, last, player_id in sorted(aliased_players, key=lambda x: (x[1], x[0])):
+                print(f"  {first} {last} -> ID {player_id}")
+            print()
+        
+        print(f"Total players in CSV: {len(new_players) + len(existing_players) + len(aliased_players)}")
         
         # Summary
         print()
@@ -245,6 +222,35 @@ def main():
         print(f"  - With potential similar matches: {len(new_with_similar)}")
         print(f"  - No similar matches found: {len(new_players) - len(new_with_similar)}")
         print(f"Existing players (exact match): {len(existing_players)}")
+        print(f"Known aliases: {len(aliased_players)}")
+        
+        # Confirm potential matches and remember them for next time
+        if confirm and new_with_similar and not table_exists(cur, 'player_aliases'):
+            print("\n⚠ Cannot save aliases: player_aliases table not found "
+                  "(run sql/create_player_aliases.sql)", file=sys.stderr)
+        elif confirm and new_with_similar:
+            print()
+            print("="*70)
+            print("CONFIRM MATCHES")
+            print("="*70)
+            confirmed = []
+            for first, last, similar_list in sorted(new_with_similar, key=lambda x: (x[1], x[0])):
+                print(f"\n  {first} {last}")
+                for i, (player_id, db_first, db_last, match_type) in enumerate(similar_list, start=1):
+                    print(f"    [{i}] {db_first} {db_last} (ID: {player_id}) [{match_type}]")
+                choice = input("  Same player? Enter number to confirm, blank to skip: ").strip()
+                if choice.isdigit() and 1 <= int(choice) <= len(similar_list):
+                    player_id = similar_list[int(choice) - 1][0]
+                    try:
+                        record_alias(cur, first, last, player_id, 'find-new-players', aliases)
+                    except ValueError as e:
+                        print(f"  ⚠ Not saved: {e}", file=sys.stderr)
+                        continue
+                    confirmed.append(player_id)
+            if confirmed:
+                record_generation(cur, 'find-new-players aliases', confirmed)
+            conn.commit()
+            print(f"\n✓ Saved {len(confirmed)} alias(es)")
     
     except Exception as e:
         print(f"\nError processing CSV: {e}", file=sys.stderr)
@@ -0,0 +1,131 @@
+"""
+Locks and generations that let ingests and exports run at the same time.
+
+Ingest transactions take Postgres advisory locks (transaction-scoped, so
+they are released by the commit or rollback):
+  event:<name>                  the events the transaction creates or adds results to
+  player:<first key>|<last key> the players it looks up or creates (name_utils.name_key)
+Two ingests of the same event, or that would create the same player,
+wait for each other; ingests of different events and players don't. A
+transaction takes all of its row locks up front in sorted order, then
+at most RATINGS_LOCK (ratings.update_ratings) and GENERATION_LOCK last,
+so two ingests can't deadlock by taking the same keys in different orders.
+
+Every committing ingest transaction also adds a row to ingest_generations
+(sql/create_ingest_generations.sql). Generation numbers are handed out
+under their own lock right before the commit, so they commit in order:
+a snapshot that sees generation N sees every ingest up to N and none
+after. The exporter reads in one REPEATABLE READ, read-only snapshot
+(Storage.begin_snapshot) and records the generation it saw.
+
+record_generation also sends a NOTIFY on CHANGES_CHANNEL with the
+generation and the players and events the transaction touched (null
+when unknown or too many for a payload). Postgres delivers it only if
+the transaction commits; export_daemon.py listens for it.
+
+SQLite allows one writer at a time, so the locks are no-ops there.
+Instead every write transaction starts with BEGIN IMMEDIATE
+(storage.SQLiteCursor): concurrent ingests queue for the whole
+transaction, waiting up to storage.SQLITE_BUSY_TIMEOUT, rather than
+failing with "database is locked" partway through. Its WAL journal
+(storage.init_sqlite) lets an export read a snapshot while an ingest
+writes.
+"""
+
+import hashlib
+import json
+from typing import Dict, Iterable, Optional
+
+from name_utils import name_key
+from storage import is_sqlite, table_exists
+
+RATINGS_LOCK = 'ratings'
+GENERATION_LOCK = 'ingest_generation'
+
+CHANGES_CHANNEL = 'mtg_history_changes'
+# NOTIFY payloads must be under 8000 bytes
+MAX_PAYLOAD = 7900
+
+
+def lock_id(key: str) -> int:
+    """A lock key as the signed 64-bit id pg_advisory_xact_lock takes."""
+    return int.from_bytes(hashlib.sha256(key.encode('utf-8')).digest()[:8], 'big', signed=True)
+
+
+def event_lock_key(event_name: str) -> str:
+    return f"event:{event_name.strip().lower()}"
+
+
+def player_lock_key(first_name: str, last_name: str) -> str:
+    try:
+        return 'player:' + '|'.join(name_key(first_name, last_name))
+    except ValueError:
+        # No key to share with other spellings: only the name as written
+        return f"player:{first_name.strip()}|{last_name.strip()}"
+
+
+def lock_keys(cur, keys: Iterable[str]) -> None:
+    """Take the advisory locks for keys (sorted, each once) until the transaction ends."""
+    if is_sqlite(cur):
+        return
+    for key in sorted(set(keys)):
+        cur.execute("SELECT pg_advisory_xact_lock(%s)", (lock_id(key),))
+
+
+def row_lock_keys(rows: Iterable[Dict]) -> set:
+    """Event and player keys for results sheet rows (blank rows have none)."""
+    keys = set()
+    for row in rows:
+        first_name, last_name = row.get('First', '').strip(), row.get('Last', '').strip()
+        if not first_name and not last_name:
+            continue
+        keys.add(event_lock_key(row.get('Event', '')))
+        keys.add(player_lock_key(first_name, last_name))
+    return keys
+
+
+def notify_change(cur, generation: Optional[int], source: str,
+                  players: Optional[Iterable[int]] = None, events: Optional[Iterable[int]] = None) -> None:
+    """NOTIFY CHANGES_CHANNEL at commit (Postgres only; SQLite has no notifications)."""
+    if is_sqlite(cur):
+        return
+    payload = {
+        'generation': generation,
+        'source': source,
+        'players': None if players is None else sorted(set(players)),
+        'events': None if events is None else sorted(set(events)),
+    }
+    text = json.dumps(payload, separators=(',', ':'))
+    if len(text.encode('utf-8')) > MAX_PAYLOAD:
+        text = json.dumps({**payload, 'source': source[:200], 'players': None, 'events': None},
+                          separators=(',', ':'))
+    cur.execute("SELECT pg_notify(%s, %s)", (CHANGES_CHANNEL, text))
+
+
+def record_generation(cur, source: str, players: Optional[Iterable[int]] = None,
+                      events: Optional[Iterable[int]] = None) -> Optional[int]:
+    """
+    Add the next ingest generation in the current transaction and queue
+    its change notification; call right before committing. players and
+    events are the ids the transaction wrote (None: unknown). Returns
+    the generation, or None before the table exists.
+    """
+    generation = None
+    if table_exists(cur, 'ingest_generations'):
+        lock_keys(cur, [GENERATION_LOCK])
+        cur.execute("""
+            INSERT INTO ingest_generations (generation, source)
+            SELECT COALESCE(MAX(generation), 0) + 1, %s FROM ingest_generations
+            RETURNING generation
+        """, (source,))
+        generation = cur.fetchone()[0]
+    notify_change(cur, generation, source, players, events)
+    return generation
+
+
+def current_generation(cur) -> Optional[int]:
+    """The newest ingest generation the transaction's snapshot sees (None if there are none)."""
+    if not table_exists(cur, 'ingest_generations'):
+        return None
+    cur.execute("SELECT MAX(generation) FROM ingest_generations")
+    return cur.fetchone()[0]
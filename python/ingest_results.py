@@ -2,13 +2,40 @@
 """
 Import MTG Pro Tour results from CSV to PostgreSQL database.
 Handles event and player creation, with dry-run mode for testing.
+The database is Postgres or a local SQLite file (see storage.py).
+
+By default the whole file is one transaction. With --batch-size N the
+import commits every N rows instead: each row runs in a savepoint, rows
+that fail are rolled back on their own and written to quarantine.csv with
+the error, and progress is checkpointed in ingest_checkpoints (see
+sql/create_ingest_checkpoints.sql) so a re-run resumes after the last
+committed row. Checkpoints belong to a job, named with --job (default:
+the CSV's file name); if the file was edited since, the re-run stops
+until it is told to --resume after the checkpoint or --restart.
+
+The player ratings are brought up to date (ratings.py) in the same
+transaction as the results (each batch's, with --batch-size), applying
+only the new or corrected events.
+
+Each transaction first takes advisory locks on the events and players its
+rows touch and records an ingest generation as it commits (see
+ingest_locks.py), so imports of different events can run side by side and
+an export running meanwhile sees each transaction whole or not at all.
 """
 
 import csv
+import hashlib
+import os
 import sys
-import psycopg2
 from datetime import datetime
-from typing import Optional, Dict, Tuple
+from typing import Iterable, Optional, Dict, List, Tuple
+
+from round_results import load_rounds, derive_results
+from validate_results import load_columns, validate_columns, write_report
+from aliases import load_aliases, resolve_alias
+from storage import open_storage, table_exists
+from ratings import update_ratings
+from ingest_locks import lock_keys, row_lock_keys, record_generation
 
 
 def parse_date(date_str: str) -> str:
@@ -70,11 +97,18 @@ def get_or_create_event(cur, event_name: str, event_date: str, event_format: str
         return new_id
 
 
-def get_or_create_player(cur, first_name: str, last_name: str, dry_run: bool = False) -> int:
+def get_or_create_player(cur, first_name: str, last_name: str, dry_run: bool = False,
+                         aliases: Optional[Dict] = None) -> int:
     """
     Get existing player or create new one.
+    Known name variants in `aliases` resolve without a query.
     Returns the player ID.
     """
+    alias_id = resolve_alias(aliases, first_name, last_name)
+    if alias_id is not None:
+        print(f"  Player '{first_name} {last_name}' resolved by alias (ID: {alias_id})", file=sys.stderr)
+        return alias_id
+
     # Check if player exists
     cur.execute("""
         SELECT id FROM players 
@@ -154,8 +188,15 @@ def insert_result(cur, event_id: int, player_id: int, row: Dict, dry_run: bool =
         print(f"  Inserted result for player ID {player_id} at event ID {event_id}", file=sys.stderr)
 
 
-def process_csv_row(cur, row: Dict, dry_run: bool = False) -> None:
-    """Process a single CSV row."""
+def process_csv_row(cur, row: Dict, dry_run: bool = False, derived: Optional[Dict] = None,
+                    aliases: Optional[Dict] = None, touched: Optional[Dict[str, set]] = None) -> None:
+    """
+    Process a single CSV row.
+    If `derived` is given (from round_results.derive_results), the match
+    aggregates are taken from it instead of the spreadsheet columns.
+    The event and player ids written are added to touched['events'] and
+    touched['players'], if given.
+    """
     # Skip blank rows
     if not row.get('Last', '').strip() and not row.get('First', '').strip():
         return
@@ -174,7 +215,7 @@ def process_csv_row(cur, row: Dict, dry_run: bool = False) -> None:
     actual_event_id = get_or_create_event(cur, event_name, event_date, event_format, event_id, dry_run)
     
     # Get or create player
-    player_id = get_or_create_player(cur, first_name, last_name, dry_run)
+    player_id = get_or_create_player(cur, first_name, last_name, dry_run, aliases)
     
     # Parse result data
     result_data = {
@@ -214,14 +255,246 @@ def process_csv_row(cur, row: Dict, dry_run: bool = False) -> None:
         'deck': row['Deck'].strip(),
         'notes': row.get('Notes', '').strip() if row.get('Notes', '').strip() else None
     }
+
+    # Prefer aggregates derived from round-by-round results
+    if derived is not None:
+        derived_row = derived.get((event_id, first_name, last_name))
+        if derived_row:
+            result_data.update(derived_row)
+        else:
+            print(f"  Warning: No round results for '{first_name} {last_name}' - using spreadsheet columns", file=sys.stderr)
     
     # Insert result
     insert_result(cur, actual_event_id, player_id, result_data, dry_run)
+    if touched is not None:
+        touched['events'].add(actual_event_id)
+        touched['players'].add(player_id)
+
+
+def file_hash(path: str) -> str:
+    """sha256 of the file contents; tells whether a job's file changed since its checkpoint."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_checkpoint(cur, job: str) -> Optional[Tuple[int, bool, str]]:
+    """(last committed row, completed, file hash) for a job, or None if it was never started."""
+    cur.execute("""
+        SELECT last_row, completed_at IS NOT NULL, file_hash FROM ingest_checkpoints
+        WHERE job = %s
+    """, (job,))
+    return cur.fetchone()
+
+
+def save_checkpoint(cur, job: str, digest: str, file_name: str, last_row: int, imported: int,
+                    quarantined: int, completed: bool = False) -> None:
+    """Record progress. Runs in the batch's transaction so it commits with the rows."""
+    cur.execute("""
+        INSERT INTO ingest_checkpoints (job, file_hash, file_name, last_row, rows_imported, rows_quarantined,
+                                        completed_at)
+        VALUES (%s, %s, %s, %s, %s, %s, CASE WHEN %s THEN CURRENT_TIMESTAMP END)
+        ON CONFLICT (job) DO UPDATE SET
+            file_hash = EXCLUDED.file_hash,
+            file_name = EXCLUDED.file_name,
+            last_row = EXCLUDED.last_row,
+            rows_imported = ingest_checkpoints.rows_imported + EXCLUDED.rows_imported,
+            rows_quarantined = ingest_checkpoints.rows_quarantined + EXCLUDED.rows_quarantined,
+            completed_at = EXCLUDED.completed_at,
+            updated_at = CURRENT_TIMESTAMP
+    """, (job, digest, file_name, last_row, imported, quarantined, completed))
+
+
+def process_row_isolated(cur, row: Dict, derived: Optional[Dict] = None,
+                         aliases: Optional[Dict] = None, touched: Optional[Dict[str, set]] = None) -> Optional[str]:
+    """
+    Process one row inside a savepoint.
+    Returns None on success, or the error message after rolling back
+    only this row's changes.
+    """
+    cur.execute("SAVEPOINT ingest_row")
+    try:
+        process_csv_row(cur, row, False, derived, aliases, touched)
+    except Exception as e:
+        cur.execute("ROLLBACK TO SAVEPOINT ingest_row")
+        return f"{type(e).__name__}: {e}".strip()
+    cur.execute("RELEASE SAVEPOINT ingest_row")
+    return None
+
+
+def write_quarantine(path: str, fieldnames: List[str], entries: List[Tuple[int, str, Dict]], append: bool) -> None:
+    """Write failed rows as the original columns plus Row and Error, and fsync them."""
+    new_file = not append or not os.path.exists(path)
+    with open(path, 'a' if append else 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['Row', 'Error'] + fieldnames, extrasaction='ignore')
+        if new_file:
+            writer.writeheader()
+        for row_number, error, row in entries:
+            writer.writerow({'Row': row_number, 'Error': error, **row})
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def trim_quarantine(path: str, last_row: int) -> int:
+    """
+    Drop quarantined rows after last_row: rows of a batch that was written
+    but never committed, which the resumed import processes again.
+    Returns how many were dropped.
+    """
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        entries = list(csv.reader(f))
+    if not entries:
+        return 0
+    # A row cut off by the crash is past the checkpoint too
+    kept = [entries[0]] + [entry for entry in entries[1:]
+                           if entry and entry[0].isdigit() and int(entry[0]) <= last_row]
+    dropped = len(entries) - len(kept)
+    if dropped:
+        with open(path + '.tmp', 'w', encoding='utf-8', newline='') as f:
+            csv.writer(f).writerows(kept)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + '.tmp', path)
+    return dropped
+
+
+def import_batched(conn, cur, csv_file: str, quarantine_file: str, batch_size: int,
+                   limit: Optional[int], restart: bool, derived: Optional[Dict],
+                   aliases: Optional[Dict], job: Optional[str] = None, resume: bool = False) -> set:
+    """
+    Import in committed batches with per-row savepoints, resuming from the
+    job's checkpoint (the job defaults to the file name). If the file
+    changed since the checkpoint, nothing is imported unless resume is set,
+    which continues after the checkpointed row (e.g. after fixing a later
+    row, or rows appended to a completed sheet). Failed rows are written
+    and fsynced to quarantine_file before their batch commits, and a resume
+    first drops the file's rows after the checkpoint, so a crash neither
+    loses a committed batch's failed rows nor records them twice. Returns
+    the ids of the events rows went into.
+    """
+    if not table_exists(cur, 'ingest_checkpoints'):
+        raise RuntimeError("ingest_checkpoints table not found (run sql/create_ingest_checkpoints.sql)")
+    cur.execute("SELECT * FROM ingest_checkpoints LIMIT 0")
+    if 'job' not in [d[0] for d in cur.description]:
+        raise RuntimeError("ingest_checkpoints has no job column (run sql/alter_ingest_checkpoints.sql, "
+                           "or python storage.py init <path> for a SQLite file)")
+
+    digest = file_hash(csv_file)
+    file_name = os.path.basename(csv_file)
+    job = job or file_name
+    if restart:
+        cur.execute("DELETE FROM ingest_checkpoints WHERE job = %s", (job,))
+        conn.commit()
+
+    checkpoint = load_checkpoint(cur, job)
+    start_after = 0
+    if checkpoint:
+        start_after, completed, checkpoint_hash = checkpoint
+        if checkpoint_hash != digest:
+            if not resume:
+                raise RuntimeError(
+                    f"{file_name} changed since job '{job}' was checkpointed at row {start_after}"
+                    f"{' (completed)' if completed else ''}. Re-run with --resume to continue after row "
+                    f"{start_after}, --restart to import every row again, or --job NAME for a new job")
+            print(f"⚠ {file_name} changed since the checkpoint; continuing after row {start_after}", file=sys.stderr)
+        elif completed:
+            print(f"✓ {file_name} was already imported completely (use --restart to import it again)", file=sys.stderr)
+            return set()
+        print(f"Resuming job '{job}' after row {start_after}", file=sys.stderr)
+        dropped = trim_quarantine(quarantine_file, start_after)
+        if dropped:
+            print(f"  Dropped {dropped} quarantined row(s) of an uncommitted batch", file=sys.stderr)
+
+    total_imported = total_quarantined = 0
+    batch_imported = 0
+    quarantined = []
+    touched = {'players': set(), 'events': set()}
+    event_ids = set()
+    rows_processed = 0
+    row_number = start_after
+    append_quarantine = start_after > 0
+
+    def commit_batch(completed: bool = False):
+        nonlocal batch_imported, quarantined, append_quarantine, touched
+        event_ids.update(touched['events'])
+        save_checkpoint(cur, job, digest, file_name, row_number, batch_imported, len(quarantined), completed)
+        # Ratings commit with the batch's results, so an export never sees one without the other
+        refresh_ratings(cur, touched['events'])
+        record_generation(cur, f"{file_name} through row {row_number}", touched['players'], touched['events'])
+        # Durable before the checkpoint is; a resume trims rows past the checkpoint
+        if quarantined:
+            write_quarantine(quarantine_file, fieldnames, quarantined, append_quarantine)
+            append_quarantine = True
+        conn.commit()
+        print(f"  Committed through row {row_number} ({batch_imported} imported, "
+              f"{len(quarantined)} quarantined)", file=sys.stderr)
+        batch_imported = 0
+        quarantined = []
+        touched = {'players': set(), 'events': set()}
+
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames or []
+        pending = [(number, row) for number, row in enumerate(reader, start=1) if number > start_after]
+    reached_limit = bool(limit) and len(pending) >= limit
+    if reached_limit:
+        pending = pending[:limit]
+
+    for batch_start in range(0, len(pending), batch_size):
+        batch = pending[batch_start:batch_start + batch_size]
+        # All of the batch's locks before its first row, in a fixed order
+        lock_keys(cur, row_lock_keys(row for _, row in batch))
+        for row_number, row in batch:
+            rows_processed += 1
+
+            print(f"\n{'='*60}", file=sys.stderr)
+            print(f"Processing row {row_number}: {row.get('First')} {row.get('Last')}", file=sys.stderr)
+            print(f"{'='*60}", file=sys.stderr)
+
+            error = process_row_isolated(cur, row, derived, aliases, touched)
+            if error:
+                print(f"  ✗ Quarantined row {row_number}: {error}", file=sys.stderr)
+                quarantined.append((row_number, error, row))
+                total_quarantined += 1
+            else:
+                batch_imported += 1
+                total_imported += 1
+
+        last_batch = batch_start + batch_size >= len(pending)
+        if last_batch and reached_limit:
+            print(f"\nReached limit of {limit} rows", file=sys.stderr)
+        commit_batch(completed=last_batch and not reached_limit)
+    if not pending:
+        commit_batch(completed=True)
+
+    print(f"\n✓ Imported {total_imported} result(s) in batches of {batch_size}", file=sys.stderr)
+    if total_quarantined:
+        print(f"⚠ {total_quarantined} row(s) quarantined to {quarantine_file}", file=sys.stderr)
+    return event_ids
+
+
+def refresh_ratings(cur, event_ids: Iterable[int]) -> bool:
+    """
+    Apply the results imported into event_ids to the player ratings, if
+    the ratings tables exist (caller commits). Returns whether anything
+    changed.
+    """
+    if not table_exists(cur, 'player_ratings'):
+        return False
+    summary = update_ratings(cur, event_ids=event_ids)
+    if summary['replayed']:
+        print(f"✓ Ratings updated: replayed {summary['replayed']} of {summary['events']} event(s)", file=sys.stderr)
+    return bool(summary['replayed'] or summary['players'])
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python import_results.py <db_connection_string> [--dry-run] [--limit N]")
+        print("Usage: python import_results.py <db_connection_string> [--dry-run] [--limit N] [--rounds FILE] [--skip-validation]")
+        print("                                  [--batch-size N [--job NAME] [--resume | --restart]]")
         print("\nThe script will read from 'data.csv' in the same directory.")
         print("\nExamples:")
         print("  # Dry run - print SQL for first row only")
@@ -232,10 +505,22 @@ def main():
         print()
         print("  # Process first 10 rows")
         print("  python import_results.py 'dbname=mtg user=postgres' --limit 10")
+        print()
+        print("  # Derive streaks, day splits and draft records from round-by-round results")
+        print("  python import_results.py 'dbname=mtg user=postgres' --rounds rounds.csv")
+        print()
+        print("  # Load into a local SQLite file instead (python storage.py init local.db)")
+        print("  python import_results.py local.db")
+        print()
+        print("  # Commit every 500 rows, quarantine failing rows, resume on re-run")
+        print("  python import_results.py 'dbname=mtg user=postgres' --batch-size 500")
+        print()
+        print("The sheet is validated before any database write; problems are written")
+        print("to 'validation-errors.csv' and the import stops unless --skip-validation is given.")
+        print("In batch mode rows that fail to import are written to 'quarantine.csv'.")
         sys.exit(1)
     
     # Hardcoded CSV file path - must be in same directory as script
-    import os
     script_dir = os.path.dirname(os.path.abspath(__file__))
     csv_file = os.path.join(script_dir, 'data.csv')
     
@@ -243,11 +528,32 @@ def main():
     
     # Parse optional flags
     dry_run = '--dry-run' in sys.argv
+    skip_validation = '--skip-validation' in sys.argv
     limit = None
     if '--limit' in sys.argv:
         limit_idx = sys.argv.index('--limit')
         if limit_idx + 1 < len(sys.argv):
             limit = int(sys.argv[limit_idx + 1])
+    batch_size = None
+    if '--batch-size' in sys.argv:
+        batch_idx = sys.argv.index('--batch-size')
+        if batch_idx + 1 < len(sys.argv):
+            batch_size = max(1, int(sys.argv[batch_idx + 1]))
+    if batch_size and dry_run:
+        print("Note: --batch-size is ignored in dry-run mode", file=sys.stderr)
+        batch_size = None
+    restart = '--restart' in sys.argv
+    resume = '--resume' in sys.argv
+    job = None
+    if '--job' in sys.argv:
+        job_idx = sys.argv.index('--job')
+        if job_idx + 1 < len(sys.argv):
+            job = sys.argv[job_idx + 1]
+    rounds_file = None
+    if '--rounds' in sys.argv:
+        rounds_idx = sys.argv.index('--rounds')
+        if rounds_idx + 1 < len(sys.argv):
+            rounds_file = sys.argv[rounds_idx + 1]
     
     # Default to 1 row for dry run
     if dry_run and limit is None:
@@ -256,39 +562,100 @@ def main():
     print(f"Processing CSV: {csv_file}", file=sys.stderr)
     print(f"Dry run: {dry_run}", file=sys.stderr)
     print(f"Limit: {limit if limit else 'None'}", file=sys.stderr)
+    if batch_size:
+        print(f"Batch size: {batch_size}", file=sys.stderr)
     print("", file=sys.stderr)
+
+    # Derive match aggregates up front so a bad rounds file fails before connecting
+    derived = None
+    if rounds_file:
+        try:
+            derived = derive_results(load_rounds(rounds_file))
+            print(f"Derived results for {len(derived)} player(s) from {rounds_file}", file=sys.stderr)
+            print("", file=sys.stderr)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Error reading rounds file: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    # Validate the whole sheet before touching the database
+    if not skip_validation:
+        columns = load_columns(csv_file)
+        errors = validate_columns(columns, check_derived=derived is None)
+        if errors:
+            report_file = os.path.join(script_dir, 'validation-errors.csv')
+            with open(report_file, 'w', encoding='utf-8', newline='') as f:
+                write_report(errors, columns, f)
+            bad_rows = len({line for line, _, _, _ in errors})
+            print(f"✗ Validation found {len(errors)} problem(s) on {bad_rows} row(s)", file=sys.stderr)
+            for line, _, check, message in errors[:10]:
+                print(f"  line {line}: [{check}] {message}", file=sys.stderr)
+            if len(errors) > 10:
+                print(f"  ... and {len(errors) - 10} more", file=sys.stderr)
+            print(f"\nFull report written to {report_file}", file=sys.stderr)
+            print("Fix the sheet or re-run with --skip-validation", file=sys.stderr)
+            sys.exit(1)
+        print(f"✓ Validated {len(columns['_line'])} row(s)", file=sys.stderr)
+        print("", file=sys.stderr)
     
     # Connect to database
     try:
-        conn = psycopg2.connect(db_conn_string)
+        conn = open_storage(db_conn_string)
         cur = conn.cursor()
         print("Connected to database successfully", file=sys.stderr)
+        aliases = load_aliases(cur)
+        print(f"Loaded {len(aliases)} name alias(es)", file=sys.stderr)
     except Exception as e:
         print(f"Error connecting to database: {e}", file=sys.stderr)
         sys.exit(1)
     
+    if batch_size:
+        try:
+            import_batched(conn, cur, csv_file, os.path.join(script_dir, 'quarantine.csv'),
+                           batch_size, limit, restart, derived, aliases, job, resume)
+        except Exception as e:
+            # Only the uncommitted batch is lost; a re-run resumes from the checkpoint
+            conn.rollback()
+            print(f"\n✗ Error processing CSV: {e}", file=sys.stderr)
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
+        finally:
+            cur.close()
+            conn.close()
+        return
+
     try:
         # Read and process CSV
         with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            rows_processed = 0
-            for row in reader:
-                rows_processed += 1
-                
-                print(f"\n{'='*60}", file=sys.stderr)
-                print(f"Processing row {rows_processed}: {row['First']} {row['Last']}", file=sys.stderr)
-                print(f"{'='*60}", file=sys.stderr)
-                
-                process_csv_row(cur, row, dry_run)
-                
-                if limit and rows_processed >= limit:
-                    print(f"\nReached limit of {limit} rows", file=sys.stderr)
-                    break
+            rows = list(csv.DictReader(f))
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+
+        if not dry_run:
+            # Every event and player the file touches, before the first row
+            lock_keys(cur, row_lock_keys(rows))
+
+        rows_processed = 0
+        touched = {'players': set(), 'events': set()}
+        for row in rows:
+            rows_processed += 1
+
+            print(f"\n{'='*60}", file=sys.stderr)
+            print(f"Processing row {rows_processed}: {row['First']} {row['Last']}", file=sys.stderr)
+            print(f"{'='*60}", file=sys.stderr)
+
+            process_csv_row(cur, row, dry_run, derived, aliases, touched)
+
+        if limit and rows_processed >= limit:
+            print(f"\nReached limit of {limit} rows", file=sys.stderr)
         
         if not dry_run:
+            # Ratings commit with the results, so an export never sees one without the other
+            refresh_ratings(cur, touched['events'])
+            generation = record_generation(cur, os.path.basename(csv_file), touched['players'], touched['events'])
             conn.commit()
-            print(f"\n✓ Successfully imported {rows_processed} result(s)", file=sys.stderr)
+            print(f"\n✓ Successfully imported {rows_processed} result(s)"
+                  + (f" (generation {generation})" if generation else ''), file=sys.stderr)
         else:
             print(f"\n✓ Dry run complete - processed {rows_processed} row(s)", file=sys.stderr)
             print("  (No changes were made to the database)", file=sys.stderr)
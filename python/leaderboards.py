@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Precomputed Top-N leaderboards for the standard filter presets.
+
+For every rankable stat crossed with every preset (all players, 4+ events,
+SOS qualified, has a Top 8, and one per format) the artifact stores:
+  total   players in the ranked pool (calculatePlayerRank's totalPlayers)
+  top     [[player_id, value, rank], ...] for the best TOP_N players, in
+          Top10Panel order
+  ranks   [[value, rank], ...] one entry per distinct value, best first,
+          so any player's rank in the pool is a binary search on their
+          own value instead of a sort of the whole pool
+
+Order and ranks follow rankingUtils.ts (stable descending sort, standard
+competition ranking); --verify recomputes every list with the direct port
+in rankings.py and reports any difference.
+
+Usage:
+  python leaderboards.py [export.json] [--out leaderboards.json] [--verify]
+"""
+
+import json
+import os
+import sys
+import time
+import numpy as np
+from typing import Dict, List, Optional
+
+from rankings import (
+    RANKABLE_STATS, players_from_export, stat_value, stat_columns,
+    filter_mask, rank_column, apply_filters, sort_players, calculate_player_rank,
+)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_EXPORT = os.path.join(SCRIPT_DIR, '..', 'src', 'data', 'data.json')
+
+LEADERBOARDS_VERSION = 1
+TOP_N = 10
+
+BASE_PRESETS = {
+    'all': {},
+    'min4events': {'minEvents': 4},
+    'sos': {'SosPlayersOnly': True},
+    'has_top8': {'hasTop8': True},
+}
+
+
+def build_presets(export: Dict) -> Dict[str, Dict]:
+    """Base presets plus one 'format:<name>' preset per format in the export."""
+    presets = dict(BASE_PRESETS)
+    formats = {event.get('format') for event in (export.get('events') or {}).values()}
+    for player in (export.get('players') or {}).values():
+        formats.update(event.get('format') for event in player['events'].values())
+    for fmt in sorted(f for f in formats if f):
+        presets[f'format:{fmt}'] = {'formats': [fmt]}
+    return presets
+
+
+def build_leaderboards(export: Dict, top_n: int = TOP_N) -> Dict:
+    players = players_from_export(export)
+    columns = stat_columns(players, RANKABLE_STATS, export.get('formats'))
+    presets = build_presets(export)
+
+    boards = {}
+    for name, filters in presets.items():
+        mask = filter_mask(players, columns, filters)
+        boards[name] = {}
+        for stat_key in RANKABLE_STATS:
+            order, ranks = rank_column(columns[stat_key], mask)
+            # Original values from the export so ints stay ints in the JSON
+            top = [
+                [players[i]['id'], stat_value(players[i], stat_key), int(rank)]
+                for i, rank in zip(order[:top_n], ranks[:top_n])
+            ]
+            # First player of each distinct value
+            distinct = np.flatnonzero(np.diff(ranks, prepend=0))
+            boards[name][stat_key] = {
+                'total': int(len(order)),
+                'top': top,
+                'ranks': [[stat_value(players[order[k]], stat_key), int(ranks[k])] for k in distinct],
+            }
+
+    return {
+        'version': LEADERBOARDS_VERSION,
+        'top_n': top_n,
+        'presets': presets,
+        'boards': boards,
+    }
+
+
+def lookup_rank(board: Dict, value) -> Optional[int]:
+    """Rank of a player with `value` in a board's pool (None if no player has that value)."""
+    ranks = board['ranks']
+    lo, hi = 0, len(ranks)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if ranks[mid][0] > value:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo < len(ranks) and ranks[lo][0] == value:
+        return ranks[lo][1]
+    return None
+
+
+def verify(export: Dict, leaderboards: Dict) -> List[str]:
+    """Differences between the artifact and rankingUtils semantics (empty when they agree)."""
+    players = players_from_export(export)
+    problems = []
+    for name, filters in leaderboards['presets'].items():
+        pool = apply_filters(players, filters)
+        for stat_key in RANKABLE_STATS:
+            board = leaderboards['boards'][name][stat_key]
+            ranked = sort_players(pool, stat_key)
+            label = f"{name}/{stat_key}"
+
+            if board['total'] != len(ranked):
+                problems.append(f"{label}: total {board['total']} != {len(ranked)}")
+
+            expected = []
+            for player in ranked[:leaderboards['top_n']]:
+                rank = calculate_player_rank(pool, player, stat_key)['rank']
+                expected.append([player['id'], stat_value(player, stat_key), rank])
+            if board['top'] != expected:
+                problems.append(f"{label}: top list differs\n    got      {board['top']}\n    expected {expected}")
+
+            # Every player's rank via the threshold table (one pass instead of calculatePlayerRank per player)
+            previous, rank = None, 0
+            for i, player in enumerate(ranked):
+                value = stat_value(player, stat_key)
+                if i == 0 or value != previous:
+                    rank = i + 1
+                previous = value
+                if lookup_rank(board, value) != rank:
+                    problems.append(f"{label}: {player['id']} rank {lookup_rank(board, value)} != {rank}")
+                    break
+    return problems
+
+
+def main():
+    export_path = DEFAULT_EXPORT
+    out_path = None
+
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    if '--out' in sys.argv:
+        out_idx = sys.argv.index('--out')
+        if out_idx + 1 < len(sys.argv):
+            out_path = sys.argv[out_idx + 1]
+            args = [a for a in args if a != out_path]
+    if args:
+        export_path = args[0]
+
+    with open(export_path, 'r', encoding='utf-8') as f:
+        export = json.load(f)
+
+    start = time.perf_counter()
+    leaderboards = build_leaderboards(export)
+    print(f"Built {len(leaderboards['presets'])} presets x {len(RANKABLE_STATS)} stats "
+          f"in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+    if out_path:
+        with open(out_path, 'w', encoding='utf-8') as f:
+            json.dump(leaderboards, f, ensure_ascii=False, separators=(',', ':'))
+        print(f"Wrote {out_path}", file=sys.stderr)
+
+    if '--verify' in sys.argv:
+        start = time.perf_counter()
+        problems = verify(export, leaderboards)
+        elapsed = time.perf_counter() - start
+        if problems:
+            for problem in problems:
+                print(f"✗ {problem}", file=sys.stderr)
+            print(f"\n✗ {len(problems)} differences from rankingUtils ({elapsed:.2f}s)", file=sys.stderr)
+            sys.exit(1)
+        print(f"✓ Leaderboards match rankingUtils ({elapsed:.2f}s)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
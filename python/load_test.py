@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Load test for api_server.py: fires a mix of player, search, event and
+leaderboard requests from concurrent workers and reports latency
+percentiles.
+
+Usage:
+  python load_test.py [--url http://127.0.0.1:8000] [--concurrency 16] [--requests 5000]
+"""
+
+import json
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError
+from urllib.parse import quote
+from urllib.request import urlopen
+
+from rankings import RANKABLE_STATS
+
+FILTER_PRESETS = [
+    '',
+    'minEvents=4',
+    'SosPlayersOnly=true',
+    'hasTop8=true',
+    'formats=Standard',
+    'formats=Modern,Pioneer&minEvents=2',
+]
+
+
+def fetch(url: str):
+    with urlopen(url, timeout=30) as response:
+        return json.loads(response.read())
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def build_paths(base_url: str, count: int):
+    """A random request mix using ids and names taken from the running server."""
+    sample = fetch(f"{base_url}/leaderboards/events?limit=100")['entries']
+    if not sample:
+        print("Server has no players to query", file=sys.stderr)
+        sys.exit(1)
+    player_ids = [entry['player_id'] for entry in sample]
+    names = [entry['player_full_name'] for entry in sample]
+    event_codes = set()
+    for player_id in player_ids[:20]:
+        for event in fetch(f"{base_url}/players/{player_id}")['events'].values():
+            event_codes.add(event['event_code'])
+    event_codes = sorted(event_codes) or ['none']
+
+    paths = []
+    for _ in range(count):
+        kind = random.random()
+        if kind < 0.3:
+            paths.append(f"/players/{random.choice(player_ids)}")
+        elif kind < 0.55:
+            name = random.choice(names)
+            paths.append(f"/players/search?q={quote(name[:random.randint(1, len(name))])}")
+        elif kind < 0.7:
+            paths.append(f"/events/{quote(random.choice(event_codes))}")
+        else:
+            stat = random.choice(RANKABLE_STATS)
+            preset = random.choice(FILTER_PRESETS)
+            player = random.choice(player_ids)
+            paths.append(f"/leaderboards/{quote(stat)}?limit=10&player={player}&{preset}")
+    return paths
+
+
+def timed_get(url: str):
+    start = time.perf_counter()
+    try:
+        with urlopen(url, timeout=30) as response:
+            response.read()
+            status = response.status
+    except HTTPError as e:
+        status = e.code
+    return (time.perf_counter() - start) * 1000, status
+
+
+def main():
+    base_url = 'http://127.0.0.1:8000'
+    concurrency = 16
+    num_requests = 5000
+
+    if '--url' in sys.argv:
+        url_idx = sys.argv.index('--url')
+        if url_idx + 1 < len(sys.argv):
+            base_url = sys.argv[url_idx + 1].rstrip('/')
+    if '--concurrency' in sys.argv:
+        conc_idx = sys.argv.index('--concurrency')
+        if conc_idx + 1 < len(sys.argv):
+            concurrency = int(sys.argv[conc_idx + 1])
+    if '--requests' in sys.argv:
+        req_idx = sys.argv.index('--requests')
+        if req_idx + 1 < len(sys.argv):
+            num_requests = int(sys.argv[req_idx + 1])
+
+    status = fetch(f"{base_url}/status")
+    print(f"Server: {status['players']} players, {status['events']} events (generation {status['generation']})")
+
+    paths = build_paths(base_url, num_requests)
+    print(f"Running {num_requests} requests with {concurrency} workers...")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(timed_get, [base_url + path for path in paths]))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(ms for ms, _ in results)
+    errors = sum(1 for _, code in results if code >= 500)
+
+    print()
+    print(f"Throughput: {num_requests / elapsed:.0f} req/s ({elapsed:.2f}s total)")
+    print(f"Server errors: {errors}")
+    print(f"Latency p50: {percentile(latencies, 50):.2f} ms")
+    print(f"Latency p95: {percentile(latencies, 95):.2f} ms")
+    print(f"Latency p99: {percentile(latencies, 99):.2f} ms")
+    print(f"Latency max: {latencies[-1]:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
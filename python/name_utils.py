@@ -0,0 +1,110 @@
+"""
+Player name normalization shared by the ingest, matching and export scripts.
+Mirrors normalizeText in SearchBar.tsx (strip accents, lowercase) and adds
+nickname and phonetic keys used to find likely duplicates. Letters of
+every script are kept; the Latin letters that carry no separate accent
+(ø, ł, æ, ...) are spelled out so they match the plain spelling.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Tuple
+
+# Nickname -> canonical first name. Both sides are normalized.
+NICKNAMES = {
+    'jon': 'jonathan', 'jonny': 'jonathan', 'johnny': 'john', 'jack': 'john',
+    'alex': 'alexander', 'alexandre': 'alexander', 'sasha': 'alexander',
+    'andy': 'andrew', 'drew': 'andrew',
+    'ben': 'benjamin', 'benji': 'benjamin',
+    'bill': 'william', 'billy': 'william', 'will': 'william', 'willy': 'william',
+    'bob': 'robert', 'bobby': 'robert', 'rob': 'robert', 'robbie': 'robert',
+    'chris': 'christopher', 'kris': 'christopher', 'topher': 'christopher',
+    'dan': 'daniel', 'danny': 'daniel',
+    'dave': 'david', 'davey': 'david',
+    'ed': 'edward', 'eddie': 'edward', 'ted': 'edward',
+    'fred': 'frederick', 'freddie': 'frederick',
+    'greg': 'gregory',
+    'jake': 'jacob', 'jim': 'james', 'jimmy': 'james', 'jamie': 'james',
+    'jeff': 'jeffrey', 'geoff': 'jeffrey', 'geoffrey': 'jeffrey',
+    'joe': 'joseph', 'joey': 'joseph',
+    'josh': 'joshua',
+    'ken': 'kenneth', 'kenny': 'kenneth',
+    'larry': 'lawrence', 'laurence': 'lawrence',
+    'matt': 'matthew', 'mat': 'matthew', 'mathew': 'matthew',
+    'mike': 'michael', 'mikey': 'michael', 'mick': 'michael', 'mickey': 'michael',
+    'nate': 'nathan', 'nathaniel': 'nathan',
+    'nick': 'nicholas', 'nicky': 'nicholas', 'nicolas': 'nicholas', 'nico': 'nicholas',
+    'pat': 'patrick', 'paddy': 'patrick',
+    'pete': 'peter',
+    'phil': 'philip', 'phillip': 'philip',
+    'rich': 'richard', 'rick': 'richard', 'ricky': 'richard', 'dick': 'richard',
+    'sam': 'samuel', 'sammy': 'samuel',
+    'steve': 'steven', 'stephen': 'steven', 'stevie': 'steven',
+    'tom': 'thomas', 'tommy': 'thomas', 'tomas': 'thomas',
+    'tim': 'timothy', 'timmy': 'timothy',
+    'tony': 'anthony',
+    'zach': 'zachary', 'zack': 'zachary', 'zak': 'zachary',
+}
+
+# Anything but letters and digits, in any script
+_NON_WORD = re.compile(r'[\W_]+')
+# Letters NFD doesn't split into a base letter and an accent (ß casefolds to ss)
+_LETTERS = str.maketrans({'ø': 'o', 'ł': 'l', 'đ': 'd', 'ð': 'd', 'ħ': 'h', 'ŧ': 't', 'ı': 'i',
+                          'æ': 'ae', 'œ': 'oe', 'þ': 'th'})
+_SPACES = re.compile(r'\s+')
+_VOWELS = re.compile(r'[aeiouyhw]')
+
+
+def strip_accents(text: str) -> str:
+    """Remove combining accent marks (the Python equivalent of unaccent)."""
+    if text.isascii():
+        return text
+    stripped = ''.join(
+        c for c in unicodedata.normalize('NFD', text)
+        if not unicodedata.combining(c)
+    )
+    # Recompose what NFD split without an accent (e.g. Hangul syllables)
+    return unicodedata.normalize('NFC', stripped)
+
+
+@lru_cache(maxsize=1 << 16)
+def normalize_name(text: str) -> str:
+    """Casefold, strip accents and punctuation, collapse whitespace."""
+    text = strip_accents(text or '').casefold().translate(_LETTERS)
+    text = _NON_WORD.sub(' ', text.replace("'", ''))
+    return _SPACES.sub(' ', text).strip()
+
+
+def canonical_first_name(first_name: str) -> str:
+    """Normalized first name with common nicknames mapped to their full form."""
+    normalized = normalize_name(first_name)
+    return NICKNAMES.get(normalized, normalized)
+
+
+def phonetic_key(text: str) -> str:
+    """
+    Coarse sound-alike key: first letter plus the remaining consonants
+    with repeats collapsed, so 'Smith'/'Smyth' and 'Nielsen'/'Nielson' match.
+    """
+    normalized = normalize_name(text).replace(' ', '')
+    if not normalized:
+        return ''
+    rest = _VOWELS.sub('', normalized[1:])
+    collapsed = []
+    for c in rest:
+        if not collapsed or collapsed[-1] != c:
+            collapsed.append(c)
+    return normalized[0] + ''.join(collapsed)
+
+
+def name_key(first_name: str, last_name: str) -> Tuple[str, str]:
+    """
+    Accent- and case-insensitive identity of a name. ValueError for a name
+    with nothing to match on (blank, or a part that is only punctuation or
+    symbols), whose key would equal every other such name's.
+    """
+    key = (normalize_name(first_name), normalize_name(last_name))
+    if not any(key) or any((part or '').strip() and not k for part, k in zip((first_name, last_name), key)):
+        raise ValueError(f"'{first_name} {last_name}' has no letters or digits to match on")
+    return key
@@ -0,0 +1,297 @@
+"""
+Python port of src/components/shared/rankingUtils.ts.
+Players use the same shape as the TS `Player` type:
+{'id': 'entry_N', 'fullName': ..., 'data': <players entry from data.json>}.
+Any change to the filtering or ranking rules must be made in both places.
+
+The *_columns / *_filter / filter_mask / rank_column functions are
+columnar versions of the same rules for batch work (precomputed
+leaderboards); they must give the same answers as the per-player
+functions.
+
+The format and date filters read the player's filter_keys (see
+export_builder.py) when the export has them, as applyFilters does, so
+they cost O(players) instead of a scan of every player's events:
+  formats     some selected format has a format_counts entry
+  startDate   last_date >= startDate (some event on or after it)
+  endDate     first_date <= endDate (some event on or before it)
+Exports without filter_keys fall back to scanning the events.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional
+
+RANKABLE_STATS = [
+    'events',
+    'day2s',
+    'in_contentions',
+    'top8s',
+    'overall_wins',
+    'overall_win_pct',
+    'limited_wins',
+    'limited_win_pct',
+    'constructed_wins',
+    'constructed_win_pct',
+    'day1_win_pct',
+    'day2_win_pct',
+    'day3_win_pct',
+    'drafts',
+    'winning_drafts_pct',
+    'trophy_drafts',
+    '5streaks',
+    'rating',
+]
+
+# FilterOptions keys and how to read them from a query string
+INT_FILTERS = ('minEvents', 'minDay2s', 'maxEvents', 'minTop8s')
+BOOL_FILTERS = ('hasTop8', 'SosPlayersOnly')
+DATE_FILTERS = ('startDate', 'endDate')
+
+
+def players_from_export(export: Dict) -> List[Dict]:
+    """Build the player list the same way PlayerStatsApp does."""
+    return [
+        {'id': key, 'fullName': data['player_info']['full_name'], 'data': data}
+        for key, data in (export.get('players') or {}).items()
+    ]
+
+
+def stat_value(player: Dict, stat_key: str):
+    stat = player['data']['stats'].get(stat_key)
+    return stat.get('value') if stat else None
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def apply_filters(players: List[Dict], filters: Dict) -> List[Dict]:
+    """Same rules as applyFilters."""
+    def keep(player: Dict) -> bool:
+        stats = player['data']['stats']
+
+        if filters.get('minEvents') is not None and stats['events']['value'] < filters['minEvents']:
+            return False
+        if filters.get('minDay2s') is not None and stats['day2s']['value'] < filters['minDay2s']:
+            return False
+        if filters.get('maxEvents') is not None and stats['events']['value'] > filters['maxEvents']:
+            return False
+        if filters.get('minTop8s') is not None and stats['top8s']['value'] < filters['minTop8s']:
+            return False
+        if filters.get('hasTop8') and stats['top8s']['value'] == 0:
+            return False
+        if filters.get('SosPlayersOnly') and not player['data']['player_info'].get('sos_qualification'):
+            return False
+
+        keys = player['data'].get('filter_keys')
+        if keys is not None:
+            if filters.get('formats') and not any(keys['format_counts'].get(f) for f in filters['formats']):
+                return False
+            start, end = filters.get('startDate'), filters.get('endDate')
+            if start and not (keys['last_date'] is not None and keys['last_date'] >= start):
+                return False
+            if end and not (keys['first_date'] is not None and keys['first_date'] <= end):
+                return False
+            return True
+
+        events = player['data']['events'].values()
+        if filters.get('formats'):
+            player_formats = {event.get('format') for event in events}
+            if not any(f in player_formats for f in filters['formats']):
+                return False
+
+        # Events without a date never satisfy a date bound (undefined >= x is false in JS)
+        if filters.get('startDate') or filters.get('endDate'):
+            dates = [event['date'] for event in events if event.get('date')]
+            if filters.get('startDate') and not any(d >= filters['startDate'] for d in dates):
+                return False
+            if filters.get('endDate') and not any(d <= filters['endDate'] for d in dates):
+                return False
+
+        return True
+
+    return [player for player in players if keep(player)]
+
+
+def sort_players(players: List[Dict], stat_key: str) -> List[Dict]:
+    """Same as sortPlayers: drop missing values, stable sort descending."""
+    valid = [p for p in players if stat_value(p, stat_key) is not None]
+    if all(_is_number(stat_value(p, stat_key)) for p in valid):
+        return sorted(valid, key=lambda p: -stat_value(p, stat_key))
+    return valid
+
+
+def calculate_player_rank(players: List[Dict], selected_player: Dict, stat_key: str) -> Optional[Dict]:
+    """
+    Same as calculatePlayerRank: 1 + number of players ranked above with a
+    different value (standard competition ranking, 1-2-2-4).
+    """
+    if not selected_player or not stat_key:
+        return None
+    value = stat_value(selected_player, stat_key)
+    if value is None:
+        return None
+
+    ranked = sort_players(players, stat_key)
+    index = next((i for i, p in enumerate(ranked) if p['id'] == selected_player['id']), -1)
+    if index < 0:
+        return None
+
+    rank = 1 + sum(1 for p in ranked[:index] if stat_value(p, stat_key) != value)
+    return {'rank': rank, 'totalPlayers': len(ranked)}
+
+
+def competition_ranks(values: List) -> List[int]:
+    """Ranks for an already sorted (descending) list of values, as calculatePlayerRank gives them."""
+    ranks = []
+    for i, value in enumerate(values):
+        if i > 0 and value == values[i - 1]:
+            ranks.append(ranks[-1])
+        else:
+            ranks.append(i + 1)
+    return ranks
+
+
+def is_rankable_stat(stat_key: str) -> bool:
+    return stat_key in RANKABLE_STATS
+
+
+def parse_filters(params: Dict[str, str]) -> Dict:
+    """Read FilterOptions from query-string style {name: value} pairs."""
+    filters = {}
+    for name in INT_FILTERS:
+        if params.get(name, '') != '':
+            filters[name] = int(params[name])
+    for name in BOOL_FILTERS:
+        if params.get(name, '').lower() in ('1', 'true', 'yes'):
+            filters[name] = True
+    for name in DATE_FILTERS:
+        if params.get(name):
+            filters[name] = params[name]
+    if params.get('formats'):
+        filters['formats'] = [f.strip() for f in params['formats'].split(',') if f.strip()]
+    return filters
+
+
+def filters_key(filters: Dict) -> tuple:
+    """Hashable, order-independent form of a filter dict (for caching)."""
+    return tuple(sorted(
+        (name, tuple(sorted(value)) if isinstance(value, list) else value)
+        for name, value in filters.items()
+    ))
+
+
+def stat_columns(players: List[Dict], stat_keys: List[str],
+                 formats: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+    """
+    One float array per stat (NaN where the value is missing or not a
+    number), plus 'sos_qualification' as a bool array and, given the
+    export's formats list, the filter_key_columns.
+    """
+    columns = {}
+    for stat_key in stat_keys:
+        values = [stat_value(p, stat_key) for p in players]
+        columns[stat_key] = np.array(
+            [v if _is_number(v) else np.nan for v in values], dtype=np.float64
+        )
+    columns['sos_qualification'] = np.array(
+        [bool(p['data']['player_info'].get('sos_qualification')) for p in players], dtype=bool
+    )
+    if formats is not None:
+        columns.update(filter_key_columns(players, formats))
+    return columns
+
+
+def filter_key_columns(players: List[Dict], formats: List[str]) -> Dict[str, np.ndarray]:
+    """
+    The players' filter_keys as columns, for the export's formats list:
+      first_date, last_date
+                     'YYYY-MM-DD' strings, '' for players without dated events
+      format_counts  players x formats int matrix of events per format
+      formats        the formats list, for format_filter
+    Empty when some player has no filter_keys (an export from before them).
+    """
+    keys = [p['data'].get('filter_keys') for p in players]
+    if any(k is None for k in keys):
+        return {}
+    index = {fmt: i for i, fmt in enumerate(formats)}
+    counts = np.zeros((len(players), len(formats)), dtype=np.int64)
+    for row, k in enumerate(keys):
+        for fmt, count in k['format_counts'].items():
+            counts[row, index[fmt]] = count
+    return {
+        'first_date': np.array([k['first_date'] or '' for k in keys], dtype=str),
+        'last_date': np.array([k['last_date'] or '' for k in keys], dtype=str),
+        'format_counts': counts,
+        'formats': np.array(formats, dtype=object),
+    }
+
+
+def format_filter(columns: Dict[str, np.ndarray], wanted: List[str]) -> np.ndarray:
+    """Players with an event in any of the wanted formats."""
+    return format_events(columns, wanted) > 0
+
+
+def date_filter(columns: Dict[str, np.ndarray], start: Optional[str] = None,
+                end: Optional[str] = None) -> np.ndarray:
+    """Players with an event on or after start and one on or before end (string comparison, as in JS)."""
+    mask = columns['last_date'] != ''
+    if start:
+        mask &= columns['last_date'] >= start
+    if end:
+        mask &= columns['first_date'] <= end
+    return mask
+
+
+def format_events(columns: Dict[str, np.ndarray], wanted: List[str]) -> np.ndarray:
+    """Each player's number of events in the wanted formats."""
+    picked = [i for i, fmt in enumerate(columns['formats']) if fmt in set(wanted)]
+    return columns['format_counts'][:, picked].sum(axis=1)
+
+
+def filter_mask(players: List[Dict], columns: Dict[str, np.ndarray], filters: Dict) -> np.ndarray:
+    """Boolean mask of players kept by apply_filters, computed column-wise."""
+    mask = np.ones(len(players), dtype=bool)
+    if filters.get('minEvents') is not None:
+        mask &= ~(columns['events'] < filters['minEvents'])
+    if filters.get('minDay2s') is not None:
+        mask &= ~(columns['day2s'] < filters['minDay2s'])
+    if filters.get('maxEvents') is not None:
+        mask &= ~(columns['events'] > filters['maxEvents'])
+    if filters.get('minTop8s') is not None:
+        mask &= ~(columns['top8s'] < filters['minTop8s'])
+    if filters.get('hasTop8'):
+        mask &= columns['top8s'] != 0
+    if filters.get('SosPlayersOnly'):
+        mask &= columns['sos_qualification']
+
+    if 'format_counts' in columns:
+        if filters.get('formats'):
+            mask &= format_filter(columns, filters['formats'])
+        if filters.get('startDate') or filters.get('endDate'):
+            mask &= date_filter(columns, filters.get('startDate'), filters.get('endDate'))
+        return mask
+
+    # Without filter keys the format and date rules depend on each player's events
+    if filters.get('formats') or filters.get('startDate') or filters.get('endDate'):
+        event_filters = {k: filters[k] for k in ('formats', 'startDate', 'endDate') if filters.get(k)}
+        candidates = np.flatnonzero(mask)
+        kept = {id(p) for p in apply_filters([players[i] for i in candidates], event_filters)}
+        mask[candidates] = [id(players[i]) in kept for i in candidates]
+    return mask
+
+
+def rank_column(values: np.ndarray, mask: np.ndarray):
+    """
+    Rank the masked players on one stat like sort_players + calculate_player_rank.
+    Returns (order, ranks): player indexes best first (stable for ties) and
+    their competition ranks.
+    """
+    pool = np.flatnonzero(mask & ~np.isnan(values))
+    order = pool[np.argsort(-values[pool], kind='stable')]
+    sorted_values = values[order]
+    # Rank = 1 + position of the first player with the same value
+    new_value = np.ones(len(order), dtype=bool)
+    new_value[1:] = sorted_values[1:] != sorted_values[:-1]
+    ranks = np.maximum.accumulate(np.where(new_value, np.arange(1, len(order) + 1), 0))
+    return order, ranks
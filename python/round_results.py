@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Derive per-player result aggregates from round-by-round match results.
+CSV must have headers: Event #, First, Last, Round, Format, Result
+Format is Limited/Draft or Constructed; Result is W, L or D.
+
+All aggregates for the whole file (day splits, limited/constructed splits,
+streaks, draft pod records) are computed at once with NumPy, so they no
+longer depend on the hand-maintained spreadsheet columns.
+"""
+
+import csv
+import sys
+import time
+import numpy as np
+from typing import Dict, Tuple
+
+# Last round of day 1 and day 2; anything after is day 3 (top 8)
+DAY_BREAKS = (8, 16)
+
+# Rounds in a single draft pod
+DRAFT_ROUNDS = 3
+
+WIN, LOSS, DRAW = 0, 1, 2
+RESULT_CODES = {'W': WIN, 'L': LOSS, 'D': DRAW}
+
+
+def parse_result(value: str) -> int:
+    """Convert W/L/D (or Win/Loss/Draw) to a result code."""
+    code = value.strip()[:1].upper()
+    if code not in RESULT_CODES:
+        raise ValueError(f"Unknown match result '{value}'")
+    return RESULT_CODES[code]
+
+
+def parse_is_limited(value: str) -> bool:
+    """Limited and Draft rounds are limited, everything else is constructed."""
+    return value.strip().lower() in ('limited', 'draft', 'l')
+
+
+def load_rounds(csv_file: str) -> Dict[str, np.ndarray]:
+    """
+    Read a round-by-round CSV into column arrays.
+    Players are keyed by (Event #, First, Last) and mapped to a dense index.
+    """
+    keys = []
+    key_index = {}
+    player, rounds, is_limited, result = [], [], [], []
+
+    with open(csv_file, 'r', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        for line_num, row in enumerate(reader, start=2):
+            first_name = row['First'].strip()
+            last_name = row['Last'].strip()
+            if not first_name and not last_name:
+                continue
+
+            try:
+                key = (int(row['Event #']), first_name, last_name)
+                round_num = int(row['Round'])
+                code = parse_result(row['Result'])
+            except ValueError as e:
+                raise ValueError(f"{csv_file} line {line_num}: {e}") from None
+
+            if key not in key_index:
+                key_index[key] = len(keys)
+                keys.append(key)
+
+            player.append(key_index[key])
+            rounds.append(round_num)
+            is_limited.append(parse_is_limited(row['Format']))
+            result.append(code)
+
+    return {
+        'keys': keys,
+        'player': np.array(player, dtype=np.int64),
+        'round': np.array(rounds, dtype=np.int64),
+        'is_limited': np.array(is_limited, dtype=bool),
+        'result': np.array(result, dtype=np.int64),
+    }
+
+
+def _longest_runs(player: np.ndarray, result: np.ndarray, num_players: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Longest win run, longest loss run and number of 5+ win runs per player.
+    Rows must already be sorted by player then round.
+    """
+    win_streak = np.zeros(num_players, dtype=np.int64)
+    loss_streak = np.zeros(num_players, dtype=np.int64)
+    if len(player) == 0:
+        return win_streak, loss_streak, np.zeros(num_players, dtype=np.int64)
+
+    starts = np.ones(len(player), dtype=bool)
+    starts[1:] = (player[1:] != player[:-1]) | (result[1:] != result[:-1])
+    run_lengths = np.diff(np.append(np.flatnonzero(starts), len(player)))
+    run_player = player[starts]
+    run_result = result[starts]
+
+    wins = run_result == WIN
+    losses = run_result == LOSS
+    np.maximum.at(win_streak, run_player[wins], run_lengths[wins])
+    np.maximum.at(loss_streak, run_player[losses], run_lengths[losses])
+    streak5 = np.bincount(run_player[wins & (run_lengths >= 5)], minlength=num_players)
+    return win_streak, loss_streak, streak5
+
+
+def _draft_records(player: np.ndarray, day: np.ndarray, is_limited: np.ndarray,
+                   result: np.ndarray, num_players: int) -> Dict[str, np.ndarray]:
+    """
+    Per-player draft pod counts. A pod is a run of consecutive limited
+    rounds on the same day. Rows must be sorted by player then round.
+    """
+    lim_player = player[is_limited]
+    lim_day = day[is_limited]
+    lim_result = result[is_limited]
+
+    empty = np.zeros(num_players, dtype=np.int64)
+    if len(lim_player) == 0:
+        return {'num_drafts': empty, 'positive_drafts': empty, 'negative_drafts': empty,
+                'trophy_drafts': empty, 'no_win_drafts': empty}
+
+    # A limited round starts a new pod unless the player's previous round
+    # was also limited and on the same day
+    limited_rows = np.flatnonzero(is_limited)
+    prev = limited_rows - 1
+    continues = (prev >= 0) & is_limited[np.maximum(prev, 0)]
+    continues &= player[np.maximum(prev, 0)] == lim_player
+    continues &= day[np.maximum(prev, 0)] == lim_day
+    pod_id = np.cumsum(~continues) - 1
+    num_pods = pod_id[-1] + 1
+
+    pod_counts = np.bincount(pod_id * 3 + lim_result, minlength=num_pods * 3).reshape(num_pods, 3)
+    pod_wins, pod_losses, pod_draws = pod_counts[:, WIN], pod_counts[:, LOSS], pod_counts[:, DRAW]
+    pod_player = lim_player[~continues]
+
+    def per_player(mask: np.ndarray) -> np.ndarray:
+        return np.bincount(pod_player[mask], minlength=num_players)
+
+    return {
+        'num_drafts': per_player(np.ones(num_pods, dtype=bool)),
+        'positive_drafts': per_player(pod_wins > pod_losses),
+        'negative_drafts': per_player(pod_losses > pod_wins),
+        'trophy_drafts': per_player((pod_wins == DRAFT_ROUNDS) & (pod_losses == 0) & (pod_draws == 0)),
+        'no_win_drafts': per_player(pod_wins == 0),
+    }
+
+
+def derive_results(rounds: Dict[str, np.ndarray], day_breaks: Tuple[int, int] = DAY_BREAKS) -> Dict[Tuple[int, str, str], Dict]:
+    """
+    Compute the derived `results` columns for every player in the file.
+    Returns {(event #, first, last): {column: value}} using the same
+    column names as ingest_results.insert_result.
+    """
+    keys = rounds['keys']
+    num_players = len(keys)
+
+    order = np.lexsort((rounds['round'], rounds['player']))
+    player = rounds['player'][order]
+    round_num = rounds['round'][order]
+    is_limited = rounds['is_limited'][order]
+    result = rounds['result'][order]
+    day = np.searchsorted(np.asarray(day_breaks), round_num, side='left')
+
+    # [player, day, result] and [player, format, result] match counts
+    by_day = np.bincount((player * 3 + day) * 3 + result,
+                         minlength=num_players * 9).reshape(num_players, 3, 3)
+    by_format = np.bincount((player * 2 + is_limited) * 3 + result,
+                            minlength=num_players * 6).reshape(num_players, 2, 3)
+    overall = by_day.sum(axis=1)
+
+    win_streak, loss_streak, streak5 = _longest_runs(player, result, num_players)
+    drafts = _draft_records(player, day, is_limited, result, num_players)
+
+    columns = {
+        'limited_wins': by_format[:, 1, WIN],
+        'limited_losses': by_format[:, 1, LOSS],
+        'limited_draws': by_format[:, 1, DRAW],
+        'constructed_wins': by_format[:, 0, WIN],
+        'constructed_losses': by_format[:, 0, LOSS],
+        'constructed_draws': by_format[:, 0, DRAW],
+        'overall_wins': overall[:, WIN],
+        'overall_losses': overall[:, LOSS],
+        'overall_draws': overall[:, DRAW],
+        'win_streak': win_streak,
+        'loss_streak': loss_streak,
+        'streak5': streak5,
+        **drafts,
+    }
+    for day_num in range(3):
+        columns[f'day{day_num + 1}_wins'] = by_day[:, day_num, WIN]
+        columns[f'day{day_num + 1}_losses'] = by_day[:, day_num, LOSS]
+        columns[f'day{day_num + 1}_draws'] = by_day[:, day_num, DRAW]
+
+    # Convert to plain ints once per column rather than per cell
+    as_lists = {name: values.tolist() for name, values in columns.items()}
+    derived = {}
+    for i, key in enumerate(keys):
+        row = {name: values[i] for name, values in as_lists.items()}
+        row['overall_record'] = f"{row['overall_wins']}-{row['overall_losses']}-{row['overall_draws']}"
+        derived[key] = row
+    return derived
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python round_results.py <rounds.csv>")
+        print("\nPrints the derived aggregates as CSV (one row per player per event).")
+        sys.exit(1)
+
+    csv_file = sys.argv[1]
+
+    start = time.perf_counter()
+    rounds = load_rounds(csv_file)
+    loaded = time.perf_counter()
+    derived = derive_results(rounds)
+    done = time.perf_counter()
+
+    print(f"Loaded {len(rounds['round'])} rounds for {len(derived)} player(s) in {(loaded - start) * 1000:.1f} ms", file=sys.stderr)
+    print(f"Derived aggregates in {(done - loaded) * 1000:.1f} ms", file=sys.stderr)
+
+    if not derived:
+        return
+
+    columns = list(next(iter(derived.values())).keys())
+    writer = csv.writer(sys.stdout)
+    writer.writerow(['Event #', 'First', 'Last'] + columns)
+    for (event_id, first_name, last_name), row in derived.items():
+        writer.writerow([event_id, first_name, last_name] + [row[c] for c in columns])
+
+
+if __name__ == '__main__':
+    main()
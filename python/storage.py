@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Storage backends for the ingest and export scripts.
+
+open_storage(dsn) returns a connection-like Storage for either:
+  Postgres   a libpq DSN or postgresql:// URL (psycopg2)
+  SQLite     sqlite:///path/to/file.db, or a path ending in .db, .sqlite
+             or .sqlite3 (schema in sql/sqlite_schema.sql)
+
+Both hand out cursors that take %s placeholders and have mogrify(), so
+the scripts' SQL runs unchanged on either backend as long as it keeps to
+what both dialects support (ON CONFLICT upserts, RETURNING, SAVEPOINT,
+UPDATE ... FROM, CURRENT_TIMESTAMP). Postgres-only features are done in
+Python instead: name normalization in name_utils (no unaccent),
+table_exists() here (no to_regclass), multi-row VALUES lists or
+executemany (no execute_values) and export_builder.build_export for the
+export (no json_object_agg). Postgres exports with sql/generate_app_json.sql, or
+with build_export over the partition stats cache (partitions.py) when
+the export asks for cached_stats (export_data.py --cached-stats).
+
+Usage:
+  python storage.py init <sqlite path>                        create an empty local database
+  python storage.py copy <postgres dsn> <sqlite path>         copy the tables into a local file
+  python storage.py parity <postgres dsn> [<sqlite path>]     check both backends export the same data
+"""
+
+import abc
+import datetime
+import json
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from export_builder import build_export
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+EXPORT_SQL = os.path.join(SCRIPT_DIR, '..', 'sql', 'generate_app_json.sql')
+SQLITE_SCHEMA = os.path.join(SCRIPT_DIR, '..', 'sql', 'sqlite_schema.sql')
+
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+# Seconds a SQLite writer waits for another writer's transaction to finish
+SQLITE_BUSY_TIMEOUT = 600.0
+
+# Tables sql/generate_app_json.sql reads that a migration creates: the
+# migration, and an empty stand-in the export reads until it has run
+EXPORT_MIGRATIONS = {'player_ratings': 'sql/create_player_ratings.sql, then python ratings.py update'}
+EXPORT_STAND_INS = {'player_ratings': '(SELECT NULL::integer AS player_id, NULL::double precision AS rating '
+                                      'WHERE false)'}
+
+# Tables copied into a local file, in foreign key order
+COPY_TABLES = ['players', 'events', 'results', 'notable_qualifications', 'player_aliases',
+               'player_ratings', 'rated_events', 'rating_history', 'ingest_generations']
+
+_PLACEHOLDER = re.compile(r'%([s%])')
+
+
+def _sqlite_value(value):
+    """Python value as SQLite stores it (dates and times as ISO text)."""
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+def _sql_literal(value) -> str:
+    if value is None:
+        return 'NULL'
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return "'" + str(_sqlite_value(value)).replace("'", "''") + "'"
+
+
+class SQLiteCursor:
+    """
+    DB-API cursor over sqlite3 that accepts psycopg2-style %s placeholders
+    and mogrify(). Every statement runs inside an explicit transaction, so
+    savepoints nest in it and nothing is written until commit().
+
+    Transactions start with BEGIN IMMEDIATE, which takes the database's
+    single write lock up front. A second writer then waits at its BEGIN
+    (up to SQLITE_BUSY_TIMEOUT) until the first commits, where a deferred
+    BEGIN would fail with "database is locked" at its first write,
+    partway through. Read-only snapshots (begin_snapshot) use a plain
+    BEGIN and never wait.
+    """
+
+    backend = 'sqlite'
+
+    def __init__(self, conn: sqlite3.Connection, begin: str = 'BEGIN IMMEDIATE'):
+        self._conn = conn
+        self._cur = conn.cursor()
+        self._begin_sql = begin
+
+    def _begin(self) -> None:
+        if not self._conn.in_transaction:
+            self._cur.execute(self._begin_sql)
+
+    def execute(self, sql, params=None):
+        if isinstance(sql, bytes):
+            sql = sql.decode('utf-8')
+        self._begin()
+        if params is None:
+            self._cur.execute(sql)
+        else:
+            sql = _PLACEHOLDER.sub(lambda m: '?' if m.group(1) == 's' else '%', sql)
+            self._cur.execute(sql, [_sqlite_value(v) for v in params])
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        self._begin()
+        sql = _PLACEHOLDER.sub(lambda m: '?' if m.group(1) == 's' else '%', sql)
+        self._cur.executemany(sql, ([_sqlite_value(v) for v in params] for params in seq_of_params))
+        return self
+
+    def mogrify(self, sql, params=None) -> bytes:
+        """The statement with parameters inlined, as psycopg2's mogrify returns it."""
+        if params is not None:
+            values = iter(params)
+            sql = _PLACEHOLDER.sub(lambda m: _sql_literal(next(values)) if m.group(1) == 's' else '%', sql)
+        return sql.encode('utf-8')
+
+    def fetchone(self):
+        return self._cur.fetchone()
+
+    def fetchall(self):
+        return self._cur.fetchall()
+
+    @property
+    def rowcount(self) -> int:
+        return self._cur.rowcount
+
+    @property
+    def description(self):
+        return self._cur.description
+
+    def close(self) -> None:
+        self._cur.close()
+
+
+class Storage(abc.ABC):
+    """A connection plus the few operations that differ between backends."""
+
+    backend = None
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def cursor(self):
+        return self.conn.cursor()
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    def rollback(self) -> None:
+        self.conn.rollback()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    @abc.abstractmethod
+    def begin_snapshot(self) -> None:
+        """
+        Make the connection read-only with every query seeing the same
+        committed snapshot, so a multi-query export is consistent while
+        ingests commit. Call before the first query.
+        """
+
+    def fetch_export(self, cur, cached_stats: bool = False) -> Dict:
+        """The app export (data.json structure); cached_stats reads the partition stats cache."""
+        return build_export(cur, cached_stats)
+
+
+class PostgresStorage(Storage):
+    backend = 'postgres'
+
+    def begin_snapshot(self) -> None:
+        self.conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+
+    def fetch_export(self, cur, cached_stats: bool = False) -> Dict:
+        # The SQL recomputes every player's stats; only build_export can
+        # use the partition stats cache
+        if cached_stats:
+            return build_export(cur, cached_stats=True)
+        return self.export_sql(cur)
+
+    def export_sql(self, cur) -> Dict:
+        """
+        The export from sql/generate_app_json.sql. A table from a migration
+        that hasn't run reads as empty (ratings null), like build_export.
+        """
+        with open(EXPORT_SQL, 'r', encoding='utf-8') as f:
+            sql = f.read()
+        for table, migration in EXPORT_MIGRATIONS.items():
+            if not table_exists(cur, table):
+                print(f"⚠ {table} table not found, exporting without it (run {migration})", file=sys.stderr)
+                sql = re.sub(rf'\bFROM {table}\b', f'FROM {EXPORT_STAND_INS[table]} AS {table}', sql)
+        cur.execute(sql)
+        return cur.fetchone()[0]
+
+
+class SQLiteStorage(Storage):
+    backend = 'sqlite'
+
+    def __init__(self, conn):
+        super().__init__(conn)
+        self.begin = 'BEGIN IMMEDIATE'
+
+    def begin_snapshot(self) -> None:
+        # SQLiteCursor runs everything in one transaction, which reads one
+        # snapshot; a reader doesn't need the write lock
+        self.conn.execute('PRAGMA query_only = ON')
+        self.begin = 'BEGIN'
+
+    def cursor(self) -> SQLiteCursor:
+        return SQLiteCursor(self.conn, self.begin)
+
+
+def is_sqlite_dsn(dsn: str) -> bool:
+    return dsn.startswith('sqlite:') or dsn.lower().endswith(SQLITE_SUFFIXES)
+
+
+def open_storage(dsn: str) -> Storage:
+    """Connect to the backend the DSN names."""
+    if is_sqlite_dsn(dsn):
+        path = dsn[len('sqlite:'):] if dsn.startswith('sqlite:') else dsn
+        if path.startswith('//'):
+            path = path[2:]
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"SQLite database '{path}' not found (create it with: python storage.py init {path})")
+        # Autocommit at the driver level; SQLiteCursor opens the transactions itself
+        conn = sqlite3.connect(path, isolation_level=None, timeout=SQLITE_BUSY_TIMEOUT)
+        conn.execute('PRAGMA foreign_keys = ON')
+        return SQLiteStorage(conn)
+
+    # Only needed for Postgres, so a local SQLite run works without it
+    import psycopg2
+    return PostgresStorage(psycopg2.connect(dsn))
+
+
+def is_sqlite(cur) -> bool:
+    """
+    Whether cur is a SQLiteCursor. Checked by attribute rather than class,
+    since running storage.py as a script loads the module twice
+    (__main__ and storage) and its cursors fail the other copy's isinstance.
+    """
+    return getattr(cur, 'backend', None) == 'sqlite'
+
+
+def table_exists(cur, table: str) -> bool:
+    if is_sqlite(cur):
+        cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", (table,))
+        return cur.fetchone() is not None
+    cur.execute("SELECT to_regclass(%s) IS NOT NULL", (table,))
+    return cur.fetchone()[0]
+
+
+def init_sqlite(path: str) -> None:
+    """Create (or bring up to date) a local database file from sql/sqlite_schema.sql."""
+    with open(SQLITE_SCHEMA, 'r', encoding='utf-8') as f:
+        schema = f.read()
+    conn = sqlite3.connect(path)
+    try:
+        # WAL lets readers keep their snapshot while an ingest writes
+        conn.execute('PRAGMA journal_mode = WAL')
+        # Checkpoints from before import jobs (sql/alter_ingest_checkpoints.sql):
+        # set the old table aside, create the new one and keep each file's latest
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(ingest_checkpoints)")]
+        upgrade_checkpoints = bool(columns) and 'job' not in columns
+        if upgrade_checkpoints:
+            conn.execute("ALTER TABLE ingest_checkpoints RENAME TO ingest_checkpoints_by_hash")
+        # Players from before the last name key (sql/alter_notable_qualifications.sql)
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(players)")]
+        if columns and 'last_key' not in columns:
+            conn.execute("ALTER TABLE players ADD COLUMN last_key TEXT")
+        conn.executescript(schema)
+        if upgrade_checkpoints:
+            conn.executescript("""
+                INSERT INTO ingest_checkpoints (job, file_hash, file_name, last_row, rows_imported,
+                                                rows_quarantined, completed_at, updated_at)
+                SELECT file_name, file_hash, file_name, last_row, rows_imported,
+                       rows_quarantined, completed_at, updated_at
+                FROM ingest_checkpoints_by_hash c
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM ingest_checkpoints_by_hash newer
+                    WHERE newer.file_name = c.file_name
+                      AND (newer.updated_at, newer.file_hash) > (c.updated_at, c.file_hash)
+                );
+                DROP TABLE ingest_checkpoints_by_hash;
+            """)
+    finally:
+        conn.close()
+
+
+def copy_to_sqlite(source: Storage, path: str) -> Dict[str, int]:
+    """Copy every table in COPY_TABLES from `source` into the SQLite file at path (replacing its rows)."""
+    init_sqlite(path)
+    target = open_storage(path)
+    src_cur, dst_cur = source.cursor(), target.cursor()
+    counts = {}
+    try:
+        # Clear in reverse order so foreign keys never point at missing rows
+        for table in reversed(COPY_TABLES):
+            dst_cur.execute(f"DELETE FROM {table}")
+        for table in COPY_TABLES:
+            if not table_exists(src_cur, table):
+                print(f"  {table}: not in source, skipped", file=sys.stderr)
+                continue
+            dst_cur.execute(f"SELECT * FROM {table} LIMIT 0")
+            columns = [d[0] for d in dst_cur.description]
+            src_cur.execute(f"SELECT * FROM {table} LIMIT 0")
+            available = {d[0] for d in src_cur.description}
+            # Columns the source doesn't have yet (e.g. before a migration) stay NULL
+            select = ', '.join(c if c in available else 'NULL' for c in columns)
+            src_cur.execute(f"SELECT {select} FROM {table}")
+            rows = src_cur.fetchall()
+            placeholders = ', '.join(['%s'] * len(columns))
+            dst_cur.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows)
+            counts[table] = len(rows)
+        target.commit()
+    finally:
+        target.close()
+    return counts
+
+
+def export_differences(a: Dict, b: Dict, path: str = '', limit: int = 20) -> List[str]:
+    """Paths where two exports differ (at most `limit`)."""
+    differences = []
+
+    def walk(x, y, where):
+        if len(differences) >= limit:
+            return
+        if isinstance(x, dict) and isinstance(y, dict):
+            for key in sorted(set(x) | set(y)):
+                if key not in x or key not in y:
+                    differences.append(f"{where}/{key}: only in {'first' if key in x else 'second'}")
+                else:
+                    walk(x[key], y[key], f"{where}/{key}")
+        elif x != y or type(x) is bool and type(y) is not bool or type(y) is bool and type(x) is not bool:
+            differences.append(f"{where}: {x!r} != {y!r}")
+
+    walk(a, b, path)
+    return differences
+
+
+def check_parity(pg_dsn: str, sqlite_path: Optional[str] = None) -> List[str]:
+    """
+    Export through both backends and compare:
+      generate_app_json.sql on Postgres vs build_export on Postgres
+      generate_app_json.sql on Postgres vs build_export with cached_stats on
+                                           Postgres (if the cache is installed)
+      generate_app_json.sql on Postgres vs build_export on a SQLite copy
+    Copies Postgres into a temporary file unless sqlite_path is given.
+    """
+    source = open_storage(pg_dsn)
+    try:
+        cur = source.cursor()
+        start = time.perf_counter()
+        # Round-trip through JSON so both sides compare as the files would
+        reference = json.loads(json.dumps(source.export_sql(cur)))
+        print(f"  Postgres (generate_app_json.sql): {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+        start = time.perf_counter()
+        built_pg = json.loads(json.dumps(build_export(cur)))
+        print(f"  Postgres (build_export): {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+        built_cached = None
+        if table_exists(cur, 'results_partition_cache'):
+            start = time.perf_counter()
+            built_cached = json.loads(json.dumps(build_export(cur, cached_stats=True)))
+            print(f"  Postgres (build_export, cached stats): {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+        temp_dir = None
+        if sqlite_path is None:
+            temp_dir = tempfile.TemporaryDirectory()
+            sqlite_path = os.path.join(temp_dir.name, 'parity.db')
+            copy_to_sqlite(source, sqlite_path)
+    finally:
+        source.close()
+
+    local = open_storage(sqlite_path)
+    try:
+        start = time.perf_counter()
+        built_sqlite = json.loads(json.dumps(local.fetch_export(local.cursor())))
+        print(f"  SQLite (build_export): {time.perf_counter() - start:.2f}s", file=sys.stderr)
+    finally:
+        local.close()
+        if temp_dir:
+            temp_dir.cleanup()
+
+    return ([f"postgres build_export{d}" for d in export_differences(reference, built_pg)]
+            + ([] if built_cached is None else
+               [f"postgres cached stats{d}" for d in export_differences(reference, built_cached)])
+            + [f"sqlite{d}" for d in export_differences(reference, built_sqlite)])
+
+
+def main():
+    commands = ('init', 'copy', 'parity')
+    if len(sys.argv) < 3 or sys.argv[1] not in commands:
+        print(__doc__.split('Usage:')[1].strip('\n'))
+        sys.exit(1)
+
+    command = sys.argv[1]
+    try:
+        if command == 'init':
+            init_sqlite(sys.argv[2])
+            print(f"✓ Created {sys.argv[2]}", file=sys.stderr)
+
+        elif command == 'copy':
+            if len(sys.argv) < 4:
+                print("Usage: python storage.py copy <postgres dsn> <sqlite path>", file=sys.stderr)
+                sys.exit(1)
+            source = open_storage(sys.argv[2])
+            try:
+                counts = copy_to_sqlite(source, sys.argv[3])
+            finally:
+                source.close()
+            for table, count in counts.items():
+                print(f"  {table}: {count} row(s)", file=sys.stderr)
+            print(f"✓ Copied into {sys.argv[3]}", file=sys.stderr)
+
+        elif command == 'parity':
+            problems = check_parity(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None)
+            if problems:
+                for problem in problems:
+                    print(f"✗ {problem}", file=sys.stderr)
+                print(f"\n✗ Exports differ ({len(problems)} difference(s) shown)", file=sys.stderr)
+                sys.exit(1)
+            print("✓ Postgres and SQLite exports are identical", file=sys.stderr)
+
+    except Exception as e:
+        print(f"\n✗ Error: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Shared fixtures. The scripts import each other as top-level modules
+(they run from python/), so python/ goes on sys.path here.
+
+fixtures/export.sql is a small results database and fixtures/export.json
+the data.json sql/generate_app_json.sql exports from it on Postgres
+(see test_export_parity.py).
+"""
+
+import json
+import os
+import sqlite3
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = os.path.join(TESTS_DIR, 'fixtures')
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+from storage import init_sqlite, open_storage  # noqa: E402
+
+
+@pytest.fixture
+def fixture_db(tmp_path) -> str:
+    """Path of a SQLite database holding fixtures/export.sql."""
+    path = str(tmp_path / 'fixture.db')
+    init_sqlite(path)
+    with open(os.path.join(FIXTURES, 'export.sql'), 'r', encoding='utf-8') as f:
+        script = f.read()
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(script)
+        conn.commit()
+    finally:
+        conn.close()
+    return path
+
+
+@pytest.fixture
+def fixture_storage(fixture_db):
+    storage = open_storage(fixture_db)
+    yield storage
+    storage.close()
+
+
+@pytest.fixture(scope='session')
+def fixture_export() -> dict:
+    """The frozen Postgres export of fixtures/export.sql."""
+    with open(os.path.join(FIXTURES, 'export.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
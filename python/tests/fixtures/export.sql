@@ -0,0 +1,90 @@
+-- Small results database for the tests (python/tests), loaded into SQLite
+-- and into Postgres alike; see test_export_parity.py for how export.json is made.
+-- 6 events and 13 players: accented names, unranked (finish 0) rows, a player
+-- without results, two SOS (event 14) qualifications and current ratings.
+
+INSERT INTO players (id, first_name, last_name) VALUES (1, 'Max', 'Rao');
+INSERT INTO players (id, first_name, last_name) VALUES (2, 'José', 'Núñez');
+INSERT INTO players (id, first_name, last_name) VALUES (3, 'Ira', 'Kim');
+INSERT INTO players (id, first_name, last_name) VALUES (4, 'Ann', 'Lee');
+INSERT INTO players (id, first_name, last_name) VALUES (5, 'Bob', 'Stone');
+INSERT INTO players (id, first_name, last_name) VALUES (6, 'Noa', 'Ng');
+INSERT INTO players (id, first_name, last_name) VALUES (7, 'Zoe', 'Park');
+INSERT INTO players (id, first_name, last_name) VALUES (8, 'Uma', 'Díaz');
+INSERT INTO players (id, first_name, last_name) VALUES (9, 'Lee', 'Hale');
+INSERT INTO players (id, first_name, last_name) VALUES (10, 'Eve', 'Cho');
+INSERT INTO players (id, first_name, last_name) VALUES (11, 'Kai', 'Ito');
+INSERT INTO players (id, first_name, last_name) VALUES (12, 'Ada', 'Fox');
+INSERT INTO players (id, first_name, last_name) VALUES (13, 'Sam', 'Byrne');
+
+INSERT INTO events (id, name, date, format) VALUES (10, 'PTA', '2019-02-14', 'Standard');
+INSERT INTO events (id, name, date, format) VALUES (11, 'PTB', '2019-06-03', 'Modern');
+INSERT INTO events (id, name, date, format) VALUES (12, 'PTC', '2019-10-20', 'Standard');
+INSERT INTO events (id, name, date, format) VALUES (13, 'PTD', '2020-03-01', 'Pioneer');
+INSERT INTO events (id, name, date, format) VALUES (14, 'PTE', '2020-05-15', 'Modern');
+INSERT INTO events (id, name, date, format) VALUES (15, 'PTF', '2020-05-15', 'Limited');
+
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (1, 1, 10, TRUE, TRUE, 1, 0, 0, 1, 1, 0, 1, 0, 7, 1, 0, 8, 1, 0, '8-1-0', 5, 0, 0, 0, 0, 0, 3, 1, 0, TRUE, 1, 0, 0, 1, 'Top 8', 'Team 1', 'Deck 2', 'note');
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (2, 2, 10, TRUE, TRUE, 4, 1, 0, 1, 0, 1, 0, 0, 4, 0, 1, 8, 1, 1, '8-1-1', 8, 0, 1, 0, 1, 0, 0, 0, 0, TRUE, 5, 2, 0, 2, 'Top 8', 'Team 2', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (3, 3, 10, TRUE, FALSE, 0, 4, 0, 1, 0, 1, 0, 0, 3, 1, 1, 3, 5, 1, '3-5-1', 3, 1, 1, 0, 4, 0, 0, 0, 0, TRUE, 4, 3, 0, 3, '', 'Team 0', 'Deck 3', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (4, 4, 10, TRUE, FALSE, 2, 1, 0, 1, 1, 0, 1, 0, 6, 3, 1, 8, 4, 1, '8-4-1', 6, 3, 1, 2, 1, 0, 0, 0, 0, TRUE, 5, 3, 0, 4, '', 'Team 1', 'Deck 3', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (5, 5, 10, TRUE, FALSE, 1, 3, 0, 1, 1, 0, 1, 0, 11, 0, 1, 12, 3, 1, '12-3-1', 8, 3, 1, 4, 0, 0, 0, 0, 0, FALSE, 2, 3, 1, 5, '', 'Team 2', 'Deck 4', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (6, 6, 10, TRUE, FALSE, 4, 1, 0, 3, 3, 0, 1, 0, 1, 1, 1, 5, 2, 1, '5-2-1', 3, 0, 1, 2, 2, 0, 0, 0, 0, FALSE, 1, 0, 0, 6, '', 'Team 0', 'Deck 3', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (7, 7, 10, FALSE, FALSE, 10, 2, 0, 3, 3, 0, 1, 0, 1, 0, 0, 11, 2, 0, '11-2-0', 6, 0, 0, 5, 2, 0, 0, 0, 0, FALSE, 3, 3, 1, 7, '', 'Team 1', 'Deck 3', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (8, 8, 10, FALSE, FALSE, 0, 7, 0, 1, 0, 1, 0, 0, 4, 0, 1, 4, 7, 1, '4-7-1', 3, 3, 1, 1, 4, 0, 0, 0, 0, FALSE, 3, 1, 0, 8, '', 'Team 2', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (9, 3, 11, TRUE, TRUE, 5, 5, 0, 2, 0, 2, 0, 0, 8, 1, 1, 13, 6, 1, '13-6-1', 5, 1, 1, 6, 4, 0, 2, 1, 0, TRUE, 2, 0, 1, 1, 'Top 8', 'Team 1', 'Deck 2', 'note');
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (10, 9, 11, TRUE, TRUE, 2, 0, 0, 1, 1, 0, 1, 0, 3, 5, 0, 5, 5, 0, '5-5-0', 4, 1, 0, 0, 3, 0, 1, 1, 0, TRUE, 5, 2, 0, 2, 'Top 8', 'Team 2', 'Deck 3', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (11, 10, 11, TRUE, FALSE, 6, 3, 0, 2, 1, 1, 0, 0, 4, 1, 1, 10, 4, 1, '10-4-1', 4, 0, 1, 6, 4, 0, 0, 0, 0, TRUE, 1, 3, 1, 3, '', 'Team 0', 'Deck 4', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (12, 5, 11, TRUE, FALSE, 1, 0, 0, 2, 2, 0, 1, 0, 3, 4, 0, 4, 4, 0, '4-4-0', 3, 1, 0, 1, 3, 0, 0, 0, 0, TRUE, 1, 0, 0, 4, '', 'Team 1', 'Deck 1', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (13, 2, 11, TRUE, FALSE, 0, 0, 0, 1, 1, 0, 1, 0, 9, 5, 0, 9, 5, 0, '9-5-0', 7, 1, 0, 2, 4, 0, 0, 0, 0, FALSE, 2, 2, 0, 5, '', 'Team 2', 'Deck 3', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (14, 11, 11, TRUE, FALSE, 7, 1, 0, 2, 1, 1, 0, 0, 0, 1, 1, 7, 2, 1, '7-2-1', 7, 2, 1, 0, 0, 0, 0, 0, 0, FALSE, 3, 0, 0, 6, '', 'Team 0', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (15, 12, 11, FALSE, FALSE, 4, 0, 0, 1, 1, 0, 1, 0, 2, 3, 1, 6, 3, 1, '6-3-1', 3, 2, 1, 3, 1, 0, 0, 0, 0, FALSE, 2, 0, 0, 7, '', 'Team 1', 'Deck 3', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (16, 7, 11, FALSE, FALSE, 2, 1, 0, 1, 1, 0, 1, 0, 10, 1, 1, 12, 2, 1, '12-2-1', 8, 0, 1, 4, 2, 0, 0, 0, 0, FALSE, 6, 1, 1, 0, '', 'Team 2', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (17, 11, 12, TRUE, TRUE, 5, 2, 0, 1, 0, 1, 0, 0, 2, 2, 1, 7, 4, 1, '7-4-1', 3, 2, 1, 2, 1, 0, 2, 1, 0, TRUE, 1, 1, 0, 1, 'Top 8', 'Team 1', 'Deck 4', 'note');
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (18, 3, 12, TRUE, TRUE, 5, 1, 0, 3, 0, 3, 0, 0, 2, 6, 0, 7, 7, 0, '7-7-0', 4, 2, 0, 3, 4, 0, 0, 1, 0, TRUE, 4, 1, 0, 2, 'Top 8', 'Team 2', 'Deck 4', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (19, 9, 12, TRUE, FALSE, 3, 3, 0, 3, 0, 3, 0, 0, 1, 3, 1, 4, 6, 1, '4-6-1', 4, 3, 1, 0, 3, 0, 0, 0, 0, TRUE, 6, 1, 0, 3, '', 'Team 0', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (20, 6, 12, TRUE, FALSE, 2, 3, 0, 3, 2, 1, 0, 0, 6, 0, 0, 8, 3, 0, '8-3-0', 4, 0, 0, 4, 3, 0, 0, 0, 0, TRUE, 2, 1, 0, 4, '', 'Team 1', 'Deck 1', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (21, 10, 12, TRUE, FALSE, 6, 0, 0, 1, 1, 0, 1, 0, 0, 1, 0, 6, 1, 0, '6-1-0', 3, 0, 0, 3, 1, 0, 0, 0, 0, FALSE, 2, 2, 0, 5, '', 'Team 2', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (22, 2, 12, TRUE, FALSE, 2, 0, 0, 3, 2, 1, 0, 0, 9, 5, 1, 11, 5, 1, '11-5-1', 7, 2, 1, 4, 3, 0, 0, 0, 0, FALSE, 4, 3, 1, 6, '', 'Team 0', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (23, 1, 12, FALSE, FALSE, 12, 1, 0, 3, 0, 3, 0, 0, 1, 3, 0, 13, 4, 0, '13-4-0', 7, 1, 0, 6, 3, 0, 0, 0, 0, FALSE, 2, 1, 1, 7, '', 'Team 1', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (24, 4, 12, FALSE, FALSE, 8, 4, 0, 2, 0, 2, 0, 0, 0, 0, 0, 8, 4, 0, '8-4-0', 6, 0, 0, 2, 4, 0, 0, 0, 0, FALSE, 5, 0, 0, 8, '', 'Team 2', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (25, 11, 13, TRUE, TRUE, 8, 1, 0, 3, 2, 1, 0, 0, 6, 4, 0, 14, 5, 0, '14-5-0', 6, 2, 0, 5, 2, 0, 3, 1, 0, TRUE, 5, 1, 1, 1, 'Top 8', 'Team 1', 'Deck 4', 'note');
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (26, 7, 13, TRUE, TRUE, 3, 3, 0, 1, 0, 1, 0, 0, 6, 3, 0, 9, 6, 0, '9-6-0', 4, 3, 0, 3, 3, 0, 2, 0, 0, TRUE, 6, 2, 0, 2, 'Top 8', 'Team 2', 'Deck 1', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (27, 4, 13, TRUE, FALSE, 3, 1, 0, 3, 0, 3, 0, 0, 3, 2, 0, 6, 3, 0, '6-3-0', 4, 2, 0, 2, 1, 0, 0, 0, 0, TRUE, 4, 3, 0, 3, '', 'Team 0', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (28, 5, 13, TRUE, FALSE, 8, 3, 0, 2, 1, 1, 0, 0, 5, 1, 0, 13, 4, 0, '13-4-0', 8, 1, 0, 5, 3, 0, 0, 0, 0, TRUE, 2, 2, 1, 4, '', 'Team 1', 'Deck 3', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (29, 10, 13, TRUE, FALSE, 3, 3, 0, 3, 0, 3, 0, 0, 2, 3, 0, 5, 6, 0, '5-6-0', 3, 2, 0, 2, 4, 0, 0, 0, 0, FALSE, 4, 2, 0, 5, '', 'Team 2', 'Deck 3', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (30, 12, 13, TRUE, FALSE, 1, 0, 0, 2, 1, 1, 0, 0, 12, 1, 0, 13, 1, 0, '13-1-0', 7, 0, 0, 6, 1, 0, 0, 0, 0, FALSE, 1, 1, 1, 6, '', 'Team 0', 'Deck 3', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (31, 6, 13, FALSE, FALSE, 7, 2, 0, 1, 1, 0, 1, 0, 0, 2, 1, 7, 4, 1, '7-4-1', 4, 3, 1, 3, 1, 0, 0, 0, 0, FALSE, 1, 1, 0, 7, '', 'Team 1', 'Deck 4', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (32, 1, 13, FALSE, FALSE, 4, 0, 0, 3, 1, 2, 0, 0, 4, 2, 0, 8, 2, 0, '8-2-0', 3, 2, 0, 5, 0, 0, 0, 0, 0, FALSE, 1, 2, 0, 0, '', 'Team 2', 'Deck 1', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (33, 10, 14, TRUE, TRUE, 1, 2, 0, 3, 2, 1, 0, 0, 3, 1, 0, 4, 3, 0, '4-3-0', 3, 1, 0, 1, 2, 0, 0, 0, 0, TRUE, 5, 1, 0, 1, 'Top 8', 'Team 1', 'Deck 3', 'note');
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (34, 4, 14, TRUE, TRUE, 0, 0, 0, 3, 1, 2, 0, 0, 10, 1, 1, 10, 1, 1, '10-1-1', 6, 1, 1, 2, 0, 0, 2, 0, 0, TRUE, 5, 3, 0, 2, 'Top 8', 'Team 2', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (35, 1, 14, TRUE, FALSE, 8, 3, 0, 3, 2, 1, 0, 0, 3, 0, 1, 11, 3, 1, '11-3-1', 6, 0, 1, 5, 3, 0, 0, 0, 0, TRUE, 6, 1, 1, 3, '', 'Team 0', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (36, 8, 14, TRUE, FALSE, 0, 1, 0, 1, 0, 1, 0, 0, 8, 2, 0, 8, 3, 0, '8-3-0', 5, 1, 0, 3, 2, 0, 0, 0, 0, TRUE, 6, 2, 0, 4, '', 'Team 1', 'Deck 4', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (37, 3, 14, TRUE, FALSE, 8, 2, 0, 3, 1, 2, 0, 0, 1, 1, 0, 9, 3, 0, '9-3-0', 4, 0, 0, 5, 3, 0, 0, 0, 0, FALSE, 6, 2, 0, 5, '', 'Team 2', 'Deck 1', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (38, 2, 14, TRUE, FALSE, 0, 2, 0, 2, 1, 1, 0, 0, 8, 2, 0, 8, 4, 0, '8-4-0', 6, 1, 0, 2, 3, 0, 0, 0, 0, FALSE, 5, 2, 0, 6, '', 'Team 0', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (39, 7, 14, FALSE, FALSE, 0, 2, 0, 2, 0, 2, 0, 0, 5, 1, 0, 5, 3, 0, '5-3-0', 3, 2, 0, 2, 1, 0, 0, 0, 0, FALSE, 4, 2, 0, 7, '', 'Team 1', 'Deck 2', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (40, 5, 14, FALSE, FALSE, 1, 0, 0, 3, 0, 3, 0, 0, 5, 0, 0, 6, 0, 0, '6-0-0', 4, 0, 0, 2, 0, 0, 0, 0, 0, FALSE, 4, 0, 0, 8, '', 'Team 2', 'Deck 3', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (41, 7, 15, TRUE, TRUE, 8, 3, 0, 3, 1, 2, 0, 0, 0, 1, 1, 8, 4, 1, '8-4-1', 6, 2, 1, 1, 2, 0, 1, 0, 0, TRUE, 5, 0, 0, 1, 'Top 8', NULL, '', 'note');
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (42, 12, 15, TRUE, TRUE, 1, 1, 0, 2, 2, 0, 1, 0, 8, 1, 0, 9, 2, 0, '9-2-0', 8, 1, 0, 0, 0, 0, 1, 1, 0, TRUE, 1, 0, 0, 2, 'Top 8', NULL, '', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (43, 11, 15, TRUE, FALSE, 7, 0, 0, 3, 0, 3, 0, 0, 3, 1, 1, 10, 1, 1, '10-1-1', 8, 1, 1, 2, 0, 0, 0, 0, 0, TRUE, 6, 0, 1, 3, '', NULL, '', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (44, 5, 15, TRUE, FALSE, 13, 2, 0, 1, 0, 1, 0, 0, 1, 1, 1, 14, 3, 1, '14-3-1', 8, 3, 1, 6, 0, 0, 0, 0, 0, TRUE, 2, 3, 1, 4, '', NULL, '', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (45, 2, 15, TRUE, FALSE, 0, 4, 0, 3, 1, 2, 0, 0, 9, 1, 0, 9, 5, 0, '9-5-0', 6, 3, 0, 3, 2, 0, 0, 0, 0, FALSE, 1, 1, 0, 5, '', NULL, '', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (46, 1, 15, TRUE, FALSE, 2, 0, 0, 2, 0, 2, 0, 0, 7, 6, 1, 9, 6, 1, '9-6-1', 5, 2, 1, 4, 4, 0, 0, 0, 0, FALSE, 4, 2, 0, 6, '', NULL, '', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (47, 3, 15, FALSE, FALSE, 4, 2, 0, 2, 1, 1, 0, 0, 9, 1, 0, 13, 3, 0, '13-3-0', 8, 0, 0, 5, 3, 0, 0, 0, 0, FALSE, 4, 0, 1, 7, '', NULL, '', NULL);
+INSERT INTO results (id, player_id, event_id, day2, top8, limited_wins, limited_losses, limited_draws, num_drafts, positive_drafts, negative_drafts, trophy_drafts, no_win_drafts, constructed_wins, constructed_losses, constructed_draws, overall_wins, overall_losses, overall_draws, overall_record, day1_wins, day1_losses, day1_draws, day2_wins, day2_losses, day2_draws, day3_wins, day3_losses, day3_draws, in_contention, win_streak, loss_streak, streak5, finish, summary, team, deck, notes) VALUES (48, 9, 15, FALSE, FALSE, 0, 2, 0, 2, 0, 2, 0, 0, 7, 2, 1, 7, 4, 1, '7-4-1', 7, 1, 1, 0, 3, 0, 0, 0, 0, FALSE, 5, 3, 0, 0, '', NULL, '', NULL);
+
+INSERT INTO notable_qualifications (id, player_id, event_id, invitation_source) VALUES (1, 1, 14, 'Richmond');
+INSERT INTO notable_qualifications (id, player_id, event_id, invitation_source) VALUES (2, 13, 14, 'Invite');
+
+INSERT INTO player_ratings (player_id, rating, rd, events) VALUES (1, 1528.874924232688, 229.63500000000002, 4);
+INSERT INTO player_ratings (player_id, rating, rd, events) VALUES (2, 1516.6660636171216, 206.6715, 5);
+INSERT INTO player_ratings (player_id, rating, rd, events) VALUES (3, 1529.0175095685997, 206.6715, 5);
+INSERT INTO player_ratings (player_id, rating, rd, events) VALUES (4, 1524.8862337274309, 229.63500000000002, 4);
+INSERT INTO player_ratings (player_id, rating, rd, events) VALUES (5, 1520.1061170668845, 206.6715, 5);
+INSERT INTO player_ratings (player_id, rating, rd, events) VALUES (6, 1498.9961351193708, 255.15, 3);
+INSERT INTO player_ratings (player_id, rating, rd, events) VALUES (7, 1522.9397383646105, 229.63500000000002, 4);
+INSERT INTO player_ratings (player_id, rating, rd, events) VALUES (8, 1491.6823172861514, 283.5, 2);
+INSERT INTO player_ratings (player_id, rating, rd, events) VALUES (9, 1514.836150259871, 283.5, 2);
+INSERT INTO player_ratings (player_id, rating, rd, events) VALUES (10, 1526.9496312949784, 229.63500000000002, 4);
+INSERT INTO player_ratings (player_id, rating, rd, events) VALUES (11, 1546.7043860904432, 229.63500000000002, 4);
+INSERT INTO player_ratings (player_id, rating, rd, events) VALUES (12, 1512.751584609607, 255.15, 3);
@@ -0,0 +1,62 @@
+"""career_stats.py prefix sums against the export's aggregation."""
+
+import pytest
+
+from career_stats import CareerStats, resolve_cutoff, verify
+
+
+@pytest.fixture
+def career(fixture_export):
+    return CareerStats(fixture_export)
+
+
+def test_as_of_stats_match_the_aggregation_at_every_date(fixture_export, career):
+    assert verify(fixture_export, career) == []
+
+
+def test_whole_career_matches_the_export(fixture_export, career):
+    for player_id, data in fixture_export['players'].items():
+        expected = {key: stat for key, stat in data['stats'].items() if key != 'rating'}
+        assert career.player_stats(player_id, len(data['events'])) == expected, player_id
+
+
+def test_resolve_cutoff(fixture_export):
+    assert resolve_cutoff(fixture_export, 'ptb') == '2019-06-03'
+    assert resolve_cutoff(fixture_export, '13') == '2020-03-01'
+    assert resolve_cutoff(fixture_export, '2019-12-31') == '2019-12-31'
+    with pytest.raises(ValueError):
+        resolve_cutoff(fixture_export, 'PTZ')
+
+
+def test_before_and_through_a_date(career):
+    # PTE and PTF are both on 2020-05-15
+    before = career.leaderboard('events', '2020-05-15', limit=20)
+    through = career.leaderboard('events', '2020-05-15', through=True, limit=20)
+    assert sum(e['stat_value'] for e in before['entries']) == 4 * 8
+    assert sum(e['stat_value'] for e in through['entries']) == 6 * 8
+    assert career.leaderboard('events', '2019-02-14')['totalPlayers'] == 0
+    assert career.leaderboard('events', '2019-02-14', through=True)['totalPlayers'] == 8
+
+
+def test_leaderboard_ranks_like_ranking_utils(career):
+    board = career.leaderboard('events', '2019-06-03', through=True, limit=20)
+    values = [e['stat_value'] for e in board['entries']]
+    assert values == sorted(values, reverse=True)
+    for entry in board['entries']:
+        assert entry['rank'] == 1 + sum(1 for v in values if v > entry['stat_value'])
+
+
+def test_stats_without_an_as_of_value(career):
+    with pytest.raises(ValueError, match="'rating' has no as-of value"):
+        career.leaderboard('rating', '2020-01-01')
+    with pytest.raises(ValueError, match="Unknown stat 'wins'"):
+        career.trajectory('entry_1', 'wins')
+
+
+def test_trajectory(fixture_export, career):
+    data = fixture_export['players']['entry_2']
+    assert career.trajectory('entry_2', 'events') == list(range(1, len(data['events']) + 1))
+    assert career.trajectory('entry_2', 'overall_win_pct')[-1] == data['stats']['overall_win_pct']['value']
+    # Sam Byrne has no results
+    assert career.trajectory('entry_13', 'events') == []
+    assert career.player_stats('entry_13', 0)['overall_record'] == {'value': '0-0-0'}
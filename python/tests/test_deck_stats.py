@@ -0,0 +1,73 @@
+"""deck_stats.py aggregates, display names and per-event refreshes."""
+
+import copy
+
+import numpy as np
+
+from deck_stats import (
+    _pct, build_deck_stats, display_names, entries_from_db, group_key, refresh_event, verify,
+)
+
+
+def test_groups_match_a_per_entry_sum(fixture_export):
+    assert verify(fixture_export, build_deck_stats(fixture_export)) == []
+
+
+def test_group_key_ignores_case_accents_punctuation_and_spaces():
+    assert {group_key(n) for n in ('Mono-Red ', 'mono red', 'MonoRed', 'Móno Red')} == {'monored'}
+    assert group_key(' - ') == ''
+
+
+def test_percentages_round_half_away_from_zero():
+    got = _pct(np.array([1, 1, 2, 0, 3]), np.array([8, 3, 3, 0, 3]))
+    assert got.tolist() == [12.5, 33.3, 66.7, 0, 100]
+
+
+def test_display_name_is_the_most_common_spelling():
+    entries = [('pt', deck, None, (1, 0, 0, 0, 0, 0)) for deck in ('Mono Red', 'mono-red', 'mono-red', 'Affinity')]
+    entries.append(('pt', 'AFFINITY', 'Team A', (1, 0, 0, 0, 0, 0)))
+    assert display_names(entries) == {
+        'decks': {'affinity': 'AFFINITY', 'monored': 'mono-red'},
+        'teams': {'teama': 'Team A'},
+    }
+
+
+def test_event_and_overall_rows(fixture_export):
+    stats = build_deck_stats(fixture_export)
+    assert sorted(stats['events']) == ['pta', 'ptb', 'ptc', 'ptd', 'pte', 'ptf']
+    # The Limited event has no decks or teams
+    assert stats['events']['ptf']['decks'] == {} and stats['events']['ptf']['teams'] == {}
+
+    results = [event for data in fixture_export['players'].values() for event in data['events'].values()
+               if event['event_code'] == 'PTC' and event['deck'] == 'Deck 2']
+    row = dict(zip(stats['columns'], stats['events']['ptc']['decks']['deck2']))
+    assert row['entries'] == len(results)
+    assert row['top8s'] == sum(event['top8'] for event in results)
+    assert row['constructed_wins'] == sum(event['constructed_wins'] for event in results)
+
+    overall = dict(zip(stats['overall_columns'], stats['overall']['decks']['deck2']))
+    assert overall['events'] == sum('deck2' in event['decks'] for event in stats['events'].values())
+    assert overall['entries'] == sum(event['decks'].get('deck2', [0])[0] for event in stats['events'].values())
+
+
+def test_refresh_from_the_database_matches_a_rebuild(fixture_export, fixture_storage):
+    stats = build_deck_stats(fixture_export)
+    cur = fixture_storage.cursor()
+    assert refresh_event(stats, 'PTB', *entries_from_db(cur, 'ptb')) == stats
+
+    cur.execute("UPDATE results SET deck = %s WHERE event_id = 10", ('Mono-Red',))
+    changed = copy.deepcopy(fixture_export)
+    for data in changed['players'].values():
+        for event in data['events'].values():
+            if event['event_id'] == 10:
+                event['deck'] = 'Mono-Red'
+    assert refresh_event(stats, 'PTA', *entries_from_db(cur, 'PTA')) == build_deck_stats(changed)
+
+
+def test_refresh_without_results_removes_the_event(fixture_export):
+    stats = build_deck_stats(fixture_export)
+    refreshed = refresh_event(stats, 'PTE', [], {})
+    assert 'pte' not in refreshed['events']
+    without = {key: {**data, 'events': {k: e for k, e in data['events'].items() if e['event_code'] != 'PTE'}}
+               for key, data in fixture_export['players'].items()}
+    assert refreshed['overall'] == build_deck_stats({**fixture_export, 'players': without})['overall']
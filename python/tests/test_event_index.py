@@ -0,0 +1,79 @@
+"""event_index.py against getEventResults (scan_event_results)."""
+
+import copy
+
+from event_index import (
+    COLUMNS, build_event_index, event_details, scan_event_results, shard_event_index, verify,
+)
+
+
+def test_index_matches_get_event_results(fixture_export):
+    index = build_event_index(fixture_export)
+    assert sorted(index['events']) == ['pta', 'ptb', 'ptc', 'ptd', 'pte', 'ptf']
+    assert verify(fixture_export, index) == []
+
+
+def test_rows_with_a_finish_only_sorted_by_finish(fixture_export):
+    index = build_event_index(fixture_export)
+    # PTB had one unranked (finish 0) result out of 8
+    ptb = event_details(index, 'ptb')
+    assert ptb['totalPlayers'] == 7
+    assert [r['finish'] for r in ptb['results']] == [1, 2, 3, 4, 5, 6, 7]
+    assert event_details(index, 'pta')['totalPlayers'] == 8
+
+
+def test_lookup_ignores_case_and_fills_event_fields(fixture_export):
+    index = build_event_index(fixture_export)
+    details = event_details(index, 'PtF')
+    assert details == event_details(index, 'ptf')
+    assert (details['eventCode'], details['format'], details['date']) == ('PTF', 'Limited', '2020-05-15')
+    first = details['results'][0]
+    assert list(first) == COLUMNS + ['format', 'date']
+    assert first['deck'] == 'Unknown Deck'
+    assert (first['format'], first['date']) == ('Limited', '2020-05-15')
+    assert event_details(index, 'nope') is None
+
+
+def test_ties_keep_export_order(fixture_export):
+    export = copy.deepcopy(fixture_export)
+    tied = []
+    for player_id, data in export['players'].items():
+        for event in data['events'].values():
+            if event['event_code'] == 'PTA' and event['finish'] in (2, 3):
+                event['finish'] = 2
+                tied.append(player_id)
+    index = build_event_index(export)
+    assert verify(export, index) == []
+    rows = event_details(index, 'pta')['results']
+    assert [r['playerId'] for r in rows if r['finish'] == 2] == tied
+    assert scan_event_results(export, 'PTA')['results'][1:3] == index['events']['pta']['rows'][1:3]
+
+
+def test_shards(fixture_export):
+    index = build_event_index(fixture_export)
+    files = shard_event_index(index)
+    manifest = files.pop('manifest.json')
+    assert sorted(files) == ['pta.json', 'ptb.json', 'ptc.json', 'ptd.json', 'pte.json', 'ptf.json']
+    assert manifest['ptb'] == {'file': 'ptb.json', 'eventCode': 'PTB', 'format': 'Modern',
+                               'date': '2019-06-03', 'totalPlayers': 7}
+    assert files['ptb.json']['events'] == {'ptb': index['events']['ptb']}
+
+
+def test_shard_names_do_not_collide():
+    index = {'version': 1, 'columns': COLUMNS, 'events': {
+        code: {'eventCode': code, 'format': None, 'date': None, 'totalPlayers': 0, 'rows': []}
+        for code in ('pt 1', 'pt/1')
+    }}
+    manifest = shard_event_index(index)['manifest.json']
+    assert manifest['pt 1']['file'] == 'pt_1.json'
+    assert manifest['pt/1']['file'] != 'pt_1.json'
+
+
+def test_verify_reports_differences(fixture_export):
+    index = build_event_index(fixture_export)
+    index['events']['ptc']['rows'].reverse()
+    del index['events']['pte']
+    assert verify(fixture_export, index) == [
+        'ptc: results differ from getEventResults',
+        'pte: found in scan only',
+    ]
@@ -0,0 +1,50 @@
+"""
+build_export (export_builder.py) against the export it replaces.
+
+fixtures/export.json is what sql/generate_app_json.sql returned on
+Postgres for fixtures/export.sql. To regenerate it after changing either,
+load the fixture into an empty database that has the base tables and
+sql/create_player_ratings.sql, then:
+
+  psql "$DB" -Atf sql/generate_app_json.sql \
+    | python -c "import json, sys; print(json.dumps(json.load(sys.stdin), indent=2, ensure_ascii=False))" \
+    > python/tests/fixtures/export.json
+
+and check the change to export.json is the one intended.
+`python storage.py parity <dsn>` runs the same comparison on a live
+database, including the --cached-stats build.
+"""
+
+import json
+
+from storage import export_differences, is_sqlite, table_exists
+
+
+def test_sqlite_build_export_matches_postgres_sql(fixture_storage, fixture_export):
+    built = json.loads(json.dumps(fixture_storage.fetch_export(fixture_storage.cursor())))
+    assert export_differences(fixture_export, built) == []
+
+
+def test_fixture_covers_the_edge_cases(fixture_export):
+    players = fixture_export['players'].values()
+    assert any(not p['events'] for p in players)
+    assert any(p['player_info']['sos_qualification'] for p in players)
+    assert any(p['stats']['rating']['value'] is None for p in players)
+    assert any(e['finish'] == 0 for p in players for e in p['events'].values())
+    assert any(not p['player_info']['full_name'].isascii() for p in players)
+
+
+def test_export_differences_reports_paths():
+    a = {'players': {'entry_1': {'finish': 1, 'top8': True}}}
+    b = {'players': {'entry_1': {'finish': 1, 'top8': 1}, 'entry_2': {}}}
+    assert export_differences(a, b) == [
+        '/players/entry_1/top8: True != 1',
+        '/players/entry_2: only in second',
+    ]
+
+
+def test_table_exists_on_sqlite(fixture_storage):
+    cur = fixture_storage.cursor()
+    assert is_sqlite(cur)
+    assert table_exists(cur, 'player_ratings')
+    assert not table_exists(cur, 'no_such_table')
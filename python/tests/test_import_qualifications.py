@@ -0,0 +1,32 @@
+"""import_qualifications name resolution."""
+
+from import_qualifications import fill_last_keys, resolve_players
+
+
+def add_player(cur, first_name, last_name):
+    cur.execute("INSERT INTO players (first_name, last_name) VALUES (%s, %s) RETURNING id", (first_name, last_name))
+    return cur.fetchone()[0]
+
+
+def test_stored_accents_match_a_plain_spelling(fixture_storage):
+    cur = fixture_storage.cursor()
+    muller = add_player(cur, 'Thomas', 'Müller')
+    invites = [('Thomas', 'Muller', None), ('THOMAS', 'MÜLLER', None), ('Jose', 'Nunez', None),
+               ('José', 'Núñez', None), ('Thomas', 'Miller', None)]
+    assert resolve_players(cur, invites) == [muller, muller, 2, 2, None]
+
+
+def test_last_keys_are_filled_and_follow_renames(fixture_storage):
+    cur = fixture_storage.cursor()
+    assert fill_last_keys(cur) == 13
+    assert fill_last_keys(cur) == 0
+    cur.execute("SELECT last_key FROM players WHERE id = 2")
+    assert cur.fetchone() == ('nunez',)
+
+    cur.execute("UPDATE players SET last_name = %s WHERE id = 2", ('Nuñez-Ruiz',))
+    assert resolve_players(cur, [('Jose', 'Nunez Ruiz', None), ('José', 'Núñez', None)]) == [2, None]
+
+
+def test_aliases_resolve_first(fixture_storage):
+    cur = fixture_storage.cursor()
+    assert resolve_players(cur, [('Joe', 'Nunez', None)], {('joe', 'nunez'): 5}) == [5]
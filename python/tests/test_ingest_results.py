@@ -0,0 +1,97 @@
+"""ingest_results.py batched imports: checkpoints and the quarantine file."""
+
+import csv
+
+import pytest
+
+from ingest_results import import_batched
+from ratings import update_ratings, verify
+
+COLUMNS = [
+    'Event', 'Event Date', 'Format of Event', 'Event #', 'First', 'Last', 'Day 2', 'Top 8',
+    'Limited Wins', 'Limited Loses', 'Limited Draws', 'Drafts', 'Positive Record', 'Losing Record',
+    '# of Trophy', '0-3', 'Constructed Wins', 'Constructed Loses', 'Constructed Draws',
+    'Overall Wins', 'Overall Loses', 'Overall Draws', 'Overall Record',
+    'D1 W', 'D1 L', 'D1 D', 'D2 W', 'D2 L', 'D2 D', 'D3 W', 'D3 L', 'D3 D',
+    'In contention', 'W Streak', 'L Streak', '5 win St', 'Rank', 'Summary', 'Team', 'Deck', 'Notes',
+]
+
+
+class CrashingConn:
+    """The storage, except that the process is killed at commit number `crash_at`, before or after it."""
+
+    def __init__(self, storage, crash_at, committed):
+        self.storage = storage
+        self.crash_at = crash_at
+        self.committed = committed
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+        if self.commits == self.crash_at and not self.committed:
+            raise OSError('killed')
+        self.storage.commit()
+        if self.commits == self.crash_at:
+            raise OSError('killed')
+
+    def rollback(self):
+        self.storage.rollback()
+
+
+def write_sheet(path, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS, restval='')
+        writer.writeheader()
+        for event, event_id, first_name, last_name in rows:
+            writer.writerow({'Event': event, 'Event Date': '01/02/2021', 'Format of Event': 'Standard',
+                             'Event #': event_id, 'First': first_name, 'Last': last_name, 'Rank': 1})
+
+
+def quarantined_rows(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return [int(row['Row']) for row in csv.DictReader(f)]
+
+
+@pytest.mark.parametrize('crash_at, committed', [(1, True), (2, False)])
+def test_quarantine_survives_a_crash_at_commit_without_duplicates(fixture_storage, tmp_path, crash_at, committed):
+    sheet, quarantine = str(tmp_path / 'sheet.csv'), str(tmp_path / 'quarantine.csv')
+    # Event # 10 is PTA's, so the PTX rows fail and are quarantined
+    write_sheet(sheet, [('PTG', 20, 'Ann', 'Lee'), ('PTX', 10, 'Bo', 'Kim'),
+                        ('PTX', 10, 'Cy', 'Ng'), ('PTG', 20, 'Di', 'Ho')])
+    cur = fixture_storage.cursor()
+
+    with pytest.raises(OSError):
+        import_batched(CrashingConn(fixture_storage, crash_at, committed), cur, sheet, quarantine, 2,
+                       None, False, None, None)
+    fixture_storage.rollback()
+    # Written before the commit: the committed batch's row is kept, and an
+    # uncommitted batch's row is dropped by the resume and quarantined again
+    assert quarantined_rows(quarantine) == [2, 3][:crash_at]
+
+    import_batched(fixture_storage, cur, sheet, quarantine, 2, None, False, None, None)
+    assert quarantined_rows(quarantine) == [2, 3]
+    cur.execute("SELECT last_row, rows_imported, rows_quarantined, completed_at IS NOT NULL "
+                "FROM ingest_checkpoints WHERE job = %s", ('sheet.csv',))
+    assert cur.fetchone() == (4, 2, 2, 1)
+    cur.execute("SELECT COUNT(*) FROM results WHERE event_id = 20")
+    assert cur.fetchone()[0] == 2
+
+
+def test_each_batch_commits_its_ratings(fixture_storage, tmp_path):
+    sheet, quarantine = str(tmp_path / 'sheet.csv'), str(tmp_path / 'quarantine.csv')
+    write_sheet(sheet, [('PTG', 20, 'Ann', 'Lee'), ('PTG', 20, 'Bo', 'Kim'), ('PTH', 21, 'Ann', 'Lee')])
+    cur = fixture_storage.cursor()
+    update_ratings(cur, full=True)
+    fixture_storage.commit()
+
+    with pytest.raises(OSError):
+        import_batched(CrashingConn(fixture_storage, 2, False), cur, sheet, quarantine, 2, None, False, None, None)
+    fixture_storage.rollback()
+    cur.execute("SELECT event_id FROM rated_events WHERE event_id >= 20")
+    assert cur.fetchall() == [(20,)]
+    assert verify(cur) == []
+
+    import_batched(fixture_storage, cur, sheet, quarantine, 2, None, False, None, None)
+    cur.execute("SELECT event_id FROM rated_events WHERE event_id >= 20 ORDER BY position")
+    assert cur.fetchall() == [(20,), (21,)]
+    assert verify(cur) == []
@@ -0,0 +1,62 @@
+"""leaderboards.py against the rankingUtils port in rankings.py."""
+
+import copy
+
+import pytest
+
+from leaderboards import BASE_PRESETS, build_leaderboards, lookup_rank, verify
+
+
+@pytest.fixture
+def tied_export(fixture_export):
+    """The fixture export with three players tied on top8s and one on 0."""
+    export = copy.deepcopy(fixture_export)
+    players = list(export['players'].values())
+    for player in players[1:4]:
+        player['stats']['top8s']['value'] = 5
+    players[0]['stats']['top8s']['value'] = 4
+    return export
+
+
+def test_boards_match_ranking_utils(fixture_export):
+    for top_n in (10, 3):
+        assert verify(fixture_export, build_leaderboards(fixture_export, top_n)) == []
+
+
+def test_presets(fixture_export):
+    presets = build_leaderboards(fixture_export)['presets']
+    assert list(presets) == list(BASE_PRESETS) + [
+        'format:Limited', 'format:Modern', 'format:Pioneer', 'format:Standard']
+    assert presets['format:Modern'] == {'formats': ['Modern']}
+
+
+def test_ties_share_a_rank_in_export_order(tied_export):
+    leaderboards = build_leaderboards(tied_export)
+    assert verify(tied_export, leaderboards) == []
+
+    board = leaderboards['boards']['all']['top8s']
+    tied = list(tied_export['players'])[1:4]
+    assert board['top'][:4] == [[tied[0], 5, 1], [tied[1], 5, 1], [tied[2], 5, 1],
+                                [list(tied_export['players'])[0], 4, 4]]
+    assert board['ranks'][:2] == [[5, 1], [4, 4]]
+    assert lookup_rank(board, 5) == 1
+    assert lookup_rank(board, 4) == 4
+    assert lookup_rank(board, 4.5) is None
+
+
+def test_pools_and_missing_values(fixture_export):
+    boards = build_leaderboards(fixture_export)['boards']
+    assert boards['all']['events']['total'] == len(fixture_export['players'])
+    assert boards['sos']['events']['total'] == 2
+    # The player without results has no rating and is left out of its board
+    assert boards['all']['rating']['total'] == len(fixture_export['players']) - 1
+    assert boards['min4events']['events']['ranks'][-1][0] >= 4
+
+
+def test_verify_reports_differences(fixture_export):
+    leaderboards = build_leaderboards(fixture_export)
+    board = leaderboards['boards']['all']['overall_wins']
+    board['total'] += 1
+    board['top'][1][2] = 1 if board['top'][1][2] != 1 else 2
+    problems = verify(fixture_export, leaderboards)
+    assert [p.split(':')[0] for p in problems] == ['all/overall_wins', 'all/overall_wins']
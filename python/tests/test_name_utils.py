@@ -0,0 +1,72 @@
+"""name_utils normalization and the keys built on it."""
+
+import pytest
+
+from aliases import record_alias, resolve_alias
+from ingest_locks import player_lock_key
+from name_utils import NICKNAMES, canonical_first_name, name_key, normalize_name, phonetic_key
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('José Núñez', 'jose nunez'),
+    ('  MÜLLER ', 'muller'),
+    ("O'Brien", 'obrien'),
+    ('Jean-Luc', 'jean luc'),
+    ('Søren', 'soren'),
+    ('Łukasz', 'lukasz'),
+    ('Strauß', 'strauss'),
+    ('Ærø', 'aero'),
+    ('Đorđe', 'dorde'),
+    ('渡辺', '渡辺'),
+    ('김 민준', '김 민준'),
+    ('snake_case', 'snake case'),
+    ('', ''),
+    (None, ''),
+])
+def test_normalize_name(text, expected):
+    assert normalize_name(text) == expected
+
+
+def test_letters_of_every_script_keep_names_apart():
+    assert name_key('Ken', '山本') != name_key('Ken', '田中')
+    assert name_key('Søren', 'Ås') != name_key('Sören', 'Ts')
+    assert name_key('Søren', 'Larsen') == name_key('Soren', 'LARSEN')
+    assert name_key('Ken', '') == ('ken', '')
+
+
+@pytest.mark.parametrize('first, last', [('', ''), ('  ', ' '), ('Ken', '?'), ('—', 'Smith'), ('!', '')])
+def test_name_key_refuses_names_without_letters(first, last):
+    with pytest.raises(ValueError):
+        name_key(first, last)
+
+
+def test_nicknames_only_map_forms_of_the_same_name():
+    for name in ('liam', 'bert', 'andre', 'matthias'):
+        assert name not in NICKNAMES
+        assert canonical_first_name(name.title()) == name
+    assert canonical_first_name('Bob') == 'robert'
+
+
+def test_phonetic_key():
+    assert phonetic_key('Smith') == phonetic_key('Smyth')
+    assert phonetic_key('Nielsen') == phonetic_key('Nielson')
+    assert phonetic_key('') == ''
+
+
+def test_aliases_need_a_key(fixture_storage):
+    cur = fixture_storage.cursor()
+    aliases = {}
+    record_alias(cur, 'Ken', '山本', 1, 'test', aliases)
+    assert resolve_alias(aliases, 'ken', '山本') == 1
+    assert resolve_alias(aliases, 'Ken', '田中') is None
+    with pytest.raises(ValueError):
+        record_alias(cur, 'Ken', '??', 1, 'test', aliases)
+    assert resolve_alias(aliases, 'Ken', '??') is None
+    cur.execute("SELECT first_key, last_key FROM player_aliases")
+    assert cur.fetchall() == [('ken', '山本')]
+
+
+def test_lock_keys_keep_names_apart():
+    assert player_lock_key('Ken', '山本') != player_lock_key('Ken', '田中')
+    assert player_lock_key('José', 'Núñez') == player_lock_key('jose', 'nunez')
+    assert player_lock_key('Ken', '?') != player_lock_key('Ken', '!')
@@ -0,0 +1,36 @@
+"""rankings.py column-wise filters against the per-player rules."""
+
+import copy
+
+import numpy as np
+import pytest
+
+from rankings import apply_filters, filter_mask, stat_columns
+
+
+def players_of(export):
+    return [{'key': key, 'data': data} for key, data in export['players'].items()]
+
+
+@pytest.mark.parametrize('filters', [
+    {'formats': ['Limited']},
+    {'formats': ['Modern', 'Pioneer']},
+    {'formats': ['Vintage']},
+    {'formats': ['Standard'], 'startDate': '2020-01-01'},
+    {'endDate': '2019-12-31', 'minEvents': 2},
+])
+def test_filter_mask_matches_apply_filters(fixture_export, filters):
+    players = players_of(fixture_export)
+    columns = stat_columns(players, ['events', 'day2s', 'top8s'], fixture_export['formats'])
+    kept = {id(p) for p in apply_filters(players, filters)}
+    assert filter_mask(players, columns, filters).tolist() == [id(p) in kept for p in players]
+
+
+def test_format_filter_has_no_limit_on_formats(fixture_export):
+    players = players_of(copy.deepcopy(fixture_export))
+    formats = [f'Format {i:03d}' for i in range(100)]
+    for i, player in enumerate(players):
+        player['data']['filter_keys']['format_counts'] = {formats[64 + i]: 1}
+    columns = stat_columns(players, ['events'], formats)
+    mask = filter_mask(players, columns, {'formats': [formats[64], formats[70]]})
+    assert np.flatnonzero(mask).tolist() == [0, 6]
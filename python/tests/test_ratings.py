@@ -0,0 +1,64 @@
+"""ratings.py incremental updates against a full replay."""
+
+import pytest
+
+from ratings import update_ratings, verify
+
+
+@pytest.fixture
+def cur(fixture_storage):
+    """A cursor on the fixture with rated_events and rating_history built by a full replay."""
+    cur = fixture_storage.cursor()
+    update_ratings(cur, full=True)
+    assert verify(cur) == []
+    return cur
+
+
+def add_event(cur, event_id, date, finishes):
+    """An event with one result per (player_id, finish, wins, losses)."""
+    cur.execute("INSERT INTO events (id, name, date, format) VALUES (%s, %s, %s, %s)",
+                (event_id, f'PT{event_id}', date, 'Standard'))
+    cur.executemany("INSERT INTO results (player_id, event_id, finish, overall_wins, overall_losses, overall_draws) "
+                    "VALUES (%s, %s, %s, %s, %s, 0)",
+                    [(player_id, event_id, finish, wins, losses) for player_id, finish, wins, losses in finishes])
+
+
+def test_unchanged_history_replays_nothing(cur):
+    summary = update_ratings(cur, event_ids=[])
+    assert summary['replayed'] == 0
+    assert verify(cur) == []
+
+
+def test_appended_event_applies_on_top(cur):
+    add_event(cur, 20, '2021-01-10', [(1, 1, 5, 0), (2, 2, 4, 1), (13, 3, 2, 3)])
+    summary = update_ratings(cur, event_ids=[20])
+    assert summary['replayed'] == 1 and summary['players'] == 3
+    assert verify(cur) == []
+
+
+def test_changed_finish_mid_history_replays_from_that_event(cur):
+    cur.execute("SELECT player_id FROM results WHERE event_id = 12 AND finish = 1")
+    winner = cur.fetchone()[0]
+    cur.execute("UPDATE results SET finish = 3 WHERE event_id = 12 AND player_id = %s", (winner,))
+    summary = update_ratings(cur, event_ids=[12])
+    assert summary['replayed_from'] == 2
+    assert verify(cur) == []
+
+
+def test_deleted_event_drops_out(cur):
+    cur.execute("DELETE FROM results WHERE event_id = 11")
+    cur.execute("DELETE FROM events WHERE id = 11")
+    summary = update_ratings(cur)
+    assert summary['replayed_from'] == 1
+    cur.execute("SELECT COUNT(*) FROM rated_events WHERE event_id = 11")
+    assert cur.fetchone()[0] == 0
+    assert verify(cur) == []
+
+
+def test_earlier_dated_import_is_replayed_in_date_order(cur):
+    add_event(cur, 21, '2019-01-01', [(1, 2, 3, 2), (3, 1, 5, 0), (13, 3, 1, 4)])
+    summary = update_ratings(cur, event_ids=[21])
+    assert summary['replayed_from'] == 0
+    cur.execute("SELECT event_id FROM rated_events ORDER BY position")
+    assert cur.fetchone()[0] == 21
+    assert verify(cur) == []
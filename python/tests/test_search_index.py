@@ -0,0 +1,105 @@
+"""search_index.search: matching, ranking and the precomputed hot prefixes."""
+
+import random
+
+import pytest
+
+import search_index
+from search_index import HOT_PREFIX_RESULTS, _search, build_search_index, search
+
+
+def make_export(players):
+    """Minimal export: players is [(id, first, last, events)]."""
+    return {'players': {
+        f'entry_{player_id}': {
+            'player_info': {'first_name': first, 'last_name': last, 'full_name': f'{first} {last}'},
+            'stats': {'events': {'value': events}},
+        }
+        for player_id, first, last, events in players
+    }}
+
+
+def names(results):
+    return [r['fullName'] for r in results]
+
+
+@pytest.fixture
+def index():
+    return build_search_index(make_export([
+        (1, 'Ann', 'Lee', 3),
+        (2, 'Anna', 'Berg', 9),
+        (3, 'Lee', 'Annis', 5),
+        (4, 'José', 'Núñez', 2),
+        (5, 'Jon', 'Smith', 7),
+        (6, 'Dan', 'Lee', 3),
+        (7, 'Jonathan', 'Smyth', 1),
+    ]), aliases={7: [('jon', 'smith')], 1: [('ann', 'lee')]})
+
+
+def test_prefix_of_first_or_last_name(index):
+    assert names(search(index, 'ber')) == ['Anna Berg']
+    assert names(search(index, 'smi')) == ['Jon Smith', 'Jonathan Smyth']
+
+
+def test_substring_inside_a_name_does_not_match(index):
+    # Unlike the app's includes() filter, only the start of a name part matches
+    assert search(index, 'nna') == []
+    assert search(index, 'erg') == []
+    assert search(index, 'n lee') == []
+
+
+def test_match_class_order(index):
+    # Equal, then full name prefix, then token prefixes, each by events
+    assert names(search(index, 'ann lee')) == ['Ann Lee', 'Lee Annis']
+    assert names(search(index, 'ann')) == ['Anna Berg', 'Ann Lee', 'Lee Annis']
+    assert names(search(index, 'lee')) == ['Lee Annis', 'Ann Lee', 'Dan Lee']
+
+
+def test_ties_break_on_events_then_name(index):
+    # Ann Lee and Dan Lee both have 3 events
+    assert names(search(index, 'le')) == ['Lee Annis', 'Ann Lee', 'Dan Lee']
+
+
+def test_every_query_token_must_match(index):
+    assert names(search(index, 'lee a')) == ['Lee Annis', 'Ann Lee']
+    assert names(search(index, 'berg ann')) == ['Anna Berg']
+    assert search(index, 'anna lee') == []
+
+
+def test_alias_matches_rank_after_name_matches(index):
+    assert names(search(index, 'jon')) == ['Jon Smith', 'Jonathan Smyth']
+    assert names(search(index, 'jon smith')) == ['Jon Smith', 'Jonathan Smyth']
+    # Aliases equal to the player's own name are not stored
+    assert index['aliases'] == {'6': ['jon smith']}
+
+
+def test_accents_case_and_punctuation_are_ignored(index):
+    for query in ('nunez', 'NÚÑEZ', 'José', 'jose n', '  Jose   Nunez ', 'núñez.'):
+        assert names(search(index, query)) == ['José Núñez'], query
+    assert search(index, '  ') == []
+
+
+def test_limit(index):
+    assert names(search(index, 'a', limit=2)) == ['Anna Berg', 'Ann Lee']
+
+
+def test_hot_prefixes_match_the_full_search(monkeypatch):
+    monkeypatch.setattr(search_index, 'HOT_PREFIX_THRESHOLD', 8)
+    rng = random.Random(3)
+    firsts = ['Ann', 'Anna', 'Annika', 'Jon', 'José', 'Max', 'Mia', 'Lee']
+    lasts = ['Lee', 'Leeds', 'Núñez', 'Nunes', 'Smith', 'Ann', 'Max']
+    players = [(i, rng.choice(firsts), rng.choice(lasts), rng.randint(0, 6)) for i in range(1, 301)]
+    aliases = {i: [('annie', 'lee')] for i in range(1, 301, 17)}
+    index = build_search_index(make_export(players), aliases)
+
+    assert {'a', 'ann', 'annie', 'lee', 'n', 'max'} <= set(index['hot'])
+    for prefix, ranked in index['hot'].items():
+        assert ranked == _search(index, prefix, HOT_PREFIX_RESULTS), prefix
+    # Past HOT_PREFIX_RESULTS the search runs in full
+    assert len(search(index, 'a', limit=HOT_PREFIX_RESULTS + 5)) == HOT_PREFIX_RESULTS + 5
+
+
+def test_fixture_export(fixture_export):
+    index = build_search_index(fixture_export)
+    assert names(search(index, 'nunez')) == ['José Núñez']
+    assert [r['id'] for r in search(index, 'sam b')] == ['entry_13']
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Validate a results CSV before it is loaded into the database.
+Loads the whole sheet into column arrays and checks every invariant in
+bulk, producing a per-row error report instead of silently coercing bad
+cells the way ingest_results.safe_int does.
+"""
+
+import csv
+import sys
+import os
+import numpy as np
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+DATE_FORMAT = '%d/%m/%Y'
+
+# Numeric columns; blank cells are allowed and treated as 0
+INT_COLUMNS = [
+    'Event #', 'Day 2', 'Top 8', 'In contention', 'Rank',
+    'Limited Wins', 'Limited Loses', 'Limited Draws',
+    'Drafts', 'Positive Record', 'Losing Record', '# of Trophy', '0-3',
+    'Constructed Wins', 'Constructed Loses', 'Constructed Draws',
+    'Overall Wins', 'Overall Loses', 'Overall Draws',
+    'D1 W', 'D1 L', 'D1 D', 'D2 W', 'D2 L', 'D2 D', 'D3 W', 'D3 L', 'D3 D',
+    'W Streak', 'L Streak', '5 win St',
+]
+
+FLAG_COLUMNS = ['Day 2', 'Top 8', 'In contention']
+
+# (overall, limited, constructed, day1, day2, day3) columns per outcome
+OUTCOME_COLUMNS = {
+    'wins': ('Overall Wins', 'Limited Wins', 'Constructed Wins', 'D1 W', 'D2 W', 'D3 W'),
+    'losses': ('Overall Loses', 'Limited Loses', 'Constructed Loses', 'D1 L', 'D2 L', 'D3 L'),
+    'draws': ('Overall Draws', 'Limited Draws', 'Constructed Draws', 'D1 D', 'D2 D', 'D3 D'),
+}
+
+# Columns that round_results.derive_results replaces when a rounds file is used
+DERIVED_COLUMNS = {
+    'Limited Wins', 'Limited Loses', 'Limited Draws',
+    'Drafts', 'Positive Record', 'Losing Record', '# of Trophy', '0-3',
+    'Constructed Wins', 'Constructed Loses', 'Constructed Draws',
+    'Overall Wins', 'Overall Loses', 'Overall Draws',
+    'D1 W', 'D1 L', 'D1 D', 'D2 W', 'D2 L', 'D2 D', 'D3 W', 'D3 L', 'D3 D',
+    'W Streak', 'L Streak', '5 win St',
+}
+
+
+def load_columns(csv_file: str) -> Dict[str, np.ndarray]:
+    """
+    Read the sheet into one stripped string array per column.
+    Blank rows (no First or Last) are dropped; '_line' holds the CSV line
+    number of each remaining row for the report.
+    """
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        headers = reader.fieldnames or []
+        rows = []
+        lines = []
+        for line_num, row in enumerate(reader, start=2):
+            if not (row.get('Last') or '').strip() and not (row.get('First') or '').strip():
+                continue
+            rows.append(row)
+            lines.append(line_num)
+
+    columns = {
+        name: np.char.strip(np.array([row.get(name) or '' for row in rows], dtype=str))
+        for name in headers
+    }
+    columns['_line'] = np.array(lines, dtype=np.int64)
+    return columns
+
+
+def parse_int_column(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return (ints, valid) for a string column; blanks are valid and read as 0.
+    Only ASCII digits count: str.isdigit also accepts superscripts and
+    other non-decimal digits, which the int conversion rejects. Checked
+    once per distinct value.
+    """
+    blank = values == ''
+    unique_values, inverse = np.unique(values, return_inverse=True)
+    # At most 18 digits, so every valid value fits in an int64
+    digits = np.array([v.isascii() and v.isdigit() and len(v) <= 18 for v in unique_values], dtype=bool)
+    valid = blank | digits[inverse.reshape(-1)]
+    ints = np.where(valid & ~blank, values, '0').astype(np.int64)
+    return ints, valid
+
+
+def parse_date_column(values: np.ndarray) -> np.ndarray:
+    """Return a mask of parseable dates. Each distinct date string is parsed once."""
+    unique_dates, inverse = np.unique(values, return_inverse=True)
+
+    def parses(date_str: str) -> bool:
+        try:
+            datetime.strptime(date_str, DATE_FORMAT)
+            return True
+        except ValueError:
+            return False
+
+    ok = np.array([parses(d) for d in unique_dates], dtype=bool)
+    return ok[inverse.reshape(-1)]
+
+
+def validate_columns(columns: Dict[str, np.ndarray], check_derived: bool = True) -> List[Tuple[int, int, str, str]]:
+    """
+    Check all invariants over the whole sheet.
+    Returns a list of (line, row index, check, message), ordered by line.
+    With check_derived=False the aggregate columns that round_results
+    derives are not checked (they will be replaced on load).
+    """
+    errors = []
+
+    def report(mask: np.ndarray, check: str, message: str) -> None:
+        for i in np.flatnonzero(mask):
+            errors.append((int(columns['_line'][i]), int(i), check, message))
+
+    missing = [name for name in INT_COLUMNS + ['Event', 'Event Date', 'Format of Event'] if name not in columns]
+    if missing:
+        return [(1, -1, 'header', f"Missing column(s): {', '.join(missing)}")]
+
+    ints = {}
+    for name in INT_COLUMNS:
+        values, valid = parse_int_column(columns[name])
+        ints[name] = values
+        if check_derived or name not in DERIVED_COLUMNS:
+            report(~valid, 'integer', f"'{name}' is not a whole number")
+
+    for name in FLAG_COLUMNS:
+        report(ints[name] > 1, 'flag', f"'{name}' must be 0 or 1")
+
+    report(~parse_date_column(columns['Event Date']), 'date',
+           "'Event Date' is not a valid DD/MM/YYYY date")
+    report(columns['Event'] == '', 'event', "'Event' is blank")
+    report(ints['Event #'] == 0, 'event', "'Event #' is blank")
+
+    if not check_derived:
+        return sorted(errors)
+
+    for outcome, (overall, limited, constructed, day1, day2, day3) in OUTCOME_COLUMNS.items():
+        report(ints[overall] != ints[limited] + ints[constructed], 'format split',
+               f"overall {outcome} != limited + constructed")
+        report(ints[overall] != ints[day1] + ints[day2] + ints[day3], 'day split',
+               f"overall {outcome} != day1 + day2 + day3")
+
+    drafts = ints['Drafts']
+    report(ints['Positive Record'] + ints['Losing Record'] > drafts, 'drafts',
+           "positive + losing drafts > drafts")
+    report(ints['# of Trophy'] > ints['Positive Record'], 'drafts',
+           "trophy drafts > positive drafts")
+    report(ints['0-3'] > ints['Losing Record'], 'drafts',
+           "0-3 drafts > losing drafts")
+
+    day2_matches = ints['D2 W'] + ints['D2 L'] + ints['D2 D']
+    day3_matches = ints['D3 W'] + ints['D3 L'] + ints['D3 D']
+    made_day2 = ints['Day 2'] == 1
+    made_top8 = ints['Top 8'] == 1
+    report(made_day2 & (day2_matches == 0), 'day 2 flag', "'Day 2' is set but there is no day 2 record")
+    report(~made_day2 & (day2_matches > 0), 'day 2 flag', "'Day 2' is not set but there is a day 2 record")
+    report(made_top8 & ~made_day2, 'top 8 flag', "'Top 8' is set but 'Day 2' is not")
+    report(made_top8 & (day3_matches == 0), 'top 8 flag', "'Top 8' is set but there is no day 3 record")
+    report(~made_top8 & (day3_matches > 0), 'top 8 flag', "'Top 8' is not set but there is a day 3 record")
+
+    longest = np.maximum(ints['W Streak'], ints['L Streak'])
+    total = ints['Overall Wins'] + ints['Overall Loses'] + ints['Overall Draws']
+    report(longest > total, 'streak', "streak is longer than the number of matches played")
+
+    return sorted(errors)
+
+
+def write_report(errors: List[Tuple[int, int, str, str]], columns: Dict[str, np.ndarray], out) -> None:
+    """Write the error report as CSV: Line, First, Last, Check, Message."""
+    writer = csv.writer(out)
+    writer.writerow(['Line', 'First', 'Last', 'Check', 'Message'])
+    for line, i, check, message in errors:
+        first_name = columns['First'][i] if i >= 0 and 'First' in columns else ''
+        last_name = columns['Last'][i] if i >= 0 and 'Last' in columns else ''
+        writer.writerow([line, first_name, last_name, check, message])
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    csv_file = os.path.join(script_dir, 'data.csv')
+
+    report_file = None
+    if '--report' in sys.argv:
+        report_idx = sys.argv.index('--report')
+        if report_idx + 1 < len(sys.argv):
+            report_file = sys.argv[report_idx + 1]
+
+    args = [a for a in sys.argv[1:] if not a.startswith('--') and a != report_file]
+    if args:
+        csv_file = args[0]
+
+    if not os.path.exists(csv_file):
+        print(f"Error: Could not find '{csv_file}'", file=sys.stderr)
+        sys.exit(1)
+
+    columns = load_columns(csv_file)
+    errors = validate_columns(columns)
+
+    if report_file:
+        with open(report_file, 'w', encoding='utf-8', newline='') as f:
+            write_report(errors, columns, f)
+    elif errors:
+        write_report(errors, columns, sys.stdout)
+
+    print(f"\nChecked {len(columns['_line'])} row(s) in {csv_file}", file=sys.stderr)
+    if errors:
+        bad_rows = len({line for line, _, _, _ in errors})
+        print(f"✗ {len(errors)} problem(s) on {bad_rows} row(s)", file=sys.stderr)
+        sys.exit(1)
+    print("✓ No problems found", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
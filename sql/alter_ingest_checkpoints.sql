@@ -0,0 +1,20 @@
+-- Key ingest_checkpoints on the import job instead of the file's sha256,
+-- so editing a half-imported CSV no longer starts a new checkpoint at
+-- row 0 (python/ingest_results.py --job). Existing checkpoints become the
+-- job named after their file; where a file name has several (one per
+-- version of the file), the most recently updated one is kept.
+BEGIN;
+
+ALTER TABLE ingest_checkpoints ADD COLUMN IF NOT EXISTS job TEXT;
+UPDATE ingest_checkpoints SET job = file_name WHERE job IS NULL;
+
+DELETE FROM ingest_checkpoints c
+USING ingest_checkpoints newer
+WHERE c.job = newer.job
+  AND (c.updated_at, c.file_hash) < (newer.updated_at, newer.file_hash);
+
+ALTER TABLE ingest_checkpoints DROP CONSTRAINT IF EXISTS ingest_checkpoints_pkey;
+ALTER TABLE ingest_checkpoints ALTER COLUMN job SET NOT NULL;
+ALTER TABLE ingest_checkpoints ADD PRIMARY KEY (job);
+
+COMMIT;
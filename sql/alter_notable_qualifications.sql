@@ -0,0 +1,37 @@
+-- Invitation source for each qualification (the 'Invitation Source' column
+-- of the invite lists), and one qualification per player and event so
+-- python/import_qualifications.py can insert with ON CONFLICT DO NOTHING.
+ALTER TABLE notable_qualifications ADD COLUMN IF NOT EXISTS invitation_source TEXT;
+
+-- Drop duplicates left by earlier imports before adding the constraint
+DELETE FROM notable_qualifications nq
+USING notable_qualifications other
+WHERE nq.player_id = other.player_id
+  AND nq.event_id = other.event_id
+  AND nq.id > other.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS notable_qualifications_player_event_idx
+  ON notable_qualifications (player_id, event_id);
+
+-- Name resolution looks players up by normalized last name (name_utils.
+-- normalize_name: case, accents and punctuation ignored). The import fills
+-- last_key where it is NULL, i.e. for players created by other scripts or
+-- renamed since (the trigger clears the key when last_name changes).
+DROP INDEX IF EXISTS players_last_name_lower_idx;
+ALTER TABLE players ADD COLUMN IF NOT EXISTS last_key TEXT;
+CREATE INDEX IF NOT EXISTS players_last_key_idx ON players (last_key);
+CREATE INDEX IF NOT EXISTS players_last_key_missing_idx ON players (id) WHERE last_key IS NULL;
+
+CREATE OR REPLACE FUNCTION players_clear_last_key() RETURNS trigger AS $$
+BEGIN
+  IF NEW.last_name IS DISTINCT FROM OLD.last_name AND NEW.last_key IS NOT DISTINCT FROM OLD.last_key THEN
+    NEW.last_key := NULL;
+  END IF;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS players_clear_last_key ON players;
+CREATE TRIGGER players_clear_last_key
+  BEFORE UPDATE OF last_name ON players
+  FOR EACH ROW EXECUTE FUNCTION players_clear_last_key();
@@ -0,0 +1,16 @@
+-- Progress of checkpointed results imports (python/ingest_results.py --batch-size).
+-- One row per import job (--job, default the CSV's file name), updated in
+-- the same transaction as each committed batch, so last_row is always the
+-- last row whose result (or quarantine) is durable and a re-run resumes
+-- after it. file_hash (sha256 of the file) tells a re-run whether the file
+-- was edited since. Tables created before jobs: sql/alter_ingest_checkpoints.sql.
+CREATE TABLE IF NOT EXISTS ingest_checkpoints (
+  job TEXT PRIMARY KEY,
+  file_hash TEXT NOT NULL,
+  file_name TEXT NOT NULL,
+  last_row INTEGER NOT NULL DEFAULT 0,
+  rows_imported INTEGER NOT NULL DEFAULT 0,
+  rows_quarantined INTEGER NOT NULL DEFAULT 0,
+  completed_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
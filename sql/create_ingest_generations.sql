@@ -0,0 +1,9 @@
+-- One row per committed ingest transaction (python/ingest_locks.py).
+-- Numbers are assigned under an advisory lock right before the commit, so
+-- they commit in order and MAX(generation) in a snapshot says exactly
+-- which ingests the snapshot includes. The exporter records it.
+CREATE TABLE IF NOT EXISTS ingest_generations (
+  generation BIGINT PRIMARY KEY,
+  source TEXT NOT NULL,
+  committed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
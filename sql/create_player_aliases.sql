@@ -0,0 +1,14 @@
+-- Known name variants for each player, keyed on the normalized name
+-- (python/name_utils.name_key: lowercase, accents and punctuation stripped).
+-- Populated when a potential match is confirmed or players are merged,
+-- and loaded into memory by the ingest and qualification scripts.
+CREATE TABLE IF NOT EXISTS player_aliases (
+  first_key TEXT NOT NULL,
+  last_key TEXT NOT NULL,
+  player_id INTEGER NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+  source TEXT,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  PRIMARY KEY (first_key, last_key)
+);
+
+CREATE INDEX IF NOT EXISTS player_aliases_player_id_idx ON player_aliases (player_id);
@@ -0,0 +1,29 @@
+-- Rating engine state (python/ratings.py).
+-- player_ratings is each player's current rating; rating_history is the
+-- state after every rated event, so a correction can restore the state
+-- before the earliest changed event and replay only from there.
+-- rated_events records the order events were applied in and a hash of
+-- their results, which is how changed events are found.
+CREATE TABLE IF NOT EXISTS player_ratings (
+  player_id INTEGER PRIMARY KEY REFERENCES players(id) ON DELETE CASCADE,
+  rating DOUBLE PRECISION NOT NULL,
+  rd DOUBLE PRECISION NOT NULL,
+  events INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rated_events (
+  event_id INTEGER PRIMARY KEY,
+  position INTEGER NOT NULL UNIQUE,
+  results_hash TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rating_history (
+  event_id INTEGER NOT NULL REFERENCES rated_events(event_id) ON DELETE CASCADE,
+  player_id INTEGER NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+  rating DOUBLE PRECISION NOT NULL,
+  rd DOUBLE PRECISION NOT NULL,
+  events INTEGER NOT NULL,
+  PRIMARY KEY (event_id, player_id)
+);
+
+CREATE INDEX IF NOT EXISTS rating_history_player_id_idx ON rating_history (player_id);
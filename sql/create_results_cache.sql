@@ -0,0 +1,103 @@
+-- Per-partition aggregate cache for results (python/partitions.py).
+-- A trigger bumps results_event_versions for every event whose results
+-- are inserted, updated or deleted (results without an event count as
+-- event 0), so partitions.py can tell which partitions changed without
+-- reading them. results_partition_totals holds each player's totals
+-- (export_builder.TOTAL_COLUMNS) within a partition and
+-- player_cached_totals their sum over all partitions; both are only
+-- written by `python partitions.py maintain`.
+-- Re-run after sql/partition_results.sql to put the trigger on the
+-- partitioned table.
+CREATE TABLE IF NOT EXISTS results_event_versions (
+  event_id INTEGER PRIMARY KEY,
+  version BIGINT NOT NULL DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS results_partition_cache (
+  partition_no INTEGER PRIMARY KEY,
+  signature TEXT NOT NULL,
+  refreshed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS results_partition_totals (
+  partition_no INTEGER NOT NULL REFERENCES results_partition_cache(partition_no) ON DELETE CASCADE,
+  player_id INTEGER NOT NULL,
+  events BIGINT NOT NULL DEFAULT 0,
+  day2s BIGINT NOT NULL DEFAULT 0,
+  in_contentions BIGINT NOT NULL DEFAULT 0,
+  top8s BIGINT NOT NULL DEFAULT 0,
+  overall_wins BIGINT NOT NULL DEFAULT 0,
+  overall_losses BIGINT NOT NULL DEFAULT 0,
+  overall_draws BIGINT NOT NULL DEFAULT 0,
+  limited_wins BIGINT NOT NULL DEFAULT 0,
+  limited_losses BIGINT NOT NULL DEFAULT 0,
+  limited_draws BIGINT NOT NULL DEFAULT 0,
+  constructed_wins BIGINT NOT NULL DEFAULT 0,
+  constructed_losses BIGINT NOT NULL DEFAULT 0,
+  constructed_draws BIGINT NOT NULL DEFAULT 0,
+  day1_wins BIGINT NOT NULL DEFAULT 0,
+  day1_losses BIGINT NOT NULL DEFAULT 0,
+  day1_draws BIGINT NOT NULL DEFAULT 0,
+  day2_wins BIGINT NOT NULL DEFAULT 0,
+  day2_losses BIGINT NOT NULL DEFAULT 0,
+  day2_draws BIGINT NOT NULL DEFAULT 0,
+  day3_wins BIGINT NOT NULL DEFAULT 0,
+  day3_losses BIGINT NOT NULL DEFAULT 0,
+  day3_draws BIGINT NOT NULL DEFAULT 0,
+  drafts BIGINT NOT NULL DEFAULT 0,
+  winning_drafts BIGINT NOT NULL DEFAULT 0,
+  losing_drafts BIGINT NOT NULL DEFAULT 0,
+  trophy_drafts BIGINT NOT NULL DEFAULT 0,
+  streaks_5 BIGINT NOT NULL DEFAULT 0,
+  PRIMARY KEY (partition_no, player_id)
+);
+
+CREATE TABLE IF NOT EXISTS player_cached_totals (
+  player_id INTEGER PRIMARY KEY,
+  events BIGINT NOT NULL DEFAULT 0,
+  day2s BIGINT NOT NULL DEFAULT 0,
+  in_contentions BIGINT NOT NULL DEFAULT 0,
+  top8s BIGINT NOT NULL DEFAULT 0,
+  overall_wins BIGINT NOT NULL DEFAULT 0,
+  overall_losses BIGINT NOT NULL DEFAULT 0,
+  overall_draws BIGINT NOT NULL DEFAULT 0,
+  limited_wins BIGINT NOT NULL DEFAULT 0,
+  limited_losses BIGINT NOT NULL DEFAULT 0,
+  limited_draws BIGINT NOT NULL DEFAULT 0,
+  constructed_wins BIGINT NOT NULL DEFAULT 0,
+  constructed_losses BIGINT NOT NULL DEFAULT 0,
+  constructed_draws BIGINT NOT NULL DEFAULT 0,
+  day1_wins BIGINT NOT NULL DEFAULT 0,
+  day1_losses BIGINT NOT NULL DEFAULT 0,
+  day1_draws BIGINT NOT NULL DEFAULT 0,
+  day2_wins BIGINT NOT NULL DEFAULT 0,
+  day2_losses BIGINT NOT NULL DEFAULT 0,
+  day2_draws BIGINT NOT NULL DEFAULT 0,
+  day3_wins BIGINT NOT NULL DEFAULT 0,
+  day3_losses BIGINT NOT NULL DEFAULT 0,
+  day3_draws BIGINT NOT NULL DEFAULT 0,
+  drafts BIGINT NOT NULL DEFAULT 0,
+  winning_drafts BIGINT NOT NULL DEFAULT 0,
+  losing_drafts BIGINT NOT NULL DEFAULT 0,
+  trophy_drafts BIGINT NOT NULL DEFAULT 0,
+  streaks_5 BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION bump_results_event_version() RETURNS trigger AS $$
+BEGIN
+  IF TG_OP <> 'INSERT' THEN
+    INSERT INTO results_event_versions AS v (event_id) VALUES (COALESCE(OLD.event_id, 0))
+    ON CONFLICT (event_id) DO UPDATE SET version = v.version + 1;
+  END IF;
+  IF TG_OP <> 'DELETE' THEN
+    INSERT INTO results_event_versions AS v (event_id) VALUES (COALESCE(NEW.event_id, 0))
+    ON CONFLICT (event_id) DO UPDATE SET version = v.version + 1;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS results_event_version ON results;
+CREATE TRIGGER results_event_version
+  AFTER INSERT OR UPDATE OR DELETE ON results
+  FOR EACH ROW EXECUTE FUNCTION bump_results_event_version();
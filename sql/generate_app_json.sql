@@ -39,7 +39,7 @@ WITH player_events AS (
     r.trophy_drafts,
     r.no_win_drafts,
     r.overall_record,
-    ROW_NUMBER() OVER (PARTITION BY p.id ORDER BY e.date) as event_number
+    ROW_NUMBER() OVER (PARTITION BY p.id ORDER BY e.date, r.id) as event_number
   FROM players p
   LEFT JOIN results r ON p.id = r.player_id
   LEFT JOIN events e ON r.event_id = e.id
@@ -132,6 +132,37 @@ player_qualifications AS (
       AND nq.event_id = 14
     ) as sos_qualification
   FROM player_stats ps
+),
+player_rating_ranks AS (
+  -- Ranked on the exported (rounded) value so ties match the app's ranking
+  SELECT
+    player_id,
+    ROUND(rating::numeric, 1) AS rating,
+    RANK() OVER (ORDER BY ROUND(rating::numeric, 1) DESC) AS rating_rank
+  FROM player_ratings
+),
+format_dictionary AS (
+  -- The formats list, in byte order like Python's sort
+  SELECT format, ROW_NUMBER() OVER (ORDER BY format COLLATE "C") AS position
+  FROM (SELECT DISTINCT format FROM events WHERE format IS NOT NULL) f
+),
+player_date_keys AS (
+  SELECT player_id, MIN(date) AS first_date, MAX(date) AS last_date
+  FROM player_events
+  WHERE event_id IS NOT NULL
+  GROUP BY player_id
+),
+player_format_keys AS (
+  SELECT
+    pfc.player_id,
+    json_object_agg(pfc.format, pfc.events ORDER BY pfc.format COLLATE "C") AS format_counts
+  FROM (
+    SELECT player_id, format, COUNT(*) AS events
+    FROM player_events
+    WHERE event_id IS NOT NULL AND format IS NOT NULL
+    GROUP BY player_id, format
+  ) pfc
+  GROUP BY pfc.player_id
 )
 
 -- Main SELECT: Build JSON with players data and events
@@ -157,6 +188,7 @@ SELECT json_build_object(
               'summary', pe.summary,
               'deck', pe.deck,
               'notes', pe.notes,
+              'team', pe.team,
               'day2', pe.day2,
               'top8', pe.top8,
               'in_contention', pe.in_contention,
@@ -228,12 +260,21 @@ SELECT json_build_object(
           'losing_drafts', json_build_object('value', ps.losing_drafts),
           'winning_drafts_pct', json_build_object('value', ps.winning_drafts_pct),
           'trophy_drafts', json_build_object('value', ps.trophy_drafts),
-          '5streaks', json_build_object('value', ps.streaks_5)
+          '5streaks', json_build_object('value', ps.streaks_5),
+          'rating', json_build_object('value', prr.rating, 'rank', prr.rating_rank)
+        ),
+        'filter_keys', json_build_object(
+          'first_date', pdk.first_date,
+          'last_date', pdk.last_date,
+          'format_counts', COALESCE(pfk.format_counts, '{}'::json)
         )
       )
     )
     FROM player_stats ps
     LEFT JOIN player_qualifications pq ON ps.player_id = pq.player_id
+    LEFT JOIN player_rating_ranks prr ON ps.player_id = prr.player_id
+    LEFT JOIN player_date_keys pdk ON ps.player_id = pdk.player_id
+    LEFT JOIN player_format_keys pfk ON ps.player_id = pfk.player_id
   ),
   'events', (
     SELECT json_object_agg(
@@ -246,5 +287,6 @@ SELECT json_build_object(
       )
     )
     FROM events e
-  )
+  ),
+  'formats', (SELECT json_agg(format ORDER BY position) FROM format_dictionary)
 ) AS result;
\ No newline at end of file
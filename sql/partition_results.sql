@@ -0,0 +1,69 @@
+-- Partition results by event id (Postgres only; python/partitions.py).
+-- Recreates results as PARTITION BY RANGE (event_id) with every row in
+-- results_default. Afterwards:
+--   psql -f sql/create_results_cache.sql     (puts the cache trigger on the new table)
+--   python partitions.py maintain --rebuild  (moves each block of partitions.PARTITION_SIZE
+--                                             event ids into its own partition and fills the cache)
+-- New events land in results_default until the next `maintain`.
+--
+-- Unique constraints on a partitioned table must include event_id, which
+-- can be NULL, so id gets a plain index instead of the primary key. The
+-- id sequence (serial or identity) carries on from the old table, and
+-- its foreign keys are copied over.
+BEGIN;
+
+DO $$
+DECLARE
+  id_sequence TEXT := pg_get_serial_sequence('results', 'id');
+  id_identity BOOLEAN;
+  fk RECORD;
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'results'::regclass) THEN
+    RAISE NOTICE 'results is already partitioned';
+    RETURN;
+  END IF;
+
+  SELECT attidentity <> '' INTO id_identity
+  FROM pg_attribute
+  WHERE attrelid = 'results'::regclass AND attname = 'id';
+
+  ALTER TABLE results RENAME TO results_flat;
+  IF id_sequence IS NOT NULL AND NOT id_identity THEN
+    -- Keep the serial sequence when the old table is dropped
+    EXECUTE format('ALTER SEQUENCE %s OWNED BY NONE', id_sequence);
+  END IF;
+
+  CREATE TABLE results (LIKE results_flat INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+    PARTITION BY RANGE (event_id);
+  CREATE TABLE results_default PARTITION OF results DEFAULT;
+
+  FOR fk IN
+    SELECT pg_get_constraintdef(oid) AS definition
+    FROM pg_constraint
+    WHERE conrelid = 'results_flat'::regclass AND contype = 'f'
+  LOOP
+    EXECUTE format('ALTER TABLE results ADD %s', fk.definition);
+  END LOOP;
+
+  -- Partitioned indexes: every partition gets its own copy
+  CREATE INDEX ON results (id);
+  CREATE INDEX ON results (player_id);
+  CREATE INDEX ON results (event_id);
+
+  INSERT INTO results SELECT * FROM results_flat;
+  DROP TABLE results_flat;
+
+  IF id_identity THEN
+    -- The identity sequence went with the old table
+    CREATE SEQUENCE results_id_seq OWNED BY results.id;
+    PERFORM setval('results_id_seq', COALESCE((SELECT MAX(id) FROM results), 0) + 1, false);
+    ALTER TABLE results ALTER COLUMN id SET DEFAULT nextval('results_id_seq');
+  ELSIF id_sequence IS NOT NULL THEN
+    EXECUTE format('ALTER SEQUENCE %s OWNED BY results.id', id_sequence);
+  END IF;
+END;
+$$;
+
+COMMIT;
+
+ANALYZE results;
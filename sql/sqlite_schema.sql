@@ -0,0 +1,225 @@
+-- Schema for the embedded SQLite backend (python/storage.py).
+-- Mirrors the Postgres tables the ingest and export scripts use, so a
+-- local file can stand in for the database. Booleans are stored as 0/1,
+-- dates as 'YYYY-MM-DD' text and timestamps as ISO text.
+CREATE TABLE IF NOT EXISTS players (
+  id INTEGER PRIMARY KEY,
+  first_name TEXT,
+  last_name TEXT,
+  last_key TEXT
+);
+
+-- See sql/alter_notable_qualifications.sql
+CREATE INDEX IF NOT EXISTS players_last_key_idx ON players (last_key);
+CREATE INDEX IF NOT EXISTS players_last_key_missing_idx ON players (id) WHERE last_key IS NULL;
+
+CREATE TRIGGER IF NOT EXISTS players_clear_last_key AFTER UPDATE OF last_name ON players
+WHEN NEW.last_name IS NOT OLD.last_name AND NEW.last_key IS OLD.last_key
+BEGIN
+  UPDATE players SET last_key = NULL WHERE id = NEW.id;
+END;
+
+CREATE TABLE IF NOT EXISTS events (
+  id INTEGER PRIMARY KEY,
+  name TEXT,
+  date TEXT,
+  format TEXT
+);
+
+CREATE TABLE IF NOT EXISTS results (
+  id INTEGER PRIMARY KEY,
+  player_id INTEGER REFERENCES players(id),
+  event_id INTEGER REFERENCES events(id),
+  day2 BOOLEAN,
+  top8 BOOLEAN,
+  limited_wins INTEGER,
+  limited_losses INTEGER,
+  limited_draws INTEGER,
+  num_drafts INTEGER,
+  positive_drafts INTEGER,
+  negative_drafts INTEGER,
+  trophy_drafts INTEGER,
+  no_win_drafts INTEGER,
+  constructed_wins INTEGER,
+  constructed_losses INTEGER,
+  constructed_draws INTEGER,
+  overall_wins INTEGER,
+  overall_losses INTEGER,
+  overall_draws INTEGER,
+  overall_record TEXT,
+  day1_wins INTEGER,
+  day1_losses INTEGER,
+  day1_draws INTEGER,
+  day2_wins INTEGER,
+  day2_losses INTEGER,
+  day2_draws INTEGER,
+  day3_wins INTEGER,
+  day3_losses INTEGER,
+  day3_draws INTEGER,
+  in_contention BOOLEAN,
+  win_streak INTEGER,
+  loss_streak INTEGER,
+  streak5 INTEGER,
+  finish INTEGER,
+  summary TEXT,
+  team TEXT,
+  deck TEXT,
+  notes TEXT
+);
+
+CREATE INDEX IF NOT EXISTS results_player_id_idx ON results (player_id);
+CREATE INDEX IF NOT EXISTS results_event_id_idx ON results (event_id);
+
+CREATE TABLE IF NOT EXISTS notable_qualifications (
+  id INTEGER PRIMARY KEY,
+  player_id INTEGER NOT NULL REFERENCES players(id),
+  event_id INTEGER NOT NULL REFERENCES events(id),
+  invitation_source TEXT
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS notable_qualifications_player_event_idx
+  ON notable_qualifications (player_id, event_id);
+
+CREATE TABLE IF NOT EXISTS player_aliases (
+  first_key TEXT NOT NULL,
+  last_key TEXT NOT NULL,
+  player_id INTEGER NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+  source TEXT,
+  created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (first_key, last_key)
+);
+
+CREATE INDEX IF NOT EXISTS player_aliases_player_id_idx ON player_aliases (player_id);
+
+CREATE TABLE IF NOT EXISTS ingest_checkpoints (
+  job TEXT PRIMARY KEY,
+  file_hash TEXT NOT NULL,
+  file_name TEXT NOT NULL,
+  last_row INTEGER NOT NULL DEFAULT 0,
+  rows_imported INTEGER NOT NULL DEFAULT 0,
+  rows_quarantined INTEGER NOT NULL DEFAULT 0,
+  completed_at TEXT,
+  updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS player_ratings (
+  player_id INTEGER PRIMARY KEY REFERENCES players(id) ON DELETE CASCADE,
+  rating REAL NOT NULL,
+  rd REAL NOT NULL,
+  events INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rated_events (
+  event_id INTEGER PRIMARY KEY,
+  position INTEGER NOT NULL UNIQUE,
+  results_hash TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rating_history (
+  event_id INTEGER NOT NULL REFERENCES rated_events(event_id) ON DELETE CASCADE,
+  player_id INTEGER NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+  rating REAL NOT NULL,
+  rd REAL NOT NULL,
+  events INTEGER NOT NULL,
+  PRIMARY KEY (event_id, player_id)
+);
+
+CREATE INDEX IF NOT EXISTS rating_history_player_id_idx ON rating_history (player_id);
+
+CREATE TABLE IF NOT EXISTS ingest_generations (
+  generation INTEGER PRIMARY KEY,
+  source TEXT NOT NULL,
+  committed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS results_event_versions (
+  event_id INTEGER PRIMARY KEY,
+  version INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS results_partition_cache (
+  partition_no INTEGER PRIMARY KEY,
+  signature TEXT NOT NULL,
+  refreshed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS results_partition_totals (
+  partition_no INTEGER NOT NULL REFERENCES results_partition_cache(partition_no) ON DELETE CASCADE,
+  player_id INTEGER NOT NULL,
+  events INTEGER NOT NULL DEFAULT 0,
+  day2s INTEGER NOT NULL DEFAULT 0,
+  in_contentions INTEGER NOT NULL DEFAULT 0,
+  top8s INTEGER NOT NULL DEFAULT 0,
+  overall_wins INTEGER NOT NULL DEFAULT 0,
+  overall_losses INTEGER NOT NULL DEFAULT 0,
+  overall_draws INTEGER NOT NULL DEFAULT 0,
+  limited_wins INTEGER NOT NULL DEFAULT 0,
+  limited_losses INTEGER NOT NULL DEFAULT 0,
+  limited_draws INTEGER NOT NULL DEFAULT 0,
+  constructed_wins INTEGER NOT NULL DEFAULT 0,
+  constructed_losses INTEGER NOT NULL DEFAULT 0,
+  constructed_draws INTEGER NOT NULL DEFAULT 0,
+  day1_wins INTEGER NOT NULL DEFAULT 0,
+  day1_losses INTEGER NOT NULL DEFAULT 0,
+  day1_draws INTEGER NOT NULL DEFAULT 0,
+  day2_wins INTEGER NOT NULL DEFAULT 0,
+  day2_losses INTEGER NOT NULL DEFAULT 0,
+  day2_draws INTEGER NOT NULL DEFAULT 0,
+  day3_wins INTEGER NOT NULL DEFAULT 0,
+  day3_losses INTEGER NOT NULL DEFAULT 0,
+  day3_draws INTEGER NOT NULL DEFAULT 0,
+  drafts INTEGER NOT NULL DEFAULT 0,
+  winning_drafts INTEGER NOT NULL DEFAULT 0,
+  losing_drafts INTEGER NOT NULL DEFAULT 0,
+  trophy_drafts INTEGER NOT NULL DEFAULT 0,
+  streaks_5 INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (partition_no, player_id)
+);
+
+CREATE TABLE IF NOT EXISTS player_cached_totals (
+  player_id INTEGER PRIMARY KEY,
+  events INTEGER NOT NULL DEFAULT 0,
+  day2s INTEGER NOT NULL DEFAULT 0,
+  in_contentions INTEGER NOT NULL DEFAULT 0,
+  top8s INTEGER NOT NULL DEFAULT 0,
+  overall_wins INTEGER NOT NULL DEFAULT 0,
+  overall_losses INTEGER NOT NULL DEFAULT 0,
+  overall_draws INTEGER NOT NULL DEFAULT 0,
+  limited_wins INTEGER NOT NULL DEFAULT 0,
+  limited_losses INTEGER NOT NULL DEFAULT 0,
+  limited_draws INTEGER NOT NULL DEFAULT 0,
+  constructed_wins INTEGER NOT NULL DEFAULT 0,
+  constructed_losses INTEGER NOT NULL DEFAULT 0,
+  constructed_draws INTEGER NOT NULL DEFAULT 0,
+  day1_wins INTEGER NOT NULL DEFAULT 0,
+  day1_losses INTEGER NOT NULL DEFAULT 0,
+  day1_draws INTEGER NOT NULL DEFAULT 0,
+  day2_wins INTEGER NOT NULL DEFAULT 0,
+  day2_losses INTEGER NOT NULL DEFAULT 0,
+  day2_draws INTEGER NOT NULL DEFAULT 0,
+  day3_wins INTEGER NOT NULL DEFAULT 0,
+  day3_losses INTEGER NOT NULL DEFAULT 0,
+  day3_draws INTEGER NOT NULL DEFAULT 0,
+  drafts INTEGER NOT NULL DEFAULT 0,
+  winning_drafts INTEGER NOT NULL DEFAULT 0,
+  losing_drafts INTEGER NOT NULL DEFAULT 0,
+  trophy_drafts INTEGER NOT NULL DEFAULT 0,
+  streaks_5 INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS results_event_version_insert AFTER INSERT ON results BEGIN
+  INSERT INTO results_event_versions (event_id) VALUES (COALESCE(NEW.event_id, 0))
+  ON CONFLICT (event_id) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS results_event_version_update AFTER UPDATE ON results BEGIN
+  INSERT INTO results_event_versions (event_id) VALUES (COALESCE(OLD.event_id, 0))
+  ON CONFLICT (event_id) DO UPDATE SET version = version + 1;
+  INSERT INTO results_event_versions (event_id) VALUES (COALESCE(NEW.event_id, 0))
+  ON CONFLICT (event_id) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS results_event_version_delete AFTER DELETE ON results BEGIN
+  INSERT INTO results_event_versions (event_id) VALUES (COALESCE(OLD.event_id, 0))
+  ON CONFLICT (event_id) DO UPDATE SET version = version + 1;
+END;
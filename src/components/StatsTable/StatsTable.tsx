@@ -38,6 +38,13 @@ const StatsTable: React.FC<StatsTableProps> = ({
     return `${Number(value).toFixed(1)}%`;
   };
 
+  // Helper to format the rating to 1 decimal place (unrated players show '-')
+  const formatRating = (statPath: string) => {
+    const value = getStatValue(statPath);
+    if (value === '-') return '-';
+    return Number(value).toFixed(1);
+  };
+
   // Helper to get rank for a stat by calculating from filtered player pool
   const getRank = (statKey: string): number | null => {
     if (!selectedPlayer) return null;
@@ -169,6 +176,16 @@ const StatsTable: React.FC<StatsTableProps> = ({
                 selectedStat={selectedStat}
                 onStatSelect={onStatSelect}
               />
+              <StatRow
+                stat1={{
+                  label: 'Rating',
+                  value: formatRating('rating'),
+                  key: 'rating',
+                  rank: getRank('rating'),
+                }}
+                selectedStat={selectedStat}
+                onStatSelect={onStatSelect}
+              />
             </tbody>
           </table>
         </div>
@@ -41,6 +41,25 @@ export const applyFilters = (
       return false;
     }
 
+    // Format and date filters from the exported filter keys: O(1) per player
+    const keys = player.data.filter_keys;
+    if (keys) {
+      if (
+        filters.formats &&
+        filters.formats.length > 0 &&
+        !filters.formats.some((format) => (keys.format_counts[format] ?? 0) > 0)
+      ) {
+        return false;
+      }
+      if (filters.startDate && !(keys.last_date !== null && keys.last_date >= filters.startDate)) {
+        return false;
+      }
+      if (filters.endDate && !(keys.first_date !== null && keys.first_date <= filters.endDate)) {
+        return false;
+      }
+      return true;
+    }
+
     // Format filter - check if player has played any events in the specified formats
     if (filters.formats && filters.formats.length > 0) {
       const playerFormats = Object.values(player.data.events).map((event) => event.format);
@@ -175,6 +194,7 @@ export const getRankableStats = (): string[] => {
     'winning_drafts_pct',
     'trophy_drafts',
     '5streaks',
+    'rating',
   ];
 };
 
@@ -46,6 +46,7 @@ export interface PlayerStats {
   winning_drafts_pct: StatValue;
   trophy_drafts: StatValue;
   '5streaks': StatValue;
+  rating?: StatValue;
   overall_record: StatValue;
   limited_record: StatValue;
   constructed_record: StatValue;
@@ -59,6 +60,7 @@ export interface Event {
   format: string;
   deck?: string;
   notes?: string;
+  team?: string;
   record?: string;
   finish?: number;
   summary?: string;
@@ -93,10 +95,18 @@ export interface Event {
   streak5?: number;
 }
 
+// Per-player summary of the exported events for the format and date filters
+export interface FilterKeys {
+  first_date: string | null;
+  last_date: string | null;
+  format_counts: { [format: string]: number };
+}
+
 export interface PlayerData {
   player_info: PlayerInfo;
   stats: PlayerStats;
   events: { [key: string]: Event };
+  filter_keys?: FilterKeys;
 }
 
 export interface Player {
@@ -125,6 +135,7 @@ export interface AllEvent {
 export interface PlayerDataStructure {
   players: { [key: string]: PlayerData };
   events: { [key: string]: AllEvent };
+  formats?: string[];
   // top_10 field removed - will be calculated dynamically
 }
 
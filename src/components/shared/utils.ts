@@ -104,6 +104,7 @@ export const getStatDisplayName = (statKey: string): string => {
     winning_drafts_pct: 'Winning Drafts %',
     trophy_drafts: 'Trophy Drafts',
     '5streaks': '5+ Win Streaks',
+    rating: 'Rating',
     overall_record: 'Overall Record',
     limited_record: 'Limited Record',
     constructed_record: 'Constructed Record',